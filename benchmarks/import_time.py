@@ -0,0 +1,33 @@
+"""
+Import-time benchmarks.
+
+Each benchmark runs a fresh interpreter, so this is measured
+separately from ``micro.py`` (which has already imported everything).
+Run it with ``PYTHONPATH=src`` to measure the working tree.
+"""
+import sys
+
+import pyperf
+
+
+runner = pyperf.Runner()
+
+runner.bench_command(
+    'python startup (baseline)',
+    [sys.executable, '-c', 'pass'],
+)
+
+runner.bench_command(
+    'import zope.interface',
+    [sys.executable, '-c', 'import zope.interface'],
+)
+
+runner.bench_command(
+    'import zope.interface.interfaces',
+    [sys.executable, '-c', 'import zope.interface.interfaces'],
+)
+
+runner.bench_command(
+    'import zope.interface.registry',
+    [sys.executable, '-c', 'import zope.interface.registry'],
+)
@@ -1,8 +1,12 @@
 import pyperf
 
+from zope.interface import Attribute
 from zope.interface import Interface
 from zope.interface import classImplements
 from zope.interface import implementedBy
+from zope.interface import providedBy
+from zope.interface.adapter import AdapterRegistry
+from zope.interface.declarations import Declaration
 from zope.interface.interface import InterfaceClass
 from zope.interface.registry import Components
 
@@ -120,6 +124,32 @@ def bench_query_adapter(loops, components, objs=providers):
     return pyperf.perf_counter() - t0
 
 
+def bench_query_multi_adapter(loops, components, objs=providers[:10]):
+    components_queryMultiAdapter = components.queryMultiAdapter
+    pairs = [(first, second) for first in objs for second in objs]
+    # One time through to prime the caches
+    for pair in pairs:
+        components_queryMultiAdapter(pair, Interface)
+
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        for pair in pairs:
+            components_queryMultiAdapter(pair, Interface)
+    return pyperf.perf_counter() - t0
+
+
+def bench_query_utility(loops, components):
+    components_queryUtility = components.queryUtility
+    for iface in ifaces:
+        components_queryUtility(iface)
+
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        for iface in ifaces:
+            components_queryUtility(iface)
+    return pyperf.perf_counter() - t0
+
+
 def bench_getattr(loops, name, get=getattr):
     t0 = pyperf.perf_counter()
     for _ in range(loops):
@@ -199,6 +229,210 @@ def bench_iface_call_no_conform_provided_deep(loops):
     return _bench_iface_call_simple(loops, DeepestInheritance())
 
 
+class SuperBase:
+    pass
+
+
+classImplements(SuperBase, ifaces[0])
+
+
+class SuperDerived(SuperBase):
+    pass
+
+
+classImplements(SuperDerived, ifaces[1])
+
+
+def bench_providedBy_super(loops):
+    inst = SuperDerived()
+    sup = super(SuperDerived, inst)
+    providedBy(sup)  # Prime the cache
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        for _ in range(INNER):
+            providedBy(sup)
+            providedBy(super(SuperDerived, inst))
+    return pyperf.perf_counter() - t0
+
+
+CREATE_COUNT = 10000
+
+
+def _method_no_args():
+    "A method."
+
+
+def _method_args(a, b=1, *args, **kwargs):
+    "A method with arguments."
+
+
+def bench_create_interfaces(loops):
+    # A tree of interfaces, every third of which also extends a
+    # mixin, each with a few methods and attributes.
+    mixins = [
+        InterfaceClass('IMixin%d' % i, (Interface,), {})
+        for i in range(20)
+    ]
+    duration = 0
+    for _ in range(loops):
+        created = [InterfaceClass('IRoot', (Interface,), {})]
+        t0 = pyperf.perf_counter()
+        for i in range(CREATE_COUNT):
+            bases = (created[i // 2],)
+            if i % 3 == 0:
+                bases += (mixins[i % 20],)
+            created.append(InterfaceClass('I%d' % i, bases, {
+                '__module__': __name__,
+                '__doc__': 'An interface.',
+                'method': _method_no_args,
+                'method_args': _method_args,
+                'attribute': Attribute('An attribute.'),
+            }))
+        duration += pyperf.perf_counter() - t0
+    return duration
+
+
+SUBSCRIBE_COUNT = 10000
+UNHASHABLE_COUNT = 3000
+COLD_SPEC_COUNT = 2000
+
+
+def make_handler():
+    def handler(event):
+        "A handler."
+    return handler
+
+
+def bench_subscribe_handlers(loops):
+    # Many handlers for the same event type, registered and then
+    # unregistered in the same order.
+    handlers = [make_handler() for _ in range(SUBSCRIBE_COUNT)]
+    duration = 0
+    for _ in range(loops):
+        registry = AdapterRegistry()
+        t0 = pyperf.perf_counter()
+        for handler in handlers:
+            registry.subscribe((ifaces[0],), None, handler)
+        for handler in handlers:
+            registry.unsubscribe((ifaces[0],), None, handler)
+        duration += pyperf.perf_counter() - t0
+    return duration
+
+
+def bench_registry_lookup1(loops, registry):
+    # Cached hits, so mostly the cost of calling the method.
+    registry_lookup1 = registry.lookup1
+    spec = implementedBy(implementers[0])
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        for _ in range(INNER):
+            registry_lookup1(spec, Interface)
+    return pyperf.perf_counter() - t0
+
+
+def bench_registry_query_adapter(loops, registry):
+    registry_queryAdapter = registry.queryAdapter
+    provider = providers[0]
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        for _ in range(INNER):
+            registry_queryAdapter(provider, Interface)
+    return pyperf.perf_counter() - t0
+
+
+def bench_registry_query_adapter_kw(loops, registry):
+    registry_queryAdapter = registry.queryAdapter
+    provider = providers[0]
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        for _ in range(INNER):
+            registry_queryAdapter(provider, Interface, name='', default=None)
+    return pyperf.perf_counter() - t0
+
+
+def bench_registry_adapter_hook(loops, registry):
+    registry_adapter_hook = registry.adapter_hook
+    provider = providers[0]
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        for _ in range(INNER):
+            registry_adapter_hook(Interface, provider)
+    return pyperf.perf_counter() - t0
+
+
+def populate_one_adapter():
+    def factory(context):
+        return context
+
+    registry = AdapterRegistry()
+    registry.register((ifaces[0],), Interface, '', factory)
+    return registry
+
+
+def bench_lookup_deep_bases(loops, registry):
+    # Uncached lookups through a chain of registries that mostly have
+    # nothing registered themselves.
+    specs = [implementedBy(p) for p in implementers]
+    registry_changed = registry.changed
+    registry_lookup = registry.lookup
+    registry_lookupAll = registry.lookupAll
+
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        registry_changed(registry)
+        for spec in specs:
+            for iface in ifaces:
+                registry_lookup((spec,), iface)
+                registry_lookupAll((spec,), iface)
+    return pyperf.perf_counter() - t0
+
+
+def populate_deep_bases(depth=8):
+    registry = AdapterRegistry()
+    for iface in ifaces:
+        for other_iface in ifaces:
+            registry.register((iface,), other_iface, '', 42)
+    for _ in range(depth - 1):
+        registry = AdapterRegistry((registry,))
+    return registry
+
+
+def bench_lookup_cold_specs(loops, registry):
+    # Cache misses for many distinct required specifications, each
+    # seen for the first time since the registry last changed.
+    specs = [
+        Declaration(ifaces[i % len(ifaces)])
+        for i in range(COLD_SPEC_COUNT)
+    ]
+    registry_changed = registry.changed
+    registry_lookup = registry.lookup
+    provided = ifaces[0]
+
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        registry_changed(registry)
+        for spec in specs:
+            registry_lookup((spec,), provided)
+    return pyperf.perf_counter() - t0
+
+
+def bench_register_unhashable_utilities(loops):
+    # Many unhashable (but unequal) utilities providing the same
+    # interface, registered and then unregistered in the same order.
+    utilities = [{'utility': i} for i in range(UNHASHABLE_COUNT)]
+    names = [str(i) for i in range(UNHASHABLE_COUNT)]
+    duration = 0
+    for _ in range(loops):
+        components = Components()
+        t0 = pyperf.perf_counter()
+        for utility, name in zip(utilities, names):
+            components.registerUtility(utility, ifaces[0], name, event=False)
+        for utility, name in zip(utilities, names):
+            components.unregisterUtility(utility, ifaces[0], name)
+        duration += pyperf.perf_counter() - t0
+    return duration
+
+
 runner = pyperf.Runner()
 
 runner.bench_time_func(
@@ -309,6 +543,72 @@ runner.bench_time_func(
     inner_loops=1
 )
 
+
+runner.bench_time_func(
+    'registry lookup1 (cached)',
+    bench_registry_lookup1,
+    populate_one_adapter(),
+    inner_loops=INNER
+)
+
+runner.bench_time_func(
+    'registry queryAdapter (cached)',
+    bench_registry_query_adapter,
+    populate_one_adapter(),
+    inner_loops=INNER
+)
+
+runner.bench_time_func(
+    'registry queryAdapter (cached, keyword arguments)',
+    bench_registry_query_adapter_kw,
+    populate_one_adapter(),
+    inner_loops=INNER
+)
+
+runner.bench_time_func(
+    'registry adapter_hook (cached)',
+    bench_registry_adapter_hook,
+    populate_one_adapter(),
+    inner_loops=INNER
+)
+
+
+def populate_multi_adapters():
+    def factory(first, second):
+        return 42
+
+    pop_components = Components()
+    for iface in ifaces[:10]:
+        for other_iface in ifaces[:10]:
+            pop_components.registerAdapter(
+                factory, (iface, other_iface), Interface, event=False)
+
+    return pop_components
+
+
+runner.bench_time_func(
+    'query multi-adapter (2 objects)',
+    bench_query_multi_adapter,
+    populate_multi_adapters(),
+    inner_loops=100
+)
+
+
+def populate_utilities():
+    pop_components = Components()
+    for iface in ifaces:
+        pop_components.registerUtility(object(), iface, event=False)
+
+    return Components(bases=(pop_components,))
+
+
+runner.bench_time_func(
+    'query utility (registered in base)',
+    bench_query_utility,
+    populate_utilities(),
+    inner_loops=len(ifaces)
+)
+
 runner.bench_time_func(
     'sort interfaces',
     bench_sort,
@@ -364,3 +664,41 @@ runner.bench_time_func(
     [implementedBy(p) for p in implementers],
     inner_loops=INNER
 )
+
+runner.bench_time_func(
+    'providedBy (super)',
+    bench_providedBy_super,
+    inner_loops=INNER * 2
+)
+
+runner.bench_time_func(
+    'create interfaces',
+    bench_create_interfaces,
+    inner_loops=CREATE_COUNT
+)
+
+runner.bench_time_func(
+    'uncached lookup (8 registries deep)',
+    bench_lookup_deep_bases,
+    populate_deep_bases(),
+    inner_loops=len(implementers) * len(ifaces)
+)
+
+runner.bench_time_func(
+    'uncached lookup (2000 specifications)',
+    bench_lookup_cold_specs,
+    populate_deep_bases(depth=1),
+    inner_loops=COLD_SPEC_COUNT
+)
+
+runner.bench_time_func(
+    'subscribe and unsubscribe handlers',
+    bench_subscribe_handlers,
+    inner_loops=SUBSCRIBE_COUNT
+)
+
+runner.bench_time_func(
+    'register and unregister unhashable utilities',
+    bench_register_unhashable_utilities,
+    inner_loops=UNHASHABLE_COUNT
+)
@@ -117,18 +117,26 @@ static PyObject *str__name__ = NULL;
 static PyObject *str__providedBy__ = NULL;
 static PyObject *str__provides__ = NULL;
 static PyObject *str__self__ = NULL;
+static PyObject *str__self_class__ = NULL;
+static PyObject *str__thisclass__ = NULL;
+static PyObject *str_super_cache = NULL;
 static PyObject *str_generation = NULL;
 static PyObject *str_registry = NULL;
 static PyObject *strro = NULL;
 
 /* Static strings, used to invoke PyObject_CallMethodObjArgs */
 static PyObject *str_call_conform = NULL;
+static PyObject *str_calculate_interfaces = NULL;
+static PyObject *str_calculate_attrs = NULL;
 static PyObject *str_uncached_lookup = NULL;
 static PyObject *str_uncached_lookupAll = NULL;
 static PyObject *str_uncached_subscriptions = NULL;
+static PyObject *str_specs_changed_since = NULL;
 static PyObject *strchanged = NULL;
+static PyObject *strlookup = NULL;
 static PyObject *str__adapt__ = NULL;
 static PyObject *str_CALL_CUSTOM_ADAPT = NULL;
+static PyObject *strisOrExtends = NULL;
 
 /* Static strings, used to invoke PyObject_GetItem
  *
@@ -157,22 +165,39 @@ define_static_strings()
     DEFINE_STATIC_STRING(__providedBy__);
     DEFINE_STATIC_STRING(__provides__);
     DEFINE_STATIC_STRING(__self__);
+    DEFINE_STATIC_STRING(__self_class__);
+    DEFINE_STATIC_STRING(__thisclass__);
+    DEFINE_STATIC_STRING(_super_cache);
     DEFINE_STATIC_STRING(_generation);
     DEFINE_STATIC_STRING(_registry);
     DEFINE_STATIC_STRING(ro);
     DEFINE_STATIC_STRING(__implemented__);
     DEFINE_STATIC_STRING(_call_conform);
+    DEFINE_STATIC_STRING(_calculate_interfaces);
+    DEFINE_STATIC_STRING(_calculate_attrs);
     DEFINE_STATIC_STRING(_uncached_lookup);
     DEFINE_STATIC_STRING(_uncached_lookupAll);
     DEFINE_STATIC_STRING(_uncached_subscriptions);
+    DEFINE_STATIC_STRING(_specs_changed_since);
     DEFINE_STATIC_STRING(changed);
+    DEFINE_STATIC_STRING(lookup);
     DEFINE_STATIC_STRING(__adapt__);
     DEFINE_STATIC_STRING(_CALL_CUSTOM_ADAPT);
+    DEFINE_STATIC_STRING(isOrExtends);
 #undef DEFINE_STATIC_STRING
 
     return 0;
 }
 
+/*
+ * Incremented (by ``Specification.changed``) whenever an existing
+ * specification changes; lookups compare against it to notice that
+ * the specifications their caches are keyed by may have changed. Like
+ * the static strings, it's shared by every instance of this module,
+ * which can only cause extra checks.
+ */
+static Py_ssize_t spec_epoch = 0;
+
 /* Public module-scope functions, forward-declared here for type methods. */
 static PyObject *implementedBy(PyObject* module, PyObject *cls);
 static PyObject *getObjectSpecification(PyObject *module, PyObject *ob);
@@ -185,6 +210,7 @@ static PyObject* _get_module(PyTypeObject *typeobj);
 static PyObject* _get_adapter_hooks(PyTypeObject *typeobj);
 static PyTypeObject* _get_specification_base_class(PyTypeObject *typeobj);
 static PyTypeObject* _get_interface_base_class(PyTypeObject *typeobj);
+static PyTypeObject* _get_adapter_hook_class(PyTypeObject *typeobj);
 
 #if USE_STATIC_TYPES
 /*
@@ -269,8 +295,31 @@ typedef struct
     PyObject* _v_attrs;
     PyObject* __iro__;
     PyObject* __sro__;
+    /* The cached interfacesTuple; computed by Python. */
+    PyObject* _v_interfaces;
+    /* The map of all attribute names used by get; computed by Python. */
+    PyObject* _v_all_attrs;
+    /* The spec epoch when we last changed; set by Python. */
+    Py_ssize_t _generation;
 } SB;
 
+/*
+  AdapterHook; declared here so that IB.__adapt__ can dispatch to it
+  directly.
+*/
+typedef struct
+{
+    PyObject_HEAD
+    PyObject* hook;
+    PyObject* provided;
+    /* Statistics only: not updated atomically on free-threaded builds. */
+    Py_ssize_t calls;
+    Py_ssize_t hits;
+    Py_ssize_t skips;
+} AH;
+
+static PyObject* AH_dispatch(AH* self, PyObject* iface, PyObject* obj);
+
 /*
   We know what the fields are *supposed* to define, but
   they could have anything, so we need to traverse them.
@@ -291,6 +340,8 @@ SB_traverse(SB* self, visitproc visit, void* arg)
     Py_VISIT(self->_v_attrs);
     Py_VISIT(self->__iro__);
     Py_VISIT(self->__sro__);
+    Py_VISIT(self->_v_interfaces);
+    Py_VISIT(self->_v_all_attrs);
     return 0;
 }
 
@@ -303,6 +354,8 @@ SB_clear(SB* self)
     Py_CLEAR(self->_v_attrs);
     Py_CLEAR(self->__iro__);
     Py_CLEAR(self->__sro__);
+    Py_CLEAR(self->_v_interfaces);
+    Py_CLEAR(self->_v_all_attrs);
     return 0;
 }
 
@@ -405,6 +458,175 @@ SB_implementedBy(PyObject* self, PyObject* cls)
     return item;
 }
 
+static char SB_filterIsOrExtends__doc__[] =
+  "Return a tuple of the given interfaces that the specification "
+  "is or extends";
+
+/*
+    def filterIsOrExtends(self, interfaces):
+        implied = self._implied
+        return tuple([iface for iface in interfaces if iface in implied])
+*/
+static PyObject*
+SB_filterIsOrExtends(SB* self, PyObject* interfaces)
+{
+    PyObject *iter, *item, *implied, *result, *tuple;
+    int contains;
+
+    if (self->_implied == NULL || !PyDict_Check(self->_implied)) {
+        PyErr_SetString(PyExc_TypeError, "_implied must be a dict");
+        return NULL;
+    }
+
+    iter = PyObject_GetIter(interfaces);
+    if (iter == NULL)
+        return NULL;
+
+    result = PyList_New(0);
+    if (result == NULL) {
+        Py_DECREF(iter);
+        return NULL;
+    }
+
+    /* Keep our own reference in case _implied is replaced while we
+       iterate. */
+    implied = self->_implied;
+    Py_INCREF(implied);
+
+    while ((item = PyIter_Next(iter)) != NULL) {
+        contains = PyDict_Contains(implied, item);
+        if (contains > 0)
+            contains = PyList_Append(result, item);
+        Py_DECREF(item);
+        if (contains < 0)
+            break;
+    }
+    Py_DECREF(implied);
+    Py_DECREF(iter);
+
+    if (PyErr_Occurred()) {
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    tuple = PyList_AsTuple(result);
+    Py_DECREF(result);
+    return tuple;
+}
+
+static PyObject*
+SB_interfacesTuple(SB* self, void* closure)
+{
+    if (self->_v_interfaces != NULL && PyTuple_Check(self->_v_interfaces)) {
+        Py_INCREF(self->_v_interfaces);
+        return self->_v_interfaces;
+    }
+    return PyObject_CallMethodObjArgs(
+      OBJECT(self), str_calculate_interfaces, NULL);
+}
+
+static char SB_interfaces__doc__[] =
+  "Return an iterator for the interfaces in the specification";
+
+static PyObject*
+SB_interfaces(SB* self, PyObject* ignored)
+{
+    PyObject *interfaces, *result;
+
+    interfaces = SB_interfacesTuple(self, NULL);
+    if (interfaces == NULL)
+        return NULL;
+    result = PyObject_GetIter(interfaces);
+    Py_DECREF(interfaces);
+    return result;
+}
+
+static char SB_get__doc__[] = "Query for an attribute description";
+
+static PyObject*
+SB_get(SB* self, PyObject* args, PyObject* kwargs)
+{
+    static char* kwlist[] = { "name", "default", NULL };
+    PyObject *name, *attrs, *all_attrs, *attr;
+    PyObject *default_ = Py_None;
+    int found;
+
+    if (!PyArg_ParseTupleAndKeywords(
+          args, kwargs, "O|O:get", kwlist, &name, &default_))
+        return NULL;
+
+    /* Names are cached one at a time in _v_attrs, which other code may
+       also fill in. */
+    if (self->_v_attrs == NULL || self->_v_attrs == Py_None) {
+        attrs = PyDict_New();
+        if (attrs == NULL)
+            return NULL;
+        Py_XSETREF(self->_v_attrs, attrs);
+    }
+    attrs = self->_v_attrs;
+    Py_INCREF(attrs);
+
+    /* Use PyDict_GetItemRef() for a strong reference.  See _lookup(). */
+    if (PyDict_Check(attrs)) {
+        found = PyDict_GetItemRef(attrs, name, &attr);
+    } else {
+        attr = PyObject_GetItem(attrs, name);
+        found = attr != NULL;
+        if (!found) {
+            if (PyErr_ExceptionMatches(PyExc_KeyError))
+                PyErr_Clear();
+            else
+                found = -1;
+        }
+    }
+    if (found < 0) {
+        Py_DECREF(attrs);
+        return NULL;
+    }
+    if (found && attr != Py_None) {
+        Py_DECREF(attrs);
+        return attr;
+    }
+    Py_XDECREF(attr);
+
+    /* Otherwise, look in the map of all the names. */
+    if (self->_v_all_attrs != NULL && PyDict_CheckExact(self->_v_all_attrs)) {
+        all_attrs = self->_v_all_attrs;
+        Py_INCREF(all_attrs);
+    } else {
+        all_attrs = PyObject_CallMethodObjArgs(
+          OBJECT(self), str_calculate_attrs, NULL);
+        if (all_attrs == NULL) {
+            Py_DECREF(attrs);
+            return NULL;
+        }
+        if (!PyDict_Check(all_attrs)) {
+            PyErr_SetString(PyExc_TypeError,
+                            "_calculate_attrs must return a dict");
+            Py_DECREF(all_attrs);
+            Py_DECREF(attrs);
+            return NULL;
+        }
+    }
+
+    found = PyDict_GetItemRef(all_attrs, name, &attr);
+    Py_DECREF(all_attrs);
+    if (found > 0 && attr != Py_None &&
+        PyObject_SetItem(attrs, name, attr) < 0) {
+        Py_CLEAR(attr);
+        found = -1;
+    }
+    Py_DECREF(attrs);
+    if (found < 0)
+        return NULL;
+    if (found == 0 || attr == Py_None) {
+        Py_XDECREF(attr);
+        Py_INCREF(default_);
+        return default_;
+    }
+    return attr;
+}
+
 static struct PyMethodDef SB_methods[] = {
     { "providedBy",
       (PyCFunction)SB_providedBy,
@@ -418,6 +640,18 @@ static struct PyMethodDef SB_methods[] = {
       (PyCFunction)SB_extends,
       METH_O,
       SB_extends__doc__ },
+    { "filterIsOrExtends",
+      (PyCFunction)SB_filterIsOrExtends,
+      METH_O,
+      SB_filterIsOrExtends__doc__ },
+    { "interfaces",
+      (PyCFunction)SB_interfaces,
+      METH_NOARGS,
+      SB_interfaces__doc__ },
+    { "get",
+      (PyCFunction)SB_get,
+      METH_KEYWORDS | METH_VARARGS,
+      SB_get__doc__ },
 
     { NULL, NULL } /* sentinel */
 };
@@ -429,12 +663,24 @@ static PyMemberDef SB_members[] = {
     { "_v_attrs", T_OBJECT_EX, offsetof(SB, _v_attrs), 0, "" },
     { "__iro__", T_OBJECT_EX, offsetof(SB, __iro__), 0, "" },
     { "__sro__", T_OBJECT_EX, offsetof(SB, __sro__), 0, "" },
+    { "_v_interfaces", T_OBJECT_EX, offsetof(SB, _v_interfaces), 0, "" },
+    { "_v_all_attrs", T_OBJECT_EX, offsetof(SB, _v_all_attrs), 0, "" },
+    { "_generation", T_PYSSIZET, offsetof(SB, _generation), 0, "" },
 #if USE_EXPLICIT_WEAKREFLIST
     { "__weaklistoffset__", T_PYSSIZET, offsetof(SB, weakreflist), READONLY, "" },
 #endif
     { NULL },
 };
 
+static PyGetSetDef SB_getset[] = {
+    { "interfacesTuple",
+      (getter)SB_interfacesTuple,
+      NULL,
+      "A tuple of the interfaces in the specification",
+      NULL },
+    { NULL }
+};
+
 static char SB__name__[] = "_zope_interface_coptimizations.SpecificationBase";
 static char SB__doc__[] = "Base type for Specification objects";
 
@@ -459,6 +705,7 @@ static PyTypeObject SB_type_def = {
 #endif
     .tp_methods        = SB_methods,
     .tp_members        = SB_members,
+    .tp_getset         = SB_getset,
 };
 
 #else
@@ -474,6 +721,7 @@ static PyType_Slot SB_type_slots[] = {
     {Py_tp_dealloc,     SB_dealloc},
     {Py_tp_methods,     SB_methods},
     {Py_tp_members,     SB_members},
+    {Py_tp_getset,      SB_getset},
     {0,                 NULL}
 };
 
@@ -701,8 +949,14 @@ typedef struct
     PyObject* __name__;
     PyObject* __module__;
     Py_hash_t _v_cached_hash;
+    vectorcallfunc vectorcall;
 } IB;
 
+static PyObject* IB_vectorcall(PyObject* self,
+                               PyObject* const* args,
+                               size_t nargsf,
+                               PyObject* kwnames);
+
 static int
 IB_traverse(IB* self, visitproc visit, void* arg)
 {
@@ -727,6 +981,23 @@ IB_dealloc(IB* self)
     SB_dealloc((SB*)self); /* handles decrefing tp */
 }
 
+/*
+ * Return a new reference to *ob*, or None if it's NULL. The names and
+ * modules of interfaces are their identity; strings are interned, so
+ * that equal ones are identical and comparing them is cheap. See
+ * _IB_key_eq().
+ */
+static PyObject*
+_IB_intern(PyObject* ob)
+{
+    if (ob == NULL)
+        ob = Py_None;
+    Py_INCREF(ob);
+    if (PyUnicode_CheckExact(ob))
+        PyUnicode_InternInPlace(&ob);
+    return ob;
+}
+
 static int
 IB__init__(IB* self, PyObject* args, PyObject* kwargs)
 {
@@ -739,10 +1010,9 @@ IB__init__(IB* self, PyObject* args, PyObject* kwargs)
         return -1;
     }
     IB_clear(self);
-    self->__module__ = module ? module : Py_None;
-    Py_INCREF(self->__module__);
-    self->__name__ = name ? name : Py_None;
-    Py_INCREF(self->__name__);
+    self->__module__ = _IB_intern(module);
+    self->__name__ = _IB_intern(name);
+    self->vectorcall = IB_vectorcall;
     return 0;
 }
 
@@ -766,14 +1036,14 @@ static PyObject*
 IB__adapt__(PyObject* self, PyObject* obj)
 {
     PyObject *decl;
-    PyObject *args;
+    PyObject *hook;
     PyObject *adapter;
     PyObject *module;
     PyObject *adapter_hooks;
     PyTypeObject *specification_base_class;
+    PyTypeObject *adapter_hook_class;
     int implements;
-    int i;
-    int l;
+    Py_ssize_t i;
 
     module = _get_module(Py_TYPE(self));
 
@@ -812,32 +1082,115 @@ IB__adapt__(PyObject* self, PyObject* obj)
         return obj;
     }
 
-    args = PyTuple_New(2);
-    if (args == NULL) { return NULL; }
-
-    Py_INCREF(self);
-    PyTuple_SET_ITEM(args, 0, self);
-
-    Py_INCREF(obj);
-    PyTuple_SET_ITEM(args, 1, obj);
-
     adapter_hooks = _get_adapter_hooks(Py_TYPE(self));
-    l = PyList_GET_SIZE(adapter_hooks);
-    for (i = 0; i < l; i++) {
-        adapter = PyObject_CallObject(PyList_GET_ITEM(adapter_hooks, i), args);
+    adapter_hook_class = _get_adapter_hook_class(Py_TYPE(self));
+    /* A hook may change the list, so don't keep its size or borrow
+     * its items across calls. */
+    for (i = 0; i < PyList_GET_SIZE(adapter_hooks); i++) {
+        hook = PyList_GET_ITEM(adapter_hooks, i);
+        Py_INCREF(hook);
+        if (Py_TYPE(hook) == adapter_hook_class) {
+            /* Filter without going through AdapterHook.__call__ */
+            adapter = AH_dispatch((AH*)hook, self, obj);
+        } else {
+            adapter = PyObject_CallFunctionObjArgs(hook, self, obj, NULL);
+        }
+        Py_DECREF(hook);
         if (adapter == NULL || adapter != Py_None) {
-            Py_DECREF(args);
             return adapter;
         }
         Py_DECREF(adapter);
     }
 
-    Py_DECREF(args);
-
     Py_INCREF(Py_None);
     return Py_None;
 }
 
+/* The most arguments _parse_args() accepts. */
+#define MAX_PARSED_ARGS 4
+
+/*
+ * Parse the arguments of a METH_FASTCALL | METH_KEYWORDS method or of a
+ * vectorcall, like PyArg_ParseTupleAndKeywords() with a format of only
+ * "O" arguments, the first 'required' of them mandatory: the remaining
+ * arguments are pointers to borrowed references to fill in, one for each
+ * name in 'kwlist'. Those not given are left alone.
+ */
+static int
+_parse_args(const char* fname,
+            const char* const* kwlist,
+            Py_ssize_t required,
+            PyObject* const* args,
+            Py_ssize_t nargs,
+            PyObject* kwnames,
+            ...)
+{
+    PyObject* found[MAX_PARSED_ARGS] = { NULL };
+    Py_ssize_t nparams, nkwargs, i, j;
+    va_list outputs;
+
+    for (nparams = 0; kwlist[nparams] != NULL; nparams++)
+        ;
+    assert(nparams <= MAX_PARSED_ARGS);
+
+    if (nargs > nparams) {
+        PyErr_Format(PyExc_TypeError,
+                     "%s() takes at most %zd arguments (%zd given)",
+                     fname,
+                     nparams,
+                     nargs);
+        return -1;
+    }
+    for (i = 0; i < nargs; i++)
+        found[i] = args[i];
+
+    nkwargs = kwnames == NULL ? 0 : PyTuple_GET_SIZE(kwnames);
+    for (j = 0; j < nkwargs; j++) {
+        PyObject* kwname = PyTuple_GET_ITEM(kwnames, j);
+        for (i = 0; i < nparams; i++) {
+            if (PyUnicode_CompareWithASCIIString(kwname, kwlist[i]) == 0)
+                break;
+        }
+        if (i == nparams) {
+            PyErr_Format(PyExc_TypeError,
+                         "'%U' is an invalid keyword argument for %s()",
+                         kwname,
+                         fname);
+            return -1;
+        }
+        if (found[i] != NULL) {
+            PyErr_Format(PyExc_TypeError,
+                         "argument for %s() given by name ('%s') "
+                         "and position (%zd)",
+                         fname,
+                         kwlist[i],
+                         i + 1);
+            return -1;
+        }
+        found[i] = args[nargs + j];
+    }
+
+    for (i = 0; i < required; i++) {
+        if (found[i] == NULL) {
+            PyErr_Format(PyExc_TypeError,
+                         "%s() missing required argument '%s' (pos %zd)",
+                         fname,
+                         kwlist[i],
+                         i + 1);
+            return -1;
+        }
+    }
+
+    va_start(outputs, kwnames);
+    for (i = 0; i < nparams; i++) {
+        PyObject** output = va_arg(outputs, PyObject**);
+        if (found[i] != NULL)
+            *output = found[i];
+    }
+    va_end(outputs);
+    return 0;
+}
+
 /*
     def __call__(self, obj, alternate=_marker):
         try:
@@ -860,15 +1213,9 @@ IB__adapt__(PyObject* self, PyObject* obj)
 
 */
 static PyObject*
-IB__call__(PyObject* self, PyObject* args, PyObject* kwargs)
+_IB_call(PyObject* self, PyObject* obj, PyObject* alternate)
 {
-    PyObject *conform, *obj, *alternate, *adapter;
-    static char* kwlist[] = { "obj", "alternate", NULL };
-    conform = obj = alternate = adapter = NULL;
-
-    if (!PyArg_ParseTupleAndKeywords(
-          args, kwargs, "O|O", kwlist, &obj, &alternate))
-        return NULL;
+    PyObject *conform, *adapter;
 
     conform = PyObject_GetAttr(obj, str__conform__);
     if (conform == NULL) {
@@ -928,6 +1275,44 @@ IB__call__(PyObject* self, PyObject* args, PyObject* kwargs)
     return NULL;
 }
 
+static PyObject*
+IB__call__(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    static char* kwlist[] = { "obj", "alternate", NULL };
+    PyObject *obj, *alternate = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(
+          args, kwargs, "O|O", kwlist, &obj, &alternate))
+        return NULL;
+
+    return _IB_call(self, obj, alternate);
+}
+
+/* The same, without packing the arguments into a tuple. IB__init__
+ * installs this for each interface; Python 3.12 and later use it for
+ * subclasses like InterfaceClass too. */
+static PyObject*
+IB_vectorcall(PyObject* self,
+              PyObject* const* args,
+              size_t nargsf,
+              PyObject* kwnames)
+{
+    static const char* const kwlist[] = { "obj", "alternate", NULL };
+    PyObject *obj, *alternate = NULL;
+
+    if (_parse_args("__call__",
+                    kwlist,
+                    1,
+                    args,
+                    PyVectorcall_NARGS(nargsf),
+                    kwnames,
+                    &obj,
+                    &alternate) < 0)
+        return NULL;
+
+    return _IB_call(self, obj, alternate);
+}
+
 static Py_hash_t
 IB__hash__(IB* self)
 {
@@ -954,6 +1339,22 @@ IB__hash__(IB* self)
     return self->_v_cached_hash;
 }
 
+/*
+ * Are the names (or modules) *a* and *b* equal? Two interned strings
+ * are equal only if they are the same object, so their characters
+ * don't have to be compared.
+ */
+static int
+_IB_key_eq(PyObject* a, PyObject* b)
+{
+    if (a == b)
+        return 1;
+    if (PyUnicode_CheckExact(a) && PyUnicode_CheckExact(b) &&
+        PyUnicode_CHECK_INTERNED(a) && PyUnicode_CHECK_INTERNED(b))
+        return 0;
+    return PyObject_RichCompareBool(a, b, Py_EQ);
+}
+
 static PyObject*
 IB_richcompare(IB* self, PyObject* other, int op)
 {
@@ -1024,7 +1425,17 @@ IB_richcompare(IB* self, PyObject* other, int op)
 #endif
 
     // tuple comparison is decided by the first non-equal element.
-    result = PyObject_RichCompareBool(self->__name__, othername, Py_EQ);
+    result = _IB_key_eq(self->__name__, othername);
+    if (op == Py_EQ || op == Py_NE) {
+        if (result == 1) {
+            result = _IB_key_eq(self->__module__, othermod);
+        }
+        if (result == -1) {
+            goto cleanup;
+        }
+        oresult = (result == (op == Py_EQ)) ? Py_True : Py_False;
+        goto cleanup;
+    }
     if (result == 0) {
         result = PyObject_RichCompareBool(self->__name__, othername, op);
     } else if (result == 1) {
@@ -1054,6 +1465,9 @@ static PyMemberDef IB_members[] = {
     // __module__ is often shadowed by subclasses.
     { "__module__", T_OBJECT_EX, offsetof(IB, __module__), READONLY, "" },
     { "__ibmodule__", T_OBJECT_EX, offsetof(IB, __module__), 0, "" },
+#if USE_HEAP_TYPES
+    { "__vectorcalloffset__", T_PYSSIZET, offsetof(IB, vectorcall), READONLY, "" },
+#endif
     { NULL }
 };
 
@@ -1079,7 +1493,8 @@ static PyTypeObject IB_type_def = {
     .tp_doc             = IB__doc__,
     .tp_base            = &SB_type_def,
     .tp_basicsize       = sizeof(IB),
-    .tp_flags           = BASETYPE_FLAGS,
+    .tp_flags           = BASETYPE_FLAGS | Py_TPFLAGS_HAVE_VECTORCALL,
+    .tp_vectorcall_offset = offsetof(IB, vectorcall),
     .tp_init            = (initproc)IB__init__,
     .tp_hash            = (hashfunc)IB__hash__,
     .tp_richcompare     = (richcmpfunc)IB_richcompare,
@@ -1114,12 +1529,230 @@ static PyType_Slot IB_type_slots[] = {
 static PyType_Spec IB_type_spec = {
     .name               = IB__name__,
     .basicsize          = sizeof(IB),
-    .flags              = BASETYPE_FLAGS,
+    .flags              = BASETYPE_FLAGS | Py_TPFLAGS_HAVE_VECTORCALL,
     .slots              = IB_type_slots
 };
 
 #endif
 
+/*
+ *  AdapterHook class
+ */
+static int
+AH_traverse(AH* self, visitproc visit, void* arg)
+{
+#if USE_HEAP_TYPES && PY_VERSION_HEX > 0x03090000
+    Py_VISIT(Py_TYPE(self));
+#endif
+    Py_VISIT(self->hook);
+    Py_VISIT(self->provided);
+    return 0;
+}
+
+static int
+AH_clear(AH* self)
+{
+    Py_CLEAR(self->hook);
+    Py_CLEAR(self->provided);
+    return 0;
+}
+
+static void
+AH_dealloc(AH* self)
+{
+    PyObject_GC_UnTrack((PyObject*)self);
+    PyTypeObject* tp = Py_TYPE(self);
+    AH_clear(self);
+    tp->tp_free((PyObject*)self);
+#if USE_HEAP_TYPES
+    Py_DECREF(tp);
+#endif
+}
+
+/*
+    def __init__(self, hook, provided=()):
+        self.hook = hook
+        self.provided = tuple(provided)
+        self.calls = self.hits = self.skips = 0
+*/
+static int
+AH__init__(AH* self, PyObject* args, PyObject* kwargs)
+{
+    static char* kwlist[] = { "hook", "provided", NULL };
+    PyObject* hook;
+    PyObject* provided = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(
+          args, kwargs, "O|O:AdapterHook", kwlist, &hook, &provided))
+        return -1;
+
+    if (provided == NULL) {
+        provided = PyTuple_New(0);
+    } else {
+        provided = PySequence_Tuple(provided);
+    }
+    if (provided == NULL)
+        return -1;
+
+    Py_INCREF(hook);
+    Py_XSETREF(self->hook, hook);
+    Py_XSETREF(self->provided, provided);
+    self->calls = self->hits = self->skips = 0;
+    return 0;
+}
+
+/*
+  Return 1 if the hook should be consulted for *iface*, 0 if not,
+  or -1 on error.
+*/
+static int
+AH_handles(AH* self, PyObject* iface)
+{
+    PyTypeObject* specification_base_class;
+    PyObject* provided;
+    PyObject* p;
+    PyObject* r;
+    Py_ssize_t i;
+    int result;
+
+    provided = self->provided;
+    if (provided == NULL || PyTuple_GET_SIZE(provided) == 0)
+        return 1;
+
+    specification_base_class = _get_specification_base_class(Py_TYPE(self));
+    if (specification_base_class == NULL)
+        return -1;
+
+    for (i = 0; i < PyTuple_GET_SIZE(provided); i++) {
+        p = PyTuple_GET_ITEM(provided, i);
+        if (PyObject_TypeCheck(p, specification_base_class)) {
+            r = SB_extends((SB*)p, iface);
+        } else {
+            r = PyObject_CallMethodObjArgs(p, strisOrExtends, iface, NULL);
+        }
+        if (r == NULL)
+            return -1;
+        result = PyObject_IsTrue(r);
+        Py_DECREF(r);
+        if (result != 0)
+            return result;
+    }
+    return 0;
+}
+
+/*
+    def __call__(self, iface, obj):
+        if self.provided:
+            for p in self.provided:
+                if p.isOrExtends(iface):
+                    break
+            else:
+                self.skips += 1
+                return None
+        self.calls += 1
+        adapter = self.hook(iface, obj)
+        if adapter is not None:
+            self.hits += 1
+        return adapter
+*/
+static PyObject*
+AH_dispatch(AH* self, PyObject* iface, PyObject* obj)
+{
+    PyObject* adapter;
+    int handles;
+
+    if (self->hook == NULL) {
+        PyErr_SetString(PyExc_TypeError, "AdapterHook has no hook");
+        return NULL;
+    }
+
+    handles = AH_handles(self, iface);
+    if (handles < 0)
+        return NULL;
+    if (handles == 0) {
+        self->skips++;
+        Py_RETURN_NONE;
+    }
+
+    self->calls++;
+    adapter = PyObject_CallFunctionObjArgs(self->hook, iface, obj, NULL);
+    if (adapter != NULL && adapter != Py_None)
+        self->hits++;
+    return adapter;
+}
+
+static PyObject*
+AH__call__(AH* self, PyObject* args, PyObject* kwargs)
+{
+    static char* kwlist[] = { "iface", "obj", NULL };
+    PyObject *iface, *obj;
+
+    if (!PyArg_ParseTupleAndKeywords(
+          args, kwargs, "OO", kwlist, &iface, &obj))
+        return NULL;
+
+    return AH_dispatch(self, iface, obj);
+}
+
+static PyMemberDef AH_members[] = {
+    { "hook", T_OBJECT, offsetof(AH, hook), READONLY, "" },
+    { "provided", T_OBJECT, offsetof(AH, provided), READONLY, "" },
+    { "calls", T_PYSSIZET, offsetof(AH, calls), 0, "" },
+    { "hits", T_PYSSIZET, offsetof(AH, hits), 0, "" },
+    { "skips", T_PYSSIZET, offsetof(AH, skips), 0, "" },
+    { NULL }
+};
+
+static char AH__name__[] = "_zope_interface_coptimizations.AdapterHook";
+static char AH__doc__[] = (
+    "An adapter hook that is only consulted for some interfaces"
+);
+
+#if USE_STATIC_TYPES
+
+/*
+ * Static type: AdapterHook
+ */
+
+static PyTypeObject AH_type_def = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name            = AH__name__,
+    .tp_doc             = AH__doc__,
+    .tp_basicsize       = sizeof(AH),
+    .tp_flags           = BASETYPE_FLAGS,
+    .tp_init            = (initproc)AH__init__,
+    .tp_call            = (ternaryfunc)AH__call__,
+    .tp_traverse        = (traverseproc)AH_traverse,
+    .tp_clear           = (inquiry)AH_clear,
+    .tp_dealloc         = (destructor)AH_dealloc,
+    .tp_members         = AH_members,
+};
+
+#else
+
+/*
+ * Heap type: AdapterHook
+ */
+static PyType_Slot AH_type_slots[] = {
+    {Py_tp_doc,         AH__doc__},
+    {Py_tp_init,        AH__init__},
+    {Py_tp_call,        AH__call__},
+    {Py_tp_traverse,    AH_traverse},
+    {Py_tp_clear,       AH_clear},
+    {Py_tp_dealloc,     AH_dealloc},
+    {Py_tp_members,     AH_members},
+    {0,                 NULL}
+};
+
+static PyType_Spec AH_type_spec = {
+    .name               = AH__name__,
+    .basicsize          = sizeof(AH),
+    .flags              = BASETYPE_FLAGS,
+    .slots              = AH_type_slots
+};
+
+#endif
+
 /*
  *  LookupBase class
  */
@@ -1129,6 +1762,10 @@ typedef struct
     PyObject* _cache;
     PyObject* _mcache;
     PyObject* _scache;
+    PyObject* _ucache;
+    PyObject* _ncache;
+    Py_ssize_t epoch;
+    char weak_keys;
 } LB;
 
 static int
@@ -1144,6 +1781,8 @@ LB_traverse(LB* self, visitproc visit, void* arg)
     Py_VISIT(self->_cache);
     Py_VISIT(self->_mcache);
     Py_VISIT(self->_scache);
+    Py_VISIT(self->_ucache);
+    Py_VISIT(self->_ncache);
     return 0;
 }
 
@@ -1153,6 +1792,8 @@ LB_clear(LB* self)
     Py_CLEAR(self->_cache);
     Py_CLEAR(self->_mcache);
     Py_CLEAR(self->_scache);
+    Py_CLEAR(self->_ucache);
+    Py_CLEAR(self->_ncache);
     return 0;
 }
 
@@ -1168,11 +1809,22 @@ LB_dealloc(LB* self)
 #endif
 }
 
+static PyMemberDef LB_members[] = {
+    { "_cache", T_OBJECT, offsetof(LB, _cache), READONLY, "" },
+    { "_mcache", T_OBJECT, offsetof(LB, _mcache), READONLY, "" },
+    { "_scache", T_OBJECT, offsetof(LB, _scache), READONLY, "" },
+    { "_ucache", T_OBJECT, offsetof(LB, _ucache), READONLY, "" },
+    { "_epoch", T_PYSSIZET, offsetof(LB, epoch), READONLY, "" },
+    { "_weak_keys", T_BOOL, offsetof(LB, weak_keys), 0, "" },
+    { NULL },
+};
+
 /*
     def changed(self, ignored=None):
         self._cache.clear()
         self._mcache.clear()
         self._scache.clear()
+        self._ucache.clear()
 */
 static PyObject*
 LB_changed(LB* self, PyObject* ignored)
@@ -1182,8 +1834,68 @@ LB_changed(LB* self, PyObject* ignored)
     return Py_None;
 }
 
+/*
+    def _specs_changed_since(self, epoch):
+        return True
+*/
+static PyObject*
+LB__specs_changed_since(LB* self, PyObject* epoch)
+{
+    Py_RETURN_TRUE;
+}
+
+/*
+    def _assure_current(self):
+        epoch = _current_spec_epoch()
+        if self._epoch != epoch:
+            if self._cache or self._mcache or self._scache:
+                if self._specs_changed_since(self._epoch):
+                    self.changed(None)
+            self._epoch = epoch
+*/
+static int
+_assure_current(LB* self)
+{
+    Py_ssize_t epoch = spec_epoch;
+    PyObject *since, *result;
+    int changed;
+
+    if (self->epoch == epoch)
+        return 0;
+
+    /* Empty caches (ours start out NULL, and changed() resets them to
+     * NULL) can't be stale. */
+    if (self->_cache != NULL
+        || self->_mcache != NULL
+        || self->_scache != NULL
+        || self->_ncache != NULL) {
+        since = PyLong_FromSsize_t(self->epoch);
+        if (since == NULL)
+            return -1;
+        result = PyObject_CallMethodObjArgs(
+          OBJECT(self), str_specs_changed_since, since, NULL);
+        Py_DECREF(since);
+        if (result == NULL)
+            return -1;
+        changed = PyObject_IsTrue(result);
+        Py_DECREF(result);
+        if (changed < 0)
+            return -1;
+        if (changed) {
+            result = PyObject_CallMethodObjArgs(
+              OBJECT(self), strchanged, Py_None, NULL);
+            if (result == NULL)
+                return -1;
+            Py_DECREF(result);
+        }
+    }
+    self->epoch = epoch;
+    return 0;
+}
+
 /*
     def _getcache(self, provided, name):
+        self._assure_current()
         cache = self._cache.get(provided)
         if cache is None:
             cache = {}
@@ -1236,6 +1948,9 @@ _getcache(LB* self, PyObject* provided, PyObject* name)
 {
     PyObject* cache;
 
+    if (_assure_current(self) < 0)
+        return NULL;
+
     ASSURE_DICT(self->_cache);
 
     cache = _subcache(self->_cache, provided);  /* strong ref */
@@ -1254,20 +1969,75 @@ _getcache(LB* self, PyObject* provided, PyObject* name)
     return cache;  /* Caller owns a reference */
 }
 
+/*
+def _weak_key(key):
+    if type(key) is tuple:
+        return tuple([_weak_key(k) for k in key])
+    try:
+        return weakref.ref(key)
+    except TypeError:
+        return key
+*/
+/* Return a new reference to the key that caches which hold their keys
+ * weakly use for 'key' (a specification or a tuple of them). */
+static PyObject*
+_weak_key(PyObject* key)
+{
+    PyObject* result;
+
+    if (PyTuple_CheckExact(key)) {
+        Py_ssize_t i, n = PyTuple_GET_SIZE(key);
+
+        result = PyTuple_New(n);
+        if (result == NULL)
+            return NULL;
+        for (i = 0; i < n; i++) {
+            PyObject* item = _weak_key(PyTuple_GET_ITEM(key, i));
+            if (item == NULL) {
+                Py_DECREF(result);
+                return NULL;
+            }
+            PyTuple_SET_ITEM(result, i, item);
+        }
+        return result;
+    }
+
+    /* Without a callback, this is the object's shared basic reference
+     * after the first time, so it's cheap and its hash is cached. */
+    result = PyWeakref_NewRef(key, NULL);
+    if (result == NULL && PyErr_ExceptionMatches(PyExc_TypeError)) {
+        PyErr_Clear();
+        Py_INCREF(key);
+        result = key;
+    }
+    return result;
+}
+
+/* Return a new reference to the cache key for 'key'. */
+static PyObject*
+_cache_key(LB* self, PyObject* key)
+{
+    if (self->weak_keys)
+        return _weak_key(key);
+    Py_INCREF(key);
+    return key;
+}
+
 /*
     def lookup(self, required, provided, name=u'', default=None):
         cache = self._getcache(provided, name)
+        required = tuple(required)
         if len(required) == 1:
-            result = cache.get(required[0], _not_in_mapping)
+            key = required[0]
         else:
-            result = cache.get(tuple(required), _not_in_mapping)
+            key = required
+        if self._weak_keys:
+            key = _weak_key(key)
+        result = cache.get(key, _not_in_mapping)
 
         if result is _not_in_mapping:
             result = self._uncached_lookup(required, provided, name)
-            if len(required) == 1:
-                cache[required[0]] = result
-            else:
-                cache[tuple(required)] = result
+            cache[key] = result
 
         if result is None:
             return default
@@ -1312,9 +2082,14 @@ _lookup(LB* self,
     }
 
     if (PyTuple_GET_SIZE(required) == 1)
-        key = PyTuple_GET_ITEM(required, 0);
+        key = _cache_key(self, PyTuple_GET_ITEM(required, 0));
     else
-        key = required;
+        key = _cache_key(self, required);
+    if (key == NULL) {
+        Py_DECREF(cache);
+        Py_DECREF(required);
+        return NULL;
+    }
 
     /* Use PyDict_GetItemRef() for a strong reference to the cached result.
      * Needed for free-threaded Python where another thread could clear
@@ -1322,6 +2097,7 @@ _lookup(LB* self,
     {
         int found = PyDict_GetItemRef(cache, key, &result);
         if (found < 0) {
+            Py_DECREF(key);
             Py_DECREF(cache);
             Py_DECREF(required);
             return NULL;
@@ -1332,11 +2108,13 @@ _lookup(LB* self,
             result = PyObject_CallMethodObjArgs(
               OBJECT(self), str_uncached_lookup, required, provided, name, NULL);
             if (result == NULL) {
+                Py_DECREF(key);
                 Py_DECREF(cache);
                 Py_DECREF(required);
                 return NULL;
             }
             status = PyDict_SetItem(cache, key, result);
+            Py_DECREF(key);
             Py_DECREF(cache);
             Py_DECREF(required);
             if (status < 0) {
@@ -1345,6 +2123,7 @@ _lookup(LB* self,
             }
         } else {
             /* found == 1: result already has a strong ref */
+            Py_DECREF(key);
             Py_DECREF(cache);
             Py_DECREF(required);
         }
@@ -1360,28 +2139,148 @@ _lookup(LB* self,
 }
 
 static PyObject*
-LB_lookup(LB* self, PyObject* args, PyObject* kwds)
+LB_lookup(LB* self,
+          PyObject* const* args,
+          Py_ssize_t nargs,
+          PyObject* kwnames)
 {
-    static char* kwlist[] = { "required", "provided", "name", "default", NULL };
+    static const char* const kwlist[] = {
+        "required", "provided", "name", "default", NULL
+    };
     PyObject *required, *provided, *name = NULL, *default_ = NULL;
 
-    if (!PyArg_ParseTupleAndKeywords(args,
-                                     kwds,
-                                     "OO|OO:LookupBase.lookup",
-                                     kwlist,
-                                     &required,
-                                     &provided,
-                                     &name,
-                                     &default_))
+    if (_parse_args("lookup",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &required,
+                    &provided,
+                    &name,
+                    &default_) < 0)
+        return NULL;
+
+    return _lookup(self, required, provided, name, default_);
+}
+
+/*
+    def lookup0(self, provided, name='', default=None):
+        key = (provided, name) if name else provided
+        result = self._ucache.get(key, _not_in_mapping)
+        if result is _not_in_mapping:
+            result = self._ucache[key] = self._uncached_lookup(
+                (), provided, name)
+
+        if result is None:
+            return default
+
+        return result
+*/
+static PyObject*
+_lookup0(LB* self, PyObject* provided, PyObject* name, PyObject* default_)
+{
+    PyObject *key, *result;
+    int found;
+
+    if (name && !PyUnicode_Check(name)) {
+        PyErr_SetString(PyExc_ValueError, "name is not a string");
+        return NULL;
+    }
+
+    ASSURE_DICT(self->_ucache);
+
+    /* Unnamed lookups, the common case, are keyed by the interface
+     * alone so they don't need a tuple. */
+    if (name == NULL || PyUnicode_GET_LENGTH(name) == 0) {
+        key = provided;
+        Py_INCREF(key);
+    } else {
+        key = PyTuple_Pack(2, provided, name);
+        if (key == NULL)
+            return NULL;
+    }
+
+    /* Strong reference; see _lookup(). */
+    found = PyDict_GetItemRef(self->_ucache, key, &result);
+    if (found < 0) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    if (found == 0) {
+        PyObject* required;
+        int status;
+
+        required = PyTuple_New(0);
+        if (required == NULL) {
+            Py_DECREF(key);
+            return NULL;
+        }
+        result = PyObject_CallMethodObjArgs(
+          OBJECT(self), str_uncached_lookup, required, provided, name, NULL);
+        Py_DECREF(required);
+        if (result == NULL) {
+            Py_DECREF(key);
+            return NULL;
+        }
+        /* The lookup may have run arbitrary code that cleared our
+         * caches. */
+        if (self->_ucache == NULL) {
+            self->_ucache = PyDict_New();
+            if (self->_ucache == NULL) {
+                Py_DECREF(key);
+                Py_DECREF(result);
+                return NULL;
+            }
+        }
+        status = PyDict_SetItem(self->_ucache, key, result);
+        if (status < 0) {
+            Py_DECREF(key);
+            Py_DECREF(result);
+            return NULL;
+        }
+    }
+    Py_DECREF(key);
+
+    if (result == Py_None && default_ != NULL) {
+        Py_DECREF(result);
+        Py_INCREF(default_);
+        return default_;
+    }
+
+    return result;
+}
+
+static PyObject*
+LB_lookup0(LB* self,
+           PyObject* const* args,
+           Py_ssize_t nargs,
+           PyObject* kwnames)
+{
+    static const char* const kwlist[] = { "provided", "name", "default", NULL };
+    PyObject *provided, *name = NULL, *default_ = NULL;
+
+    if (_parse_args("lookup0",
+                    kwlist,
+                    1,
+                    args,
+                    nargs,
+                    kwnames,
+                    &provided,
+                    &name,
+                    &default_) < 0)
         return NULL;
 
-    return _lookup(self, required, provided, name, default_);
+    return _lookup0(self, provided, name, default_);
 }
 
 /*
     def lookup1(self, required, provided, name=u'', default=None):
         cache = self._getcache(provided, name)
-        result = cache.get(required, _not_in_mapping)
+        if self._weak_keys:
+            result = cache.get(_weak_key(required), _not_in_mapping)
+        else:
+            result = cache.get(required, _not_in_mapping)
         if result is _not_in_mapping:
             return self.lookup((required, ), provided, name, default)
 
@@ -1410,7 +2309,19 @@ _lookup1(LB* self,
 
     /* Use PyDict_GetItemRef() for a strong reference.  See _lookup(). */
     {
-        int found = PyDict_GetItemRef(cache, required, &result);
+        int found;
+
+        if (self->weak_keys) {
+            PyObject* key = _weak_key(required);
+            if (key == NULL) {
+                Py_DECREF(cache);
+                return NULL;
+            }
+            found = PyDict_GetItemRef(cache, key, &result);
+            Py_DECREF(key);
+        } else {
+            found = PyDict_GetItemRef(cache, required, &result);
+        }
         Py_DECREF(cache);
         if (found < 0)
             return NULL;
@@ -1437,19 +2348,26 @@ _lookup1(LB* self,
     return result;
 }
 static PyObject*
-LB_lookup1(LB* self, PyObject* args, PyObject* kwds)
+LB_lookup1(LB* self,
+           PyObject* const* args,
+           Py_ssize_t nargs,
+           PyObject* kwnames)
 {
-    static char* kwlist[] = { "required", "provided", "name", "default", NULL };
+    static const char* const kwlist[] = {
+        "required", "provided", "name", "default", NULL
+    };
     PyObject *required, *provided, *name = NULL, *default_ = NULL;
 
-    if (!PyArg_ParseTupleAndKeywords(args,
-                                     kwds,
-                                     "OO|OO:LookupBase.lookup1",
-                                     kwlist,
-                                     &required,
-                                     &provided,
-                                     &name,
-                                     &default_))
+    if (_parse_args("lookup1",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &required,
+                    &provided,
+                    &name,
+                    &default_) < 0)
         return NULL;
 
     return _lookup1(self, required, provided, name, default_);
@@ -1528,62 +2446,371 @@ _adapter_hook(LB* self,
 }
 
 static PyObject*
-LB_adapter_hook(LB* self, PyObject* args, PyObject* kwds)
+LB_adapter_hook(LB* self,
+                PyObject* const* args,
+                Py_ssize_t nargs,
+                PyObject* kwnames)
 {
-    static char* kwlist[] = { "provided", "object", "name", "default", NULL };
+    static const char* const kwlist[] = {
+        "provided", "object", "name", "default", NULL
+    };
     PyObject *object, *provided, *name = NULL, *default_ = NULL;
 
-    if (!PyArg_ParseTupleAndKeywords(args,
-                                     kwds,
-                                     "OO|OO:LookupBase.adapter_hook",
-                                     kwlist,
-                                     &provided,
-                                     &object,
-                                     &name,
-                                     &default_))
+    if (_parse_args("adapter_hook",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &provided,
+                    &object,
+                    &name,
+                    &default_) < 0)
         return NULL;
 
     return _adapter_hook(self, provided, object, name, default_);
 }
 
 static PyObject*
-LB_queryAdapter(LB* self, PyObject* args, PyObject* kwds)
+LB_queryAdapter(LB* self,
+                PyObject* const* args,
+                Py_ssize_t nargs,
+                PyObject* kwnames)
 {
-    static char* kwlist[] = { "object", "provided", "name", "default", NULL };
+    static const char* const kwlist[] = {
+        "object", "provided", "name", "default", NULL
+    };
     PyObject *object, *provided, *name = NULL, *default_ = NULL;
 
-    if (!PyArg_ParseTupleAndKeywords(args,
-                                     kwds,
-                                     "OO|OO:LookupBase.queryAdapter",
-                                     kwlist,
-                                     &object,
-                                     &provided,
-                                     &name,
-                                     &default_))
+    if (_parse_args("queryAdapter",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &object,
+                    &provided,
+                    &name,
+                    &default_) < 0)
         return NULL;
 
     return _adapter_hook(self, provided, object, name, default_);
 }
 
+/*
+    def queryMultiAdapter(self, objects, provided, name=u'', default=None):
+        factory = self.lookup([providedBy(o) for o in objects],
+                              provided, name)
+        if factory is None:
+            return default
+
+        result = factory(*[
+            o.__self__ if isinstance(o, super) else o for o in objects
+        ])
+        if result is None:
+            return default
+
+        return result
+*/
+/* Return a new reference to the factory for the 'order' (2 or 3)
+ * specifications in 'specs'.
+ *
+ * Hits walk nested per-position caches,
+ * {order: {provided: {[name: ]{spec1: {spec2: ...}}}}}, so they don't
+ * have to build a tuple to use as a key. Misses go through _lookup(),
+ * which also records the result in the main cache.
+ */
+static PyObject*
+_lookup_nested(LB* self,
+               PyObject** specs,
+               Py_ssize_t order,
+               PyObject* provided,
+               PyObject* name)
+{
+    PyObject *cache, *subcache, *key, *required, *result;
+    Py_ssize_t i;
+    int found;
+
+    if (_assure_current(self) < 0)
+        return NULL;
+
+    ASSURE_DICT(self->_ncache);
+
+    key = PyLong_FromSsize_t(order);
+    if (key == NULL)
+        return NULL;
+    cache = _subcache(self->_ncache, key);
+    Py_DECREF(key);
+    if (cache == NULL)
+        return NULL;
+
+    subcache = _subcache(cache, provided);
+    Py_DECREF(cache);
+    if (subcache == NULL)
+        return NULL;
+    cache = subcache;
+
+    if (name != NULL && PyUnicode_GET_LENGTH(name) > 0) {
+        subcache = _subcache(cache, name);
+        Py_DECREF(cache);
+        if (subcache == NULL)
+            return NULL;
+        cache = subcache;
+    }
+
+    for (i = 0; i < order - 1; i++) {
+        subcache = _subcache(cache, specs[i]);
+        Py_DECREF(cache);
+        if (subcache == NULL)
+            return NULL;
+        cache = subcache;
+    }
+
+    found = PyDict_GetItemRef(cache, specs[order - 1], &result);
+    if (found != 0) {
+        Py_DECREF(cache);
+        return found < 0 ? NULL : result;
+    }
+
+    required = PyTuple_New(order);
+    if (required == NULL) {
+        Py_DECREF(cache);
+        return NULL;
+    }
+    for (i = 0; i < order; i++) {
+        Py_INCREF(specs[i]);
+        PyTuple_SET_ITEM(required, i, specs[i]);
+    }
+    result = _lookup(self, required, provided, name, NULL);
+    Py_DECREF(required);
+    if (result != NULL && PyDict_SetItem(cache, specs[order - 1], result) < 0)
+        Py_CLEAR(result);
+    Py_DECREF(cache);
+    return result;
+}
+
+/* Call 'factory' with the 'n' objects in 'objects', passing the
+ * __self__ of super() objects instead, as _adapter_hook does. */
+static PyObject*
+_call_factory(PyObject* factory, PyObject** objects, Py_ssize_t n)
+{
+    PyObject* small[3];
+    PyObject** args = small;
+    PyObject* result = NULL;
+    Py_ssize_t i, filled;
+
+    if (n > 3) {
+        args = PyMem_New(PyObject*, n);
+        if (args == NULL)
+            return PyErr_NoMemory();
+    }
+
+    /* Take our own references: the factory could change the sequence
+     * the objects came from. */
+    for (filled = 0; filled < n; filled++) {
+        PyObject* object = objects[filled];
+        if (PyObject_TypeCheck(object, &PySuper_Type)) {
+            object = PyObject_GetAttr(object, str__self__);
+            if (object == NULL)
+                goto done;
+        } else
+            Py_INCREF(object);
+        args[filled] = object;
+    }
+
+    result = PyObject_Vectorcall(factory, args, n, NULL);
+
+done:
+    for (i = 0; i < filled; i++)
+        Py_DECREF(args[i]);
+    if (args != small)
+        PyMem_Free(args);
+    return result;
+}
+
+/* Return a new reference to 'self.lookup', or to None if that's
+ * 'builtin_lookup', the C method of the type that's calling us: then the
+ * caches can be used directly. Subclasses and instances can override
+ * lookup(), and queryMultiAdapter has always called it.
+ */
+static PyObject*
+_overridden_lookup(LB* self, PyCFunction builtin_lookup)
+{
+    PyObject* lookup;
+
+    lookup = PyObject_GetAttr(OBJECT(self), strlookup);
+    if (lookup == NULL)
+        return NULL;
+    if (PyCFunction_Check(lookup) && PyCFunction_GET_SELF(lookup) == OBJECT(self)
+        && PyCFunction_GET_FUNCTION(lookup) == builtin_lookup) {
+        Py_DECREF(lookup);
+        Py_RETURN_NONE;
+    }
+    return lookup;
+}
+
+static PyObject*
+_query_multi_adapter(LB* self,
+                     PyObject* objects,
+                     PyObject* provided,
+                     PyObject* name,
+                     PyObject* default_,
+                     PyCFunction builtin_lookup)
+{
+    PyObject *seq, *factory, *result, *module, *lookup;
+    PyObject* empty_name = NULL;
+    PyObject* specs[3];
+    PyObject** items;
+    Py_ssize_t n, i;
+
+    if (name && !PyUnicode_Check(name)) {
+        PyErr_SetString(PyExc_ValueError, "name is not a string");
+        return NULL;
+    }
+
+    module = _get_module(Py_TYPE(self));
+
+    lookup = _overridden_lookup(self, builtin_lookup);
+    if (lookup == NULL)
+        return NULL;
+
+    seq = PySequence_Fast(objects, "objects must be iterable");
+    if (seq == NULL) {
+        Py_DECREF(lookup);
+        return NULL;
+    }
+    n = PySequence_Fast_GET_SIZE(seq);
+    items = PySequence_Fast_ITEMS(seq);
+
+    if (lookup != Py_None) {
+        PyObject* required = PyList_New(n);
+        if (required == NULL) {
+            Py_DECREF(lookup);
+            Py_DECREF(seq);
+            return NULL;
+        }
+        for (i = 0; i < n; i++) {
+            PyObject* spec = providedBy(module, items[i]);
+            if (spec == NULL) {
+                Py_DECREF(required);
+                Py_DECREF(lookup);
+                Py_DECREF(seq);
+                return NULL;
+            }
+            PyList_SET_ITEM(required, i, spec);
+        }
+        if (name == NULL)
+            name = empty_name = PyUnicode_FromString("");
+        factory = name == NULL ? NULL
+                               : PyObject_CallFunctionObjArgs(
+                                   lookup, required, provided, name, NULL);
+        Py_XDECREF(empty_name);
+        Py_DECREF(required);
+    } else if ((n == 2 || n == 3) && !self->weak_keys) {
+        for (i = 0; i < n; i++) {
+            specs[i] = providedBy(module, items[i]);
+            if (specs[i] == NULL) {
+                while (--i >= 0)
+                    Py_DECREF(specs[i]);
+                Py_DECREF(seq);
+                return NULL;
+            }
+        }
+        factory = _lookup_nested(self, specs, n, provided, name);
+        for (i = 0; i < n; i++)
+            Py_DECREF(specs[i]);
+    } else {
+        PyObject* required = PyTuple_New(n);
+        if (required == NULL) {
+            Py_DECREF(seq);
+            return NULL;
+        }
+        for (i = 0; i < n; i++) {
+            PyObject* spec = providedBy(module, items[i]);
+            if (spec == NULL) {
+                Py_DECREF(required);
+                Py_DECREF(seq);
+                return NULL;
+            }
+            PyTuple_SET_ITEM(required, i, spec);
+        }
+        factory = _lookup(self, required, provided, name, NULL);
+        Py_DECREF(required);
+    }
+    Py_DECREF(lookup);
+
+    if (factory == NULL) {
+        Py_DECREF(seq);
+        return NULL;
+    }
+
+    if (factory != Py_None) {
+        result = _call_factory(factory, items, n);
+        Py_DECREF(factory);
+    } else
+        result = factory; /* None */
+    Py_DECREF(seq);
+
+    if (result == NULL || result != Py_None)
+        return result;
+
+    if (default_ == NULL || default_ == result) /* No default specified, */
+        return result; /* Return None.  result is owned None */
+
+    Py_DECREF(result);
+    Py_INCREF(default_);
+
+    return default_;
+}
+
+static PyObject*
+LB_queryMultiAdapter(LB* self,
+                     PyObject* const* args,
+                     Py_ssize_t nargs,
+                     PyObject* kwnames)
+{
+    static const char* const kwlist[] = {
+        "objects", "provided", "name", "default", NULL
+    };
+    PyObject *objects, *provided, *name = NULL, *default_ = NULL;
+
+    if (_parse_args("queryMultiAdapter",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &objects,
+                    &provided,
+                    &name,
+                    &default_) < 0)
+        return NULL;
+
+    return _query_multi_adapter(
+      self, objects, provided, name, default_, (PyCFunction)LB_lookup);
+}
+
 /*
     def lookupAll(self, required, provided):
+        self._assure_current()
         cache = self._mcache.get(provided)
         if cache is None:
             cache = {}
             self._mcache[provided] = cache
 
         required = tuple(required)
-        result = cache.get(required, _not_in_mapping)
+        key = _weak_key(required) if self._weak_keys else required
+        result = cache.get(key, _not_in_mapping)
         if result is _not_in_mapping:
             result = self._uncached_lookupAll(required, provided)
-            cache[required] = result
+            cache[key] = result
 
         return result
 */
 static PyObject*
 _lookupAll(LB* self, PyObject* required, PyObject* provided)
 {
-    PyObject *cache, *result;
+    PyObject *cache, *key, *result;
 
     /* resolve before getting cache. See note in _lookup. */
     if (PyTuple_CheckExact(required)) {
@@ -1594,6 +2821,11 @@ _lookupAll(LB* self, PyObject* required, PyObject* provided)
             return NULL;
     }
 
+    if (_assure_current(self) < 0) {
+        Py_DECREF(required);
+        return NULL;
+    }
+
     ASSURE_DICT(self->_mcache);
 
     cache = _subcache(self->_mcache, provided);  /* strong ref */
@@ -1602,10 +2834,18 @@ _lookupAll(LB* self, PyObject* required, PyObject* provided)
         return NULL;
     }
 
+    key = _cache_key(self, required);
+    if (key == NULL) {
+        Py_DECREF(cache);
+        Py_DECREF(required);
+        return NULL;
+    }
+
     /* Use PyDict_GetItemRef() for a strong reference.  See _lookup(). */
     {
-        int found = PyDict_GetItemRef(cache, required, &result);
+        int found = PyDict_GetItemRef(cache, key, &result);
         if (found < 0) {
+            Py_DECREF(key);
             Py_DECREF(cache);
             Py_DECREF(required);
             return NULL;
@@ -1616,11 +2856,13 @@ _lookupAll(LB* self, PyObject* required, PyObject* provided)
             result = PyObject_CallMethodObjArgs(
               OBJECT(self), str_uncached_lookupAll, required, provided, NULL);
             if (result == NULL) {
+                Py_DECREF(key);
                 Py_DECREF(cache);
                 Py_DECREF(required);
                 return NULL;
             }
-            status = PyDict_SetItem(cache, required, result);
+            status = PyDict_SetItem(cache, key, result);
+            Py_DECREF(key);
             Py_DECREF(cache);
             Py_DECREF(required);
             if (status < 0) {
@@ -1629,6 +2871,7 @@ _lookupAll(LB* self, PyObject* required, PyObject* provided)
             }
         } else {
             /* found == 1: result already has a strong ref */
+            Py_DECREF(key);
             Py_DECREF(cache);
             Py_DECREF(required);
         }
@@ -1638,13 +2881,22 @@ _lookupAll(LB* self, PyObject* required, PyObject* provided)
 }
 
 static PyObject*
-LB_lookupAll(LB* self, PyObject* args, PyObject* kwds)
+LB_lookupAll(LB* self,
+             PyObject* const* args,
+             Py_ssize_t nargs,
+             PyObject* kwnames)
 {
-    static char* kwlist[] = { "required", "provided", NULL };
+    static const char* const kwlist[] = { "required", "provided", NULL };
     PyObject *required, *provided;
 
-    if (!PyArg_ParseTupleAndKeywords(
-          args, kwds, "OO:LookupBase.lookupAll", kwlist, &required, &provided))
+    if (_parse_args("lookupAll",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &required,
+                    &provided) < 0)
         return NULL;
 
     return _lookupAll(self, required, provided);
@@ -1652,23 +2904,25 @@ LB_lookupAll(LB* self, PyObject* args, PyObject* kwds)
 
 /*
     def subscriptions(self, required, provided):
+        self._assure_current()
         cache = self._scache.get(provided)
         if cache is None:
             cache = {}
             self._scache[provided] = cache
 
         required = tuple(required)
-        result = cache.get(required, _not_in_mapping)
+        key = _weak_key(required) if self._weak_keys else required
+        result = cache.get(key, _not_in_mapping)
         if result is _not_in_mapping:
             result = self._uncached_subscriptions(required, provided)
-            cache[required] = result
+            cache[key] = result
 
         return result
 */
 static PyObject*
 _subscriptions(LB* self, PyObject* required, PyObject* provided)
 {
-    PyObject *cache, *result;
+    PyObject *cache, *key, *result;
 
     /* resolve before getting cache. See note in _lookup. */
     if (PyTuple_CheckExact(required)) {
@@ -1679,6 +2933,11 @@ _subscriptions(LB* self, PyObject* required, PyObject* provided)
             return NULL;
     }
 
+    if (_assure_current(self) < 0) {
+        Py_DECREF(required);
+        return NULL;
+    }
+
     ASSURE_DICT(self->_scache);
 
     cache = _subcache(self->_scache, provided);  /* strong ref */
@@ -1687,10 +2946,18 @@ _subscriptions(LB* self, PyObject* required, PyObject* provided)
         return NULL;
     }
 
+    key = _cache_key(self, required);
+    if (key == NULL) {
+        Py_DECREF(cache);
+        Py_DECREF(required);
+        return NULL;
+    }
+
     /* Use PyDict_GetItemRef() for a strong reference.  See _lookup(). */
     {
-        int found = PyDict_GetItemRef(cache, required, &result);
+        int found = PyDict_GetItemRef(cache, key, &result);
         if (found < 0) {
+            Py_DECREF(key);
             Py_DECREF(cache);
             Py_DECREF(required);
             return NULL;
@@ -1701,11 +2968,13 @@ _subscriptions(LB* self, PyObject* required, PyObject* provided)
             result = PyObject_CallMethodObjArgs(
               OBJECT(self), str_uncached_subscriptions, required, provided, NULL);
             if (result == NULL) {
+                Py_DECREF(key);
                 Py_DECREF(cache);
                 Py_DECREF(required);
                 return NULL;
             }
-            status = PyDict_SetItem(cache, required, result);
+            status = PyDict_SetItem(cache, key, result);
+            Py_DECREF(key);
             Py_DECREF(cache);
             Py_DECREF(required);
             if (status < 0) {
@@ -1714,6 +2983,7 @@ _subscriptions(LB* self, PyObject* required, PyObject* provided)
             }
         } else {
             /* found == 1: result already has a strong ref */
+            Py_DECREF(key);
             Py_DECREF(cache);
             Py_DECREF(required);
         }
@@ -1723,13 +2993,22 @@ _subscriptions(LB* self, PyObject* required, PyObject* provided)
 }
 
 static PyObject*
-LB_subscriptions(LB* self, PyObject* args, PyObject* kwds)
+LB_subscriptions(LB* self,
+                 PyObject* const* args,
+                 Py_ssize_t nargs,
+                 PyObject* kwnames)
 {
-    static char* kwlist[] = { "required", "provided", NULL };
+    static const char* const kwlist[] = { "required", "provided", NULL };
     PyObject *required, *provided;
 
-    if (!PyArg_ParseTupleAndKeywords(
-          args, kwds, "OO", kwlist, &required, &provided))
+    if (_parse_args("subscriptions",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &required,
+                    &provided) < 0)
         return NULL;
 
     return _subscriptions(self, required, provided);
@@ -1737,26 +3016,41 @@ LB_subscriptions(LB* self, PyObject* args, PyObject* kwds)
 
 static struct PyMethodDef LB_methods[] = {
     { "changed", (PyCFunction)LB_changed, METH_O, "" },
-    { "lookup", (PyCFunction)LB_lookup, METH_KEYWORDS | METH_VARARGS, "" },
+    { "_specs_changed_since",
+      (PyCFunction)LB__specs_changed_since,
+      METH_O,
+      "" },
+    { "lookup",
+      (PyCFunction)LB_lookup,
+      METH_FASTCALL | METH_KEYWORDS,
+      "" },
+    { "lookup0",
+      (PyCFunction)LB_lookup0,
+      METH_FASTCALL | METH_KEYWORDS,
+      "" },
     { "lookup1",
       (PyCFunction)LB_lookup1,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { "queryAdapter",
       (PyCFunction)LB_queryAdapter,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
+      "" },
+    { "queryMultiAdapter",
+      (PyCFunction)LB_queryMultiAdapter,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { "adapter_hook",
       (PyCFunction)LB_adapter_hook,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { "lookupAll",
       (PyCFunction)LB_lookupAll,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { "subscriptions",
       (PyCFunction)LB_subscriptions,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { NULL, NULL } /* sentinel */
 };
@@ -1781,6 +3075,7 @@ static PyTypeObject LB_type_def = {
     .tp_clear           = (inquiry)LB_clear,
     .tp_dealloc         = (destructor)&LB_dealloc,
     .tp_methods         = LB_methods,
+    .tp_members         = LB_members,
 };
 
 #else
@@ -1794,6 +3089,7 @@ static PyType_Slot LB_type_slots[] = {
     {Py_tp_clear,       LB_clear},
     {Py_tp_dealloc,     LB_dealloc},
     {Py_tp_methods,     LB_methods},
+    {Py_tp_members,     LB_members},
     {0,                 NULL}
 };
 
@@ -1955,13 +3251,26 @@ changed:
 }
 
 static PyObject*
-VB_lookup(VB* self, PyObject* args, PyObject* kwds)
+VB_lookup(VB* self,
+          PyObject* const* args,
+          Py_ssize_t nargs,
+          PyObject* kwnames)
 {
-    static char* kwlist[] = { "required", "provided", "name", "default", NULL };
+    static const char* const kwlist[] = {
+        "required", "provided", "name", "default", NULL
+    };
     PyObject *required, *provided, *name = NULL, *default_ = NULL;
 
-    if (!PyArg_ParseTupleAndKeywords(
-          args, kwds, "OO|OO", kwlist, &required, &provided, &name, &default_))
+    if (_parse_args("lookup",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &required,
+                    &provided,
+                    &name,
+                    &default_) < 0)
         return NULL;
 
     if (_verify(self) < 0)
@@ -1971,13 +3280,52 @@ VB_lookup(VB* self, PyObject* args, PyObject* kwds)
 }
 
 static PyObject*
-VB_lookup1(VB* self, PyObject* args, PyObject* kwds)
+VB_lookup0(VB* self,
+           PyObject* const* args,
+           Py_ssize_t nargs,
+           PyObject* kwnames)
+{
+    static const char* const kwlist[] = { "provided", "name", "default", NULL };
+    PyObject *provided, *name = NULL, *default_ = NULL;
+
+    if (_parse_args("lookup0",
+                    kwlist,
+                    1,
+                    args,
+                    nargs,
+                    kwnames,
+                    &provided,
+                    &name,
+                    &default_) < 0)
+        return NULL;
+
+    if (_verify(self) < 0)
+        return NULL;
+
+    return _lookup0((LB*)self, provided, name, default_);
+}
+
+static PyObject*
+VB_lookup1(VB* self,
+           PyObject* const* args,
+           Py_ssize_t nargs,
+           PyObject* kwnames)
 {
-    static char* kwlist[] = { "required", "provided", "name", "default", NULL };
+    static const char* const kwlist[] = {
+        "required", "provided", "name", "default", NULL
+    };
     PyObject *required, *provided, *name = NULL, *default_ = NULL;
 
-    if (!PyArg_ParseTupleAndKeywords(
-          args, kwds, "OO|OO", kwlist, &required, &provided, &name, &default_))
+    if (_parse_args("lookup1",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &required,
+                    &provided,
+                    &name,
+                    &default_) < 0)
         return NULL;
 
     if (_verify(self) < 0)
@@ -1987,13 +3335,26 @@ VB_lookup1(VB* self, PyObject* args, PyObject* kwds)
 }
 
 static PyObject*
-VB_adapter_hook(VB* self, PyObject* args, PyObject* kwds)
+VB_adapter_hook(VB* self,
+                PyObject* const* args,
+                Py_ssize_t nargs,
+                PyObject* kwnames)
 {
-    static char* kwlist[] = { "provided", "object", "name", "default", NULL };
+    static const char* const kwlist[] = {
+        "provided", "object", "name", "default", NULL
+    };
     PyObject *object, *provided, *name = NULL, *default_ = NULL;
 
-    if (!PyArg_ParseTupleAndKeywords(
-          args, kwds, "OO|OO", kwlist, &provided, &object, &name, &default_))
+    if (_parse_args("adapter_hook",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &provided,
+                    &object,
+                    &name,
+                    &default_) < 0)
         return NULL;
 
     if (_verify(self) < 0)
@@ -2003,13 +3364,26 @@ VB_adapter_hook(VB* self, PyObject* args, PyObject* kwds)
 }
 
 static PyObject*
-VB_queryAdapter(VB* self, PyObject* args, PyObject* kwds)
+VB_queryAdapter(VB* self,
+                PyObject* const* args,
+                Py_ssize_t nargs,
+                PyObject* kwnames)
 {
-    static char* kwlist[] = { "object", "provided", "name", "default", NULL };
+    static const char* const kwlist[] = {
+        "object", "provided", "name", "default", NULL
+    };
     PyObject *object, *provided, *name = NULL, *default_ = NULL;
 
-    if (!PyArg_ParseTupleAndKeywords(
-          args, kwds, "OO|OO", kwlist, &object, &provided, &name, &default_))
+    if (_parse_args("queryAdapter",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &object,
+                    &provided,
+                    &name,
+                    &default_) < 0)
         return NULL;
 
     if (_verify(self) < 0)
@@ -2019,13 +3393,56 @@ VB_queryAdapter(VB* self, PyObject* args, PyObject* kwds)
 }
 
 static PyObject*
-VB_lookupAll(VB* self, PyObject* args, PyObject* kwds)
+VB_queryMultiAdapter(VB* self,
+                     PyObject* const* args,
+                     Py_ssize_t nargs,
+                     PyObject* kwnames)
+{
+    static const char* const kwlist[] = {
+        "objects", "provided", "name", "default", NULL
+    };
+    PyObject *objects, *provided, *name = NULL, *default_ = NULL;
+
+    if (_parse_args("queryMultiAdapter",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &objects,
+                    &provided,
+                    &name,
+                    &default_) < 0)
+        return NULL;
+
+    if (_verify(self) < 0)
+        return NULL;
+
+    return _query_multi_adapter((LB*)self,
+                                objects,
+                                provided,
+                                name,
+                                default_,
+                                (PyCFunction)VB_lookup);
+}
+
+static PyObject*
+VB_lookupAll(VB* self,
+             PyObject* const* args,
+             Py_ssize_t nargs,
+             PyObject* kwnames)
 {
-    static char* kwlist[] = { "required", "provided", NULL };
+    static const char* const kwlist[] = { "required", "provided", NULL };
     PyObject *required, *provided;
 
-    if (!PyArg_ParseTupleAndKeywords(
-          args, kwds, "OO", kwlist, &required, &provided))
+    if (_parse_args("lookupAll",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &required,
+                    &provided) < 0)
         return NULL;
 
     if (_verify(self) < 0)
@@ -2035,13 +3452,22 @@ VB_lookupAll(VB* self, PyObject* args, PyObject* kwds)
 }
 
 static PyObject*
-VB_subscriptions(VB* self, PyObject* args, PyObject* kwds)
+VB_subscriptions(VB* self,
+                 PyObject* const* args,
+                 Py_ssize_t nargs,
+                 PyObject* kwnames)
 {
-    static char* kwlist[] = { "required", "provided", NULL };
+    static const char* const kwlist[] = { "required", "provided", NULL };
     PyObject *required, *provided;
 
-    if (!PyArg_ParseTupleAndKeywords(
-          args, kwds, "OO", kwlist, &required, &provided))
+    if (_parse_args("subscriptions",
+                    kwlist,
+                    2,
+                    args,
+                    nargs,
+                    kwnames,
+                    &required,
+                    &provided) < 0)
         return NULL;
 
     if (_verify(self) < 0)
@@ -2054,27 +3480,35 @@ static struct PyMethodDef VB_methods[] = {
     { "changed", (PyCFunction)verify_changed, METH_O, "" },
     { "lookup",
       (PyCFunction)VB_lookup,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
+      "" },
+    { "lookup0",
+      (PyCFunction)VB_lookup0,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { "lookup1",
       (PyCFunction)VB_lookup1,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { "queryAdapter",
       (PyCFunction)VB_queryAdapter,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
+      "" },
+    { "queryMultiAdapter",
+      (PyCFunction)VB_queryMultiAdapter,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { "adapter_hook",
       (PyCFunction)VB_adapter_hook,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { "lookupAll",
       (PyCFunction)VB_lookupAll,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { "subscriptions",
       (PyCFunction)VB_subscriptions,
-      METH_KEYWORDS | METH_VARARGS,
+      METH_FASTCALL | METH_KEYWORDS,
       "" },
     { NULL, NULL } /* sentinel */
 };
@@ -2139,6 +3573,7 @@ typedef struct
     PyTypeObject*   interface_base_class;
     PyTypeObject*   lookup_base_class;
     PyTypeObject*   verifying_base_class;
+    PyTypeObject*   adapter_hook_class;
     PyObject*       adapter_hooks;
     /* members imported from 'zope.interface.declarations'
      */
@@ -2168,6 +3603,7 @@ _zic_state_init(PyObject* module)
     rec->interface_base_class = NULL;
     rec->lookup_base_class = NULL;
     rec->verifying_base_class = NULL;
+    rec->adapter_hook_class = NULL;
     rec->adapter_hooks = NULL;
 
     rec->builtin_impl_specs = NULL;
@@ -2190,6 +3626,7 @@ _zic_state_traverse(PyObject* module, visitproc visit, void* arg)
     Py_VISIT(rec->interface_base_class);
     Py_VISIT(rec->lookup_base_class);
     Py_VISIT(rec->verifying_base_class);
+    Py_VISIT(rec->adapter_hook_class);
     Py_VISIT(rec->adapter_hooks);
 
     Py_VISIT(rec->builtin_impl_specs);
@@ -2211,6 +3648,7 @@ _zic_state_clear(PyObject* module)
     Py_CLEAR(rec->interface_base_class);
     Py_CLEAR(rec->lookup_base_class);
     Py_CLEAR(rec->verifying_base_class);
+    Py_CLEAR(rec->adapter_hook_class);
     Py_CLEAR(rec->adapter_hooks);
 
     Py_CLEAR(rec->builtin_impl_specs);
@@ -2367,6 +3805,26 @@ _get_interface_base_class(PyTypeObject *typeobj)
 #endif
 }
 
+/*
+ * Fetch the 'AdapterHook' class for the current type's module.
+ */
+static PyTypeObject*
+_get_adapter_hook_class(PyTypeObject *typeobj)
+{
+#if USE_STATIC_TYPES
+    return &AH_type_def;
+#else
+    PyObject* module;
+    _zic_module_state* rec;
+
+    module = _get_module(typeobj);
+    if (module == NULL) { return NULL; }
+
+    rec = _zic_state(module);
+    return rec->adapter_hook_class;
+#endif
+}
+
 static PyObject*
 implementedByFallback(PyObject* module, PyObject* cls)
 {
@@ -2387,6 +3845,58 @@ implementedByFallback(PyObject* module, PyObject* cls)
     return PyObject_CallFunctionObjArgs(fallback, cls, NULL);
 }
 
+/*
+    Fast path for ``implementedBy(super(...))``: look in the
+    ``_super_cache`` of ``implementedBy(sup.__self_class__)``, keyed
+    by ``sup.__thisclass__``. Returns a new reference on a hit, NULL
+    with no error set on a miss, or NULL with an error set.
+*/
+static PyObject*
+implementedBy_super_cached(PyObject* module,
+                           PyObject* sup,
+                           PyTypeObject* implements_class)
+{
+    PyObject *self_class, *thisclass, *impl, *cache, *result;
+    int found;
+
+    result = NULL;
+    self_class = thisclass = impl = cache = NULL;
+
+    self_class = PyObject_GetAttr(sup, str__self_class__);
+    if (self_class == NULL || self_class == Py_None)
+        goto cleanup;
+
+    thisclass = PyObject_GetAttr(sup, str__thisclass__);
+    if (thisclass == NULL)
+        goto cleanup;
+
+    impl = implementedBy(module, self_class);
+    if (impl == NULL || !PyObject_TypeCheck(impl, implements_class))
+        goto cleanup;
+
+    cache = PyObject_GetAttr(impl, str_super_cache);
+    if (cache == NULL || !PyDict_Check(cache))
+        goto cleanup;
+
+    found = PyDict_GetItemRef(cache, thisclass, &result);
+    if (found < 0)
+        result = NULL;
+
+cleanup:
+    Py_XDECREF(self_class);
+    Py_XDECREF(thisclass);
+    Py_XDECREF(impl);
+    Py_XDECREF(cache);
+    if (result == NULL && PyErr_Occurred()) {
+        /* Let the fallback deal with (and report) anything unusual,
+           but don't swallow things like KeyboardInterrupt. */
+        if (!PyErr_ExceptionMatches(PyExc_Exception))
+            return NULL;
+        PyErr_Clear();
+    }
+    return result;
+}
+
 static char implementedBy___doc__[] =
   ("Interfaces implemented by a class or factory.\n"
    "Raises TypeError if argument is neither a class nor a callable.");
@@ -2418,7 +3928,11 @@ implementedBy(PyObject* module, PyObject* cls)
 #endif
 
     if (PyObject_TypeCheck(cls, &PySuper_Type)) {
-        // Let merging be handled by Python.
+        // Previously merged specs are cached per (self class, thisclass);
+        // computing a new one is handled by Python.
+        spec = implementedBy_super_cached(module, cls, implements_class);
+        if (spec != NULL || PyErr_Occurred())
+            return spec;
         return implementedByFallback(module, cls);
     }
 
@@ -2638,6 +4152,18 @@ providedBy(PyObject* module, PyObject* ob)
     return result;
 }
 
+static PyObject*
+_bump_spec_epoch(PyObject* module, PyObject* unused)
+{
+    return PyLong_FromSsize_t(++spec_epoch);
+}
+
+static PyObject*
+_current_spec_epoch(PyObject* module, PyObject* unused)
+{
+    return PyLong_FromSsize_t(spec_epoch);
+}
+
 static struct PyMethodDef _zic_module_methods[] = {
     { "implementedBy",
       (PyCFunction)implementedBy,
@@ -2648,6 +4174,11 @@ static struct PyMethodDef _zic_module_methods[] = {
       METH_O,
       getObjectSpecification___doc__ },
     { "providedBy", (PyCFunction)providedBy, METH_O, providedBy___doc__ },
+    { "_bump_spec_epoch", (PyCFunction)_bump_spec_epoch, METH_NOARGS, "" },
+    { "_current_spec_epoch",
+      (PyCFunction)_current_spec_epoch,
+      METH_NOARGS,
+      "" },
 
     { NULL, (PyCFunction)NULL, 0, NULL } /* sentinel */
 };
@@ -2704,6 +4235,11 @@ _zic_module_exec(PyObject* module)
     Py_INCREF(&VB_type_def);
     rec->verifying_base_class = &VB_type_def;
 
+    AH_type_def.tp_new = PyBaseObject_Type.tp_new;
+    if (PyType_Ready(&AH_type_def) < 0) { return -1; }
+    Py_INCREF(&AH_type_def);
+    rec->adapter_hook_class = &AH_type_def;
+
 #else
 
     PyObject *sb_class;
@@ -2712,6 +4248,7 @@ _zic_module_exec(PyObject* module)
     PyObject *ib_class;
     PyObject *lb_class;
     PyObject *vb_class;
+    PyObject *ah_class;
 
     /* Initialize types:
      */
@@ -2745,6 +4282,11 @@ _zic_module_exec(PyObject* module)
     Py_INCREF(vb_class);
     rec->verifying_base_class = TYPE(vb_class);
 
+    ah_class = PyType_FromModuleAndSpec(module, &AH_type_spec, NULL);
+    if (ah_class == NULL) { return -1; }
+    Py_INCREF(ah_class);
+    rec->adapter_hook_class = TYPE(ah_class);
+
 #endif
 
     /* Add types to our dict FBO python;  also the adapter hooks */
@@ -2774,6 +4316,10 @@ _zic_module_exec(PyObject* module)
         "VerifyingBase", OBJECT(rec->verifying_base_class)) < 0)
         return -1;
 
+    if (PyModule_AddObject(module,
+        "AdapterHook", OBJECT(rec->adapter_hook_class)) < 0)
+        return -1;
+
     if (PyModule_AddObject(module, "adapter_hooks", rec->adapter_hooks) < 0)
         return -1;
 
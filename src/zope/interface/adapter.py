@@ -22,6 +22,7 @@ from zope.interface import providedBy
 from zope.interface import ro
 from zope.interface._compat import _normalize_name
 from zope.interface._compat import _use_c_impl
+from zope.interface.interface import _current_spec_epoch
 from zope.interface.interfaces import IAdapterRegistry
 
 
@@ -61,6 +62,153 @@ __all__ = [
 # ``tuple(map(lambda t: t, range(10)))`` -> 168ns
 
 
+_object_eq = object.__eq__
+_object_ne = object.__ne__
+
+
+def _compares_by_identity(value):
+    # Is *value* equal only to itself (for example, a function or a
+    # class)? Objects like that are found with ``id()``.
+    kind = type(value)
+    return kind.__eq__ is _object_eq and kind.__ne__ is _object_ne
+
+
+class _SubscriberLeaf:
+    """
+    A mutable, ordered leaf sequence of subscribers.
+
+    Subscriber leaves start out as tuples; `BaseAdapterRegistry` switches
+    to this type when a leaf grows past ``_LEAF_TUPLE_MAX`` subscribers.
+    Appending is (amortized) constant time, and so is removing a
+    subscriber that is equal only to itself; other subscribers are
+    found by comparing them with each subscriber in the leaf. Iterating
+    uses a tuple snapshot, so the leaf can be changed while it is
+    being iterated.
+    """
+
+    __slots__ = (
+        # {serial number: subscriber}, in the order of subscription
+        '_items',
+        # {id(subscriber): [serial number]}
+        '_by_id',
+        # The number of subscribers that aren't compared by identity
+        '_others',
+        '_next',
+        # A tuple of the subscribers, or None
+        '_snapshot',
+    )
+
+    def __init__(self, items=()):
+        self._items = {}
+        self._by_id = {}
+        self._others = 0
+        self._next = 0
+        self._snapshot = None
+        for item in items:
+            self.append(item)
+
+    def append(self, item):
+        serial = self._next
+        self._next = serial + 1
+        self._items[serial] = item
+        serials = self._by_id.get(id(item))
+        if serials is None:
+            self._by_id[id(item)] = [serial]
+        else:
+            serials.append(serial)
+        if not _compares_by_identity(item):
+            self._others += 1
+        self._snapshot = None
+
+    def remove(self, item):
+        """
+        Remove all subscribers equal to *item*.
+        """
+        if self._others or not _compares_by_identity(item):
+            self._remove_equal(item)
+            return
+        serials = self._by_id.pop(id(item), ())
+        for serial in serials:
+            del self._items[serial]
+        if serials:
+            self._snapshot = None
+
+    def _remove_equal(self, item):
+        # Let ``tuple.index`` do the comparisons.
+        values = self._tuple()
+        found = []
+        i = 0
+        while True:
+            try:
+                i = values.index(item, i)
+            except ValueError:
+                break
+            found.append(i)
+            i += 1
+        if not found:
+            return
+
+        serials = list(self._items)
+        for i in found:
+            serial = serials[i]
+            value = self._items.pop(serial)
+            same = self._by_id[id(value)]
+            same.remove(serial)
+            if not same:
+                del self._by_id[id(value)]
+            if not _compares_by_identity(value):
+                self._others -= 1
+        self._snapshot = None
+
+    def _tuple(self):
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = tuple(self._items.values())
+        return snapshot
+
+    def __iter__(self):
+        return iter(self._tuple())
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._tuple()[index]
+
+    def __contains__(self, item):
+        if not self._others and _compares_by_identity(item):
+            return id(item) in self._by_id
+        return item in self._tuple()
+
+    def __eq__(self, other):
+        if isinstance(other, _SubscriberLeaf):
+            other = other._tuple()
+        if not isinstance(other, tuple):
+            return NotImplemented
+        return self._tuple() == other
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (self.__class__, (self._tuple(),))
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self._tuple())
+
+
+# Subscriber leaves longer than this become ``_SubscriberLeaf`` objects.
+# Most leaves hold a few subscribers, and tuples are smaller and quicker
+# to iterate; but adding to or removing from a tuple copies it, which
+# makes managing many subscribers for the same interfaces quadratic.
+_LEAF_TUPLE_MAX = 32
+
+
 class BaseAdapterRegistry:
     """
     A basic implementation of the data storage and algorithms required
@@ -91,7 +239,10 @@ class BaseAdapterRegistry:
       loads when subscribers aren't being used. Mutation operations are
       directed through :meth:`_addValueToLeaf` and
       :meth:`_removeValueFromLeaf`; if you use a mutable type, you'll need to
-      override those.
+      override those. (The default implementations of those methods
+      replace tuples that grow large with an internal mutable sequence,
+      so that adding and removing subscribers doesn't take time
+      proportional to the number already there.)
 
     _mappingType = dict
       This is the mutable mapping type used for the keyed mappings.  A
@@ -110,6 +261,18 @@ class BaseAdapterRegistry:
       The same caveats regarding key types
       apply as for ``_mappingType``.
 
+    _weakCacheKeys = False
+      If true, the lookup caches hold the required specifications they
+      are keyed by weakly. Ordinarily they keep every specification
+      they have seen alive until the next change to the registry; with
+      many short-lived specifications, such as the ``Provides`` of
+      objects given marker interfaces with
+      :func:`~zope.interface.alsoProvides`, that memory adds up. Weak
+      keys cost a little time on each lookup. The entries of dead
+      specifications are removed in batches, on later cache misses.
+      ``cache_info()`` reports how many specifications the caches refer
+      to. This is read when the lookup object is created.
+
     It is possible to also set these on an instance, but because of the need
     to potentially also override :meth:`_addValueToLeaf` and
     :meth:`_removeValueFromLeaf`, this may be less useful in a persistent
@@ -121,12 +284,14 @@ class BaseAdapterRegistry:
     .. versionchanged:: 5.3.0
         Add methods :meth:`rebuild`, :meth:`allRegistrations`
         and :meth:`allSubscriptions`.
+    .. versionchanged:: 8.5
+        Add ``_weakCacheKeys`` and the ``cache_info()`` method.
     """
 
     # List of methods copied from lookup sub-objects:
-    _delegated = ('lookup', 'queryMultiAdapter', 'lookup1', 'queryAdapter',
-                  'adapter_hook', 'lookupAll', 'names',
-                  'subscriptions', 'subscribers')
+    _delegated = ('lookup', 'queryMultiAdapter', 'lookup0', 'lookup1',
+                  'queryAdapter', 'adapter_hook', 'lookupAll', 'names',
+                  'subscriptions', 'subscribers', 'cache_info')
 
     # All registries maintain a generation that can be used by verifying
     # registries
@@ -208,6 +373,7 @@ class BaseAdapterRegistry:
     _leafSequenceType = tuple
     _mappingType = dict
     _providedType = dict
+    _weakCacheKeys = False
 
     def _addValueToLeaf(self, existing_leaf_sequence, new_item):
         """
@@ -230,10 +396,20 @@ class BaseAdapterRegistry:
            but it must also return it.
 
         .. versionadded:: 5.3.0
+        .. versionchanged:: 8.5
+           Tuples longer than a few dozen items are replaced with a
+           mutable sequence that is changed in place.
         """
         if existing_leaf_sequence is None:
             return (new_item,)
-        return existing_leaf_sequence + (new_item,)
+        if isinstance(existing_leaf_sequence, _SubscriberLeaf):
+            existing_leaf_sequence.append(new_item)
+            return existing_leaf_sequence
+        if len(existing_leaf_sequence) < _LEAF_TUPLE_MAX:
+            return existing_leaf_sequence + (new_item,)
+        leaf = _SubscriberLeaf(existing_leaf_sequence)
+        leaf.append(new_item)
+        return leaf
 
     def _removeValueFromLeaf(self, existing_leaf_sequence, to_remove):
         """
@@ -245,7 +421,8 @@ class BaseAdapterRegistry:
 
         Subclasses that redefine `_leafSequenceType` should override
         this method. Note that they can call this method to help
-        in their implementation; this implementation will always
+        in their implementation; unless *existing_leaf_sequence* was
+        created by `_addValueToLeaf`, this implementation will always
         return a new tuple constructed by iterating across
         the *existing_leaf_sequence* and omitting items equal to *to_remove*.
 
@@ -261,6 +438,9 @@ class BaseAdapterRegistry:
 
         .. versionadded:: 5.3.0
         """
+        if isinstance(existing_leaf_sequence, _SubscriberLeaf):
+            existing_leaf_sequence.remove(to_remove)
+            return existing_leaf_sequence
         return tuple([v for v in existing_leaf_sequence if v != to_remove])
 
     def changed(self, originally_changed):
@@ -607,20 +787,108 @@ class BaseAdapterRegistry:
 _not_in_mapping = object()
 
 
+def _weak_key(key):
+    """
+    Return the key that caches holding their keys weakly use for *key*,
+    a specification or a tuple of them.
+    """
+    if type(key) is tuple:
+        return tuple([_weak_key(k) for k in key])
+    try:
+        # Without a callback, this is the shared basic reference after
+        # the first time.
+        return weakref.ref(key)
+    except TypeError:
+        return key
+
+
+def _is_dead_key(key):
+    if type(key) is tuple:
+        for k in key:
+            if _is_dead_key(k):
+                return True
+        return False
+    return type(key) is weakref.ref and key() is None
+
+
+def _purge_dead_keys(cache):
+    # Remove the entries of a weakly keyed cache for specifications that
+    # no longer exist. Named lookups are in sub-dictionaries.
+    dead = []
+    for key, value in cache.items():
+        if isinstance(key, str) and isinstance(value, dict):
+            _purge_dead_keys(value)
+        elif _is_dead_key(key):
+            dead.append(key)
+    for key in dead:
+        del cache[key]
+
+
+# Once this many of the specifications a weakly keyed cache refers to
+# have died (or a quarter of them, if that's more), the next cache miss
+# purges their entries.
+_DEAD_SPEC_PURGE_MIN = 64
+
+
+class _DeadSpecCounter:
+    # The callback of the weak references a weakly keyed lookup keeps to
+    # the specifications it has cached. Specifications can die many at
+    # a time (when a large structure is freed), so this only counts.
+
+    __slots__ = ('count',)
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, ref):
+        self.count += 1
+
+
 @_use_c_impl
 class LookupBase:
 
+    # If true, the caches are keyed by weak references to the required
+    # specifications; see ``BaseAdapterRegistry._weakCacheKeys``.
+    _weak_keys = False
+
     def __init__(self):
         self._cache = {}
         self._mcache = {}
         self._scache = {}
+        # Results of lookup0: {provided or (provided, name): result}.
+        # These don't depend on any required specification, so unlike
+        # the other caches they stay valid when one changes, but
+        # changed() clears them all the same.
+        self._ucache = {}
+        # The spec epoch our caches are known to be current for.
+        self._epoch = 0
 
     def changed(self, ignored=None):
         self._cache.clear()
         self._mcache.clear()
         self._scache.clear()
+        self._ucache.clear()
+
+    def _specs_changed_since(self, epoch):
+        # Whether a specification our caches are keyed by has changed
+        # since the spec epoch was *epoch*. Subclasses that keep track
+        # of those specifications can do better than this.
+        return True
+
+    def _assure_current(self):
+        # The caches depend on the specifications they are keyed by. When
+        # an existing specification has changed (which moves the spec
+        # epoch), check whether it's one of those.
+        epoch = _current_spec_epoch()
+        if self._epoch != epoch:
+            # Empty caches can't be stale.
+            if self._cache or self._mcache or self._scache:
+                if self._specs_changed_since(self._epoch):
+                    self.changed(None)
+            self._epoch = epoch
 
     def _getcache(self, provided, name):
+        self._assure_current()
         cache = self._cache.get(provided)
         if cache is None:
             cache = {}
@@ -639,16 +907,30 @@ class LookupBase:
         cache = self._getcache(provided, name)
         required = tuple(required)
         if len(required) == 1:
-            result = cache.get(required[0], _not_in_mapping)
+            key = required[0]
         else:
-            result = cache.get(tuple(required), _not_in_mapping)
+            key = required
+        if self._weak_keys:
+            key = _weak_key(key)
+        result = cache.get(key, _not_in_mapping)
 
         if result is _not_in_mapping:
             result = self._uncached_lookup(required, provided, name)
-            if len(required) == 1:
-                cache[required[0]] = result
-            else:
-                cache[tuple(required)] = result
+            cache[key] = result
+
+        if result is None:
+            return default
+
+        return result
+
+    def lookup0(self, provided, name='', default=None):
+        if not isinstance(name, str):
+            raise ValueError('name is not a string')
+        key = (provided, name) if name else provided
+        result = self._ucache.get(key, _not_in_mapping)
+        if result is _not_in_mapping:
+            result = self._ucache[key] = self._uncached_lookup(
+                (), provided, name)
 
         if result is None:
             return default
@@ -659,7 +941,10 @@ class LookupBase:
         if not isinstance(name, str):
             raise ValueError('name is not a string')
         cache = self._getcache(provided, name)
-        result = cache.get(required, _not_in_mapping)
+        if self._weak_keys:
+            result = cache.get(_weak_key(required), _not_in_mapping)
+        else:
+            result = cache.get(required, _not_in_mapping)
         if result is _not_in_mapping:
             return self.lookup((required, ), provided, name, default)
 
@@ -676,7 +961,10 @@ class LookupBase:
             raise ValueError('name is not a string')
         required = providedBy(object)
         cache = self._getcache(provided, name)
-        factory = cache.get(required, _not_in_mapping)
+        if self._weak_keys:
+            factory = cache.get(_weak_key(required), _not_in_mapping)
+        else:
+            factory = cache.get(required, _not_in_mapping)
         if factory is _not_in_mapping:
             factory = self.lookup((required, ), provided, name)
 
@@ -689,31 +977,48 @@ class LookupBase:
 
         return default
 
+    def queryMultiAdapter(self, objects, provided, name='', default=None):
+        factory = self.lookup([providedBy(o) for o in objects], provided, name)
+        if factory is None:
+            return default
+
+        result = factory(*[
+            o.__self__ if isinstance(o, super) else o for o in objects
+        ])
+        if result is None:
+            return default
+
+        return result
+
     def lookupAll(self, required, provided):
+        self._assure_current()
         cache = self._mcache.get(provided)
         if cache is None:
             cache = {}
             self._mcache[provided] = cache
 
         required = tuple(required)
-        result = cache.get(required, _not_in_mapping)
+        key = _weak_key(required) if self._weak_keys else required
+        result = cache.get(key, _not_in_mapping)
         if result is _not_in_mapping:
             result = self._uncached_lookupAll(required, provided)
-            cache[required] = result
+            cache[key] = result
 
         return result
 
     def subscriptions(self, required, provided):
+        self._assure_current()
         cache = self._scache.get(provided)
         if cache is None:
             cache = {}
             self._scache[provided] = cache
 
         required = tuple(required)
-        result = cache.get(required, _not_in_mapping)
+        key = _weak_key(required) if self._weak_keys else required
+        result = cache.get(key, _not_in_mapping)
         if result is _not_in_mapping:
             result = self._uncached_subscriptions(required, provided)
-            cache[required] = result
+            cache[key] = result
 
         return result
 
@@ -744,6 +1049,12 @@ class VerifyingBase(LookupBaseFallback):  # noqa F821
             self, provided, name,
         )
 
+    def lookup0(self, provided, name='', default=None):
+        self._verify()
+        return LookupBaseFallback.lookup0(  # noqa F821
+            self, provided, name, default,
+        )
+
     def lookupAll(self, required, provided):
         self._verify()
         return LookupBaseFallback.lookupAll(  # noqa F821
@@ -761,17 +1072,61 @@ class AdapterLookupBase:
 
     def __init__(self, registry):
         self._registry = registry
+        # {weak reference: 1} for the specifications our caches are
+        # keyed by. With weak keys, the values are references with a
+        # callback instead, which count deaths.
         self._required = {}
+        # {(provided, order, subscriptions?): ((components, extendors),)}
+        self._ro_index = {}
+        self._dead_specs = _DeadSpecCounter()
+        self._weak_keys = bool(getattr(registry, '_weakCacheKeys', False))
         self.init_extendors()
         super().__init__()
 
     def changed(self, ignored=None):
         super().changed(None)
-        for r in self._required.keys():
-            r = r()
-            if r is not None:
-                r.unsubscribe(self)
+        self._ro_index.clear()
         self._required.clear()
+        self._dead_specs.count = 0
+
+    def cache_info(self):
+        """
+        Return a dictionary describing the specifications our caches
+        are keyed by.
+
+        ``specifications`` is the number that still exist (with strong
+        cache keys, the caches keep all of them alive); ``dead``, the
+        number that have been garbage collected but whose entries haven't
+        been purged yet; ``weak_keys``, whether the keys are weak.
+
+        .. versionadded:: 8.5
+        """
+        live = 0
+        for ref in self._required:
+            if ref() is not None:
+                live += 1
+        return {
+            'specifications': live,
+            'dead': len(self._required) - live,
+            'weak_keys': self._weak_keys,
+        }
+
+    def _specs_changed_since(self, epoch):
+        for ref in self._required:
+            spec = ref()
+            if spec is not None and spec._generation > epoch:
+                return True
+        return False
+
+    def _purge(self):
+        self._dead_specs.count = 0
+        _refs = self._required
+        for ref in [ref for ref in _refs if ref() is None]:
+            del _refs[ref]
+        for cache in (self._cache, self._mcache, self._scache):
+            if cache:
+                for subcache in cache.values():
+                    _purge_dead_keys(subcache)
 
     # Extendors
     # ---------
@@ -821,27 +1176,67 @@ class AdapterLookupBase:
                              if e != provided]
 
     def _subscribe(self, *required):
+        # Remember the specifications our caches are keyed by, so we
+        # notice when they change (see ``_specs_changed_since``). Their
+        # basic weak references are shared, so after the first time this
+        # doesn't allocate anything.
         _refs = self._required
-        for r in required:
-            ref = r.weakref()
-            if ref not in _refs:
-                r.subscribe(self)
-                _refs[ref] = 1
+        if self._weak_keys:
+            # We're called on cache misses, when it's safe to change the
+            # caches, so this is where entries for dead specifications
+            # are removed, in batches.
+            callback = self._dead_specs
+            if callback.count >= max(_DEAD_SPEC_PURGE_MIN, len(_refs) >> 2):
+                self._purge()
+            for r in required:
+                ref = r.weakref()
+                if ref not in _refs:
+                    _refs[ref] = r.weakref(callback)
+        else:
+            for r in required:
+                ref = r.weakref()
+                if ref not in _refs:
+                    _refs[ref] = 1
+
+    def _registries_for(self, provided, order, subscriptions=False):
+        """
+        Return the ``(components, extendors)`` of the registries in our
+        registry's resolution order that can have adapters (or, if
+        *subscriptions* is true, subscribers) for *order* required
+        specifications and *provided*.
+
+        Most registries in a deep chain of local registries have nothing
+        for most interfaces; this way, misses skip them without looking
+        at each one. The result is kept until the next `changed`.
+        """
+        key = (provided, order, subscriptions)
+        result = self._ro_index.get(key)
+        if result is None:
+            result = []
+            for registry in self._registry.ro:
+                if subscriptions:
+                    byorder = registry._subscribers
+                else:
+                    byorder = registry._adapters
+                if order >= len(byorder) or not byorder[order]:
+                    continue
+
+                if subscriptions and provided is None:
+                    extendors = (provided, )
+                else:
+                    extendors = registry._v_lookup._extendors.get(provided)
+                    if not extendors:
+                        continue
+
+                result.append((byorder[order], extendors))
+            result = self._ro_index[key] = tuple(result)
+        return result
 
     def _uncached_lookup(self, required, provided, name=''):
         required = tuple(required)
         result = None
         order = len(required)
-        for registry in self._registry.ro:
-            byorder = registry._adapters
-            if order >= len(byorder):
-                continue
-
-            extendors = registry._v_lookup._extendors.get(provided)
-            if not extendors:
-                continue
-
-            components = byorder[order]
+        for components, extendors in self._registries_for(provided, order):
             result = _lookup(components, required, extendors, name, 0,
                              order)
             if result is not None:
@@ -851,31 +1246,16 @@ class AdapterLookupBase:
 
         return result
 
-    def queryMultiAdapter(self, objects, provided, name='', default=None):
-        factory = self.lookup([providedBy(o) for o in objects], provided, name)
-        if factory is None:
-            return default
-
-        result = factory(*[
-            o.__self__ if isinstance(o, super) else o for o in objects
-        ])
-        if result is None:
-            return default
-
-        return result
+    # For lookups that aren't combined with LookupBase.
+    queryMultiAdapter = LookupBaseFallback.queryMultiAdapter  # noqa F821
 
     def _uncached_lookupAll(self, required, provided):
         required = tuple(required)
         order = len(required)
         result = {}
-        for registry in reversed(self._registry.ro):
-            byorder = registry._adapters
-            if order >= len(byorder):
-                continue
-            extendors = registry._v_lookup._extendors.get(provided)
-            if not extendors:
-                continue
-            components = byorder[order]
+        for components, extendors in reversed(
+            self._registries_for(provided, order)
+        ):
             _lookupAll(components, required, extendors, result, 0, order)
 
         self._subscribe(*required)
@@ -889,19 +1269,10 @@ class AdapterLookupBase:
         required = tuple(required)
         order = len(required)
         result = []
-        for registry in reversed(self._registry.ro):
-            byorder = registry._subscribers
-            if order >= len(byorder):
-                continue
-
-            if provided is None:
-                extendors = (provided, )
-            else:
-                extendors = registry._v_lookup._extendors.get(provided)
-                if extendors is None:
-                    continue
-
-            _subscriptions(byorder[order], required, extendors, '',
+        for components, extendors in reversed(
+            self._registries_for(provided, order, True)
+        ):
+            _subscriptions(components, required, extendors, '',
                            result, 0, order)
 
         self._subscribe(*required)
@@ -926,7 +1297,8 @@ class AdapterLookupBase:
 
 
 class AdapterLookup(AdapterLookupBase, LookupBase):
-    pass
+    # AdapterLookupBase comes first, but this may be implemented in C.
+    queryMultiAdapter = LookupBase.queryMultiAdapter
 
 
 @implementer(IAdapterRegistry)
@@ -971,7 +1343,7 @@ class AdapterRegistry(BaseAdapterRegistry):
 
 
 class VerifyingAdapterLookup(AdapterLookupBase, VerifyingBase):
-    pass
+    queryMultiAdapter = VerifyingBase.queryMultiAdapter
 
 
 @implementer(IAdapterRegistry)
@@ -11,10 +11,12 @@
 ##############################################################################
 
 import itertools
+import os
 from types import FunctionType
 
 from zope.interface import Interface
 from zope.interface import classImplements
+from zope.interface.declarations import _classImplementsDeferred
 from zope.interface.interface import InterfaceClass
 from zope.interface.interface import _decorator_non_return
 from zope.interface.interface import fromFunction
@@ -63,6 +65,13 @@ class ABCInterfaceClass(InterfaceClass):
     interface definition defines ``extra_classes``, it should be a
     tuple giving additional classes to declare implement the interface.
 
+    If `DEFER_REGISTRATION` is true, those declarations are only made
+    when a specification for the class is first needed (for example,
+    by ``implementedBy`` or ``providedBy``). That avoids computing
+    specifications and resolution orders at import time for classes
+    that are never asked about, but the interface's ``dependents``
+    won't include classes that haven't been asked about yet.
+
     Note that this is not fully symmetric. For example, it is usually
     the case that a subclass relationship carries the interface
     declarations over::
@@ -112,6 +121,8 @@ class ABCInterfaceClass(InterfaceClass):
     do so.
 
     .. versionadded:: 5.0.0
+    .. versionchanged:: 8.5
+       Add `DEFER_REGISTRATION`.
     """
 
     # If we could figure out invalidation, and used some special
@@ -119,6 +130,15 @@ class ABCInterfaceClass(InterfaceClass):
     # ``providedBy`` here, perhaps we could more closely integrate with ABC
     # virtual inheritance?
 
+    #: Whether to defer declaring that registered classes implement
+    #: the interface until their specification is needed. This is
+    #: true if the environment variable
+    #: ``ZOPE_INTERFACE_DEFER_ABC_REGISTRATION`` is set to "1" when
+    #: this module is imported.
+    DEFER_REGISTRATION = (
+        os.environ.get('ZOPE_INTERFACE_DEFER_ABC_REGISTRATION', '') == '1'
+    )
+
     def __init__(self, name, bases, attrs):
         # go ahead and give us a name to ease debugging.
         self.__name__ = name
@@ -236,10 +256,14 @@ class ABCInterfaceClass(InterfaceClass):
             ignored_classes if ignored_classes is not None
             else self.__ignored_classes
         )
+        declare = (
+            _classImplementsDeferred if self.DEFER_REGISTRATION
+            else classImplements
+        )
         for cls in conformers:
             if cls in ignored:
                 continue
-            classImplements(cls, self)
+            declare(cls, self)
 
     def getABC(self):
         """
@@ -101,6 +101,38 @@ def _get_FrameLocalsProxy():
     return type(sys._getframe().f_locals)
 
 
+class TestDeferRegistration(unittest.TestCase):
+
+    def test_defer_registration(self):
+        from abc import ABC
+
+        from zope.interface import implementedBy
+        from zope.interface.common import ABCInterface
+        from zope.interface.common import ABCInterfaceClass
+        from zope.interface.declarations import _deferred_class_implements
+
+        class Thing(ABC):
+            pass
+
+        class Concrete:
+            pass
+
+        Thing.register(Concrete)
+        self.addCleanup(
+            setattr, ABCInterfaceClass, 'DEFER_REGISTRATION',
+            ABCInterfaceClass.DEFER_REGISTRATION)
+        ABCInterfaceClass.DEFER_REGISTRATION = True
+
+        class IThing(ABCInterface):
+            abc = Thing
+
+        self.assertIn(Concrete, IThing.getRegisteredConformers())
+        self.assertNotIn('__implemented__', Concrete.__dict__)
+        self.assertEqual(_deferred_class_implements[Concrete], [IThing])
+        self.assertTrue(IThing.providedBy(Concrete()))
+        self.assertEqual(list(implementedBy(Concrete)), [IThing])
+
+
 class TestVerifyObject(VerifyObjectMixin,
                        TestVerifyClass):
     CONSTRUCTORS = {
@@ -73,6 +73,113 @@ class named:
         return ob
 
 
+def _extends_any(iface, others):
+    # Does *iface* extend (non-strictly) anything in the set *others*?
+    # That's the case exactly when its ``_implied`` keys, which are its
+    # resolution order, intersect *others*, which we can find out
+    # without calling ``extends`` for every pair.
+    try:
+        implied = iface._implied
+    except AttributeError:
+        # Probably a proxy.
+        return any(iface.extends(other, False) for other in others)
+    return not implied.keys().isdisjoint(others)
+
+
+def _subtract(spec, other):
+    removed = set(other.interfaces())
+    return [
+        i for i in spec.interfaces()
+        if not _extends_any(i, removed)
+    ]
+
+
+def _add(spec, other):
+    before = []
+    result = list(spec.interfaces())
+    seen = set(result)
+    in_result = set(result)
+    for i in other.interfaces():
+        if i in seen:
+            continue
+        seen.add(i)
+        # ``i`` isn't in ``in_result``, so this is a strict extends.
+        if _extends_any(i, in_result):
+            # It already extends us, e.g., is a subclass,
+            # so it needs to go at the front of the RO.
+            before.append(i)
+        else:
+            result.append(i)
+            in_result.add(i)
+    return before + result
+
+
+class _Memo:
+    # Memoized results of ``Declaration`` arithmetic for one
+    # specification: ``{(op, id(other)): (ref(other), bases, sro)}``,
+    # where *sro* is the resolution order of the result without the
+    # result itself. The keys use identity because interfaces compare
+    # equal by name. The results depend on the interface hierarchy, so
+    # the memo is a dependent of the specifications it has results for
+    # and forgets everything when one of them changes.
+
+    __slots__ = (
+        'results',
+        '__weakref__',
+    )
+
+    def __init__(self):
+        self.results = {}
+
+    def changed(self, originally_changed):
+        self.results.clear()
+
+
+# ``{spec: _Memo}``
+_memo = weakref.WeakKeyDictionary()
+
+
+def _memo_for(spec):
+    try:
+        memo = _memo.get(spec)
+        if memo is None:
+            memo = _memo[spec] = _Memo()
+            spec.subscribe(memo)
+    except TypeError:
+        # Not weakly referenceable (or hashable), e.g., a proxy.
+        return None
+    return memo
+
+
+def _memoized_arithmetic(spec, op, other, compute):
+    # Callers may change the bases of the result, so each call gets a
+    # new declaration, made from the remembered bases and resolution
+    # order.
+    memo = _memo_for(spec)
+    if memo is None or not hasattr(other, 'subscribe'):
+        return Declaration(*compute(spec, other))
+    results = memo.results
+    key = (op, id(other))
+    entry = results.get(key)
+    if entry is not None and entry[0]() is other:
+        return _DeclarationResult(entry[1], entry[2])
+
+    def _discard(ref, results=results, key=key):
+        if results.get(key, (None,))[0] is ref:
+            del results[key]
+
+    try:
+        ref = weakref.ref(other, _discard)
+    except TypeError:
+        return Declaration(*compute(spec, other))
+
+    result = Declaration(*compute(spec, other))
+    if memo not in other.dependents:
+        other.subscribe(memo)
+    results[key] = (ref, result.__bases__, result.__sro__[1:])
+    return result
+
+
 class Declaration(Specification):
     """Interface declarations"""
 
@@ -85,7 +192,7 @@ class Declaration(Specification):
         """Test whether an interface is in the specification
         """
 
-        return self.extends(interface) and interface in self.interfaces()
+        return self.extends(interface) and interface in self.interfacesTuple
 
     def __iter__(self):
         """Return an iterator for the interfaces in the specification
@@ -100,14 +207,7 @@ class Declaration(Specification):
     def __sub__(self, other):
         """Remove interfaces from a specification
         """
-        return Declaration(*[
-            i for i in self.interfaces()
-            if not [
-                j
-                for j in other.interfaces()
-                if i.extends(j, 0)  # non-strict extends
-            ]
-        ])
+        return _memoized_arithmetic(self, '-', other, _subtract)
 
     def __add__(self, other):
         """
@@ -120,21 +220,12 @@ class Declaration(Specification):
            resolution order if they already extend an interface in this
            object. Previously, they were always added to the end of the order,
            which easily resulted in invalid orders.
+
+        .. versionchanged:: 8.5
+           The bases of the result are memoized for as long as neither
+           operand changes.
         """
-        before = []
-        result = list(self.interfaces())
-        seen = set(result)
-        for i in other.interfaces():
-            if i in seen:
-                continue
-            seen.add(i)
-            if any(i.extends(x) for x in result):
-                # It already extends us, e.g., is a subclass,
-                # so it needs to go at the front of the RO.
-                before.append(i)
-            else:
-                result.append(i)
-        return Declaration(*(before + result))
+        return _memoized_arithmetic(self, '+', other, _add)
 
     # XXX: Is __radd__ needed? No tests break if it's removed.
     # If it is needed, does it need to handle the C3 ordering differently?
@@ -194,6 +285,27 @@ class Declaration(Specification):
         return ', '.join(ordered_names)
 
 
+class _DeclarationResult(Declaration):
+    # A repeated result of ``Declaration`` arithmetic. It starts out
+    # with the memoized resolution order of the first result instead of
+    # computing it again; after that, it's an ordinary declaration.
+
+    __slots__ = (
+        '_memoized_sro',
+    )
+
+    def __init__(self, bases, sro):
+        self._memoized_sro = sro
+        Declaration.__init__(self, *bases)
+
+    def _calculate_sro(self):
+        sro = self._memoized_sro
+        if sro is None:
+            return Declaration._calculate_sro(self)
+        self._memoized_sro = None
+        return (self,) + sro
+
+
 class _ImmutableDeclaration(Declaration):
     # A Declaration that is immutable. Used as a singleton to
     # return empty answers for things like ``implementedBy``.
@@ -244,6 +356,10 @@ class _ImmutableDeclaration(Declaration):
         # An empty iterator
         return iter(())
 
+    @property
+    def interfacesTuple(self):
+        return ()
+
     def extends(self, interface, strict=True):
         return interface is self._ROOT
 
@@ -305,19 +421,29 @@ class Implements(NameAndModuleComparisonMixin,
     # implements` (which will call proxy.__eq__ to do the unwrapping) and then
     # (2) the default equality and hashing semantics being identity based.
 
-    # class whose specification should be used as additional base
-    inherit = None
-
-    # interfaces actually declared for a class
-    declared = ()
-
-    # Weak cache of {class: <implements>} for super objects.
-    # Created on demand. These are rare, as of 5.0 anyway. Using a class
-    # level default doesn't take space in instances. Using _v_attrs would be
-    # another place to store this without taking space unless needed.
-    _super_cache = None
+    __slots__ = (
+        # class whose specification should be used as additional base
+        'inherit',
+        # interfaces actually declared for a class
+        'declared',
+        # Cache of {class: <implements>} for super objects. Created on
+        # demand. These are rare, as of 5.0 anyway. The keys are classes
+        # in the MRO of ``self.inherit``, which we already (indirectly)
+        # keep alive, so a plain dict, bounded by the length of that MRO,
+        # is enough. It's read directly by the C implementation of
+        # ``implementedBy``.
+        '_super_cache',
+        '__name__',
+    )
 
-    __name__ = '?'
+    def __init__(self, *bases):
+        self.inherit = None
+        self.declared = ()
+        self._super_cache = None
+        if not hasattr(self, '__name__'):
+            # ``named()`` sets this first.
+            self.__name__ = '?'
+        Declaration.__init__(self, *bases)
 
     @classmethod
     def named(cls, name, *bases):
@@ -332,10 +458,7 @@ class Implements(NameAndModuleComparisonMixin,
         return inst
 
     def changed(self, originally_changed):
-        try:
-            del self._super_cache
-        except AttributeError:
-            pass
+        self._super_cache = None
         return super().changed(originally_changed)
 
     def __repr__(self):
@@ -375,8 +498,8 @@ def _implements_name(ob):
 
 
 def _implementedBy_super(sup):
-    # TODO: This is now simple enough we could probably implement
-    # in C if needed.
+    # The C implementation of ``implementedBy`` answers cache hits
+    # itself and only calls us on a miss.
 
     # If the class MRO is strictly linear, we could just
     # follow the normal algorithm for the next class in the
@@ -389,7 +512,7 @@ def _implementedBy_super(sup):
     implemented_by_self = implementedBy(sup.__self_class__)
     cache = implemented_by_self._super_cache  # pylint:disable=protected-access
     if cache is None:
-        cache = implemented_by_self._super_cache = weakref.WeakKeyDictionary()
+        cache = implemented_by_self._super_cache = {}
 
     key = sup.__thisclass__
     try:
@@ -490,7 +613,10 @@ def implementedBy(
                 raise TypeError("ImplementedBy called for non-factory", cls)
             bases = ()
 
-        spec = Implements.named(spec_name, *[implementedBy(c) for c in bases])
+        declared, bases = _deferred_declarations(
+            cls, [implementedBy(c) for c in bases])
+        spec = Implements.named(spec_name, *bases)
+        spec.declared = declared
         spec.inherit = cls
 
     try:
@@ -509,9 +635,85 @@ def implementedBy(
             raise TypeError("ImplementedBy called for non-type", cls)
         BuiltinImplementationSpecifications[cls] = spec
 
+    if _deferred_class_implements:
+        # Only old-style declarations get here with anything deferred.
+        _apply_deferred_class_implements(cls)
+
     return spec
 
 
+# {cls: [interface]} for ``classImplements`` calls that have been
+# deferred with ``_classImplementsDeferred`` until the first time
+# ``implementedBy(cls)`` has to create a spec, which then includes them
+# from the start.
+_deferred_class_implements = weakref.WeakKeyDictionary()
+
+
+def _has_implements_spec(cls):
+    try:
+        spec = cls.__dict__.get('__implemented__')
+    except AttributeError:
+        spec = None
+    if isinstance(spec, Implements):
+        return True
+    try:
+        return cls in BuiltinImplementationSpecifications
+    except TypeError:
+        return False
+
+
+def _classImplementsDeferred(cls, interface):
+    """
+    Like ``classImplements(cls, interface)``, but if *cls* doesn't
+    have a specification yet, wait until something asks for one.
+
+    This avoids computing specifications and resolution orders for
+    classes nobody asks about. Deferred declarations are applied in
+    the order they were made.
+    """
+    if _has_implements_spec(cls):
+        classImplements(cls, interface)
+    else:
+        _deferred_class_implements.setdefault(cls, []).append(interface)
+
+
+def _apply_deferred_class_implements(cls):
+    try:
+        interfaces = _deferred_class_implements.pop(cls, None)
+    except TypeError:
+        # Not hashable or weakly referenceable; can't have
+        # anything deferred.
+        return
+    for iface in interfaces or ():
+        classImplements(cls, iface)
+
+
+def _deferred_declarations(cls, inherited):
+    # Return the ``declared`` interfaces and ``__bases__`` for a new
+    # spec of *cls* that inherits the specs *inherited*: the result
+    # of applying any deferred ``classImplements`` calls to it, in
+    # order, without creating and changing the spec.
+    bases = tuple(inherited)
+    if not _deferred_class_implements:
+        return (), bases
+    try:
+        interfaces = _deferred_class_implements.pop(cls, None)
+    except TypeError:
+        # Not hashable or weakly referenceable; can't have
+        # anything deferred.
+        interfaces = None
+
+    declared = ()
+    for iface in interfaces or ():
+        def isOrExtends(x, bases=bases):
+            # Every spec implies the root, and whatever its bases do.
+            return x is Interface or any(b.isOrExtends(x) for b in bases)
+        before, after = _classImplements_partition(declared, (iface,))
+        declared, bases = _ordered_declarations(
+            isOrExtends, declared, cls, before, after)
+    return declared, bases
+
+
 def classImplementsOnly(cls, *interfaces):
     """
     Declare the only interfaces implemented by instances of a class
@@ -563,6 +765,13 @@ def classImplements(cls, *interfaces):
        never been supported).
     """
     spec = implementedBy(cls)
+    before, after = _classImplements_partition(spec.declared, interfaces)
+    _classImplements_ordered(spec, before, after)
+
+
+def _classImplements_partition(declared, interfaces):
+    # Split *interfaces* into those to add before and after the
+    # *declared* interfaces for ``classImplements``.
     interfaces = tuple(_normalizeargs(interfaces))
 
     before = []
@@ -572,13 +781,13 @@ def classImplements(cls, *interfaces):
     # order, while still allowing for BWC (in the past, we always
     # appended)
     for iface in interfaces:
-        for b in spec.declared:
+        for b in declared:
             if iface.extends(b):
                 before.append(iface)
                 break
         else:
             after.append(iface)
-    _classImplements_ordered(spec, tuple(before), tuple(after))
+    return tuple(before), tuple(after)
 
 
 def classImplementsFirst(cls, iface):
@@ -596,6 +805,17 @@ def classImplementsFirst(cls, iface):
 
 
 def _classImplements_ordered(spec, before=(), after=()):
+    spec.declared, bases = _ordered_declarations(
+        spec.isOrExtends, spec.declared, spec.inherit, before, after)
+    spec.__bases__ = bases
+
+
+def _ordered_declarations(isOrExtends, declared, inherit, before, after):
+    # Return the new ``declared`` interfaces and ``__bases__`` of the
+    # spec of *inherit* (which may be None) that currently declares
+    # *declared*, when *before* and *after* are added to them.
+    # *isOrExtends* is the spec's method of that name.
+
     # Elide everything already inherited.
     # Except, if it is the root, and we don't already declare anything else
     # that would imply it, allow the root through. (TODO: When we disallow
@@ -604,36 +824,36 @@ def _classImplements_ordered(spec, before=(), after=()):
     before = [
         x
         for x in before
-        if not spec.isOrExtends(x) or (x is Interface and not spec.declared)
+        if not isOrExtends(x) or (x is Interface and not declared)
     ]
     after = [
         x
         for x in after
-        if not spec.isOrExtends(x) or (x is Interface and not spec.declared)
+        if not isOrExtends(x) or (x is Interface and not declared)
     ]
 
     # eliminate duplicates
     new_declared = []
     seen = set()
-    for lst in before, spec.declared, after:
+    for lst in before, declared, after:
         for b in lst:
             if b not in seen:
                 new_declared.append(b)
                 seen.add(b)
 
-    spec.declared = tuple(new_declared)
+    declared = tuple(new_declared)
 
     # compute the bases
     bases = new_declared  # guaranteed no dupes
 
-    if spec.inherit is not None:
-        for c in spec.inherit.__bases__:
+    if inherit is not None:
+        for c in inherit.__bases__:
             b = implementedBy(c)
             if b not in seen:
                 seen.add(b)
                 bases.append(b)
 
-    spec.__bases__ = tuple(bases)
+    return declared, tuple(bases)
 
 
 def _implements_advice(cls):
@@ -745,16 +965,21 @@ class Provides(Declaration):  # Really named ProvidesClass
     When an object is pickled, we pickle the interfaces that it implements.
     """
 
+    __slots__ = (
+        '__args',
+        '_cls',
+        # Added to by ``moduleProvides``, et al
+        '_v_module_names',
+    )
+
     def __init__(self, cls, *interfaces):
         self.__args = (cls, ) + interfaces
         self._cls = cls
+        self._v_module_names = ()
         Declaration.__init__(
             self, *self._add_interfaces_to_cls(interfaces, cls)
         )
 
-    # Added to by ``moduleProvides``, et al
-    _v_module_names = ()
-
     def __repr__(self):
         # The typical way to create instances of this object is via calling
         # ``directlyProvides(...)`` or ``alsoProvides()``, but that's not the
@@ -18,7 +18,6 @@ import sys
 import weakref
 from types import FunctionType
 from types import MethodType
-from typing import Union
 
 from zope.interface import ro
 from zope.interface._compat import _use_c_impl
@@ -31,6 +30,7 @@ __all__ = [
     # from zope.interface. The only remaining public API intended to
     # be imported from here should be those few things documented as
     # such.
+    'AdapterHook',
     'InterfaceClass',
     'Specification',
     'adapter_hooks',
@@ -151,8 +151,11 @@ class SpecificationBase:
         '_dependents',
         '_bases',
         '_v_attrs',
+        '_v_all_attrs',
+        '_v_interfaces',
         '__iro__',
         '__sro__',
+        '_generation',
         '__weakref__',
     )
 
@@ -177,6 +180,73 @@ class SpecificationBase:
 
     __call__ = isOrExtends
 
+    @property
+    def interfacesTuple(self):
+        """A tuple of the interfaces in the specification.
+
+        This is what :meth:`interfaces` iterates. It is computed
+        by ``_calculate_interfaces`` and cached until the
+        specification changes.
+        """
+        # pylint:disable=no-member
+        try:
+            result = self._v_interfaces
+        except AttributeError:
+            result = None
+        if result is None:
+            result = self._calculate_interfaces()
+        return result
+
+    def interfaces(self):
+        """Return an iterator for the interfaces in the specification.
+        """
+        return iter(self.interfacesTuple)
+
+    def filterIsOrExtends(self, interfaces):
+        """Return a tuple of the *interfaces* that this is or extends.
+
+        This is a bulk version of :meth:`isOrExtends`.
+        """
+        implied = self._implied
+        return tuple([iface for iface in interfaces if iface in implied])
+
+    def get(self, name, default=None):
+        """Query for an attribute description
+
+        Names are cached one at a time in ``_v_attrs``. Names that
+        aren't cached yet are looked up in a map of every name defined
+        by the interfaces this specification implies, computed by
+        ``_calculate_attrs`` and cached in ``_v_all_attrs`` until the
+        specification changes.
+        """
+        # pylint:disable=no-member
+        try:
+            attrs = self._v_attrs
+        except AttributeError:
+            attrs = None
+        if attrs is None:
+            attrs = self._v_attrs = {}
+        attr = attrs.get(name)
+        if attr is None:
+            try:
+                all_attrs = self._v_all_attrs
+            except AttributeError:
+                all_attrs = None
+            if all_attrs is None:
+                all_attrs = self._calculate_attrs()
+            attr = all_attrs.get(name)
+            if attr is not None:
+                attrs[name] = attr
+        return default if attr is None else attr
+
+
+def _intern(name):
+    # The names and modules of interfaces are their identity; interning
+    # them makes equal ones identical, which speeds up comparisons.
+    if type(name) is str:
+        name = sys.intern(name)
+    return name
+
 
 class NameAndModuleComparisonMixin:
     # Internal use. Implement the basic sorting operators (but not (in)equality
@@ -269,8 +339,8 @@ class InterfaceBase(NameAndModuleComparisonMixin, SpecificationBasePy):
     )
 
     def __init__(self, name=None, module=None):
-        self.__name__ = name
-        self.__ibmodule__ = module
+        self.__name__ = _intern(name)
+        self.__ibmodule__ = _intern(module)
 
     def _call_conform(self, conform):
         raise NotImplementedError
@@ -323,24 +393,96 @@ class InterfaceBase(NameAndModuleComparisonMixin, SpecificationBasePy):
         return self._v_cached_hash
 
     def __eq__(self, other):
-        c = self._compare(other)
-        if c is NotImplemented:
-            return c
-        return c == 0
-
-    def __ne__(self, other):
         if other is self:
+            return True
+        if other is None:
             return False
+        try:
+            name = other.__name__
+            module = other.__module__
+        except AttributeError:
+            return NotImplemented
+        # This is what ``_compare`` would decide, without making tuples.
+        # Names and modules are interned, so when they are equal they
+        # are usually also identical, and ``==`` doesn't have to look at
+        # their characters.
+        return self.__name__ == name and self.__module__ == module
 
-        c = self._compare(other)
-        if c is NotImplemented:
-            return c
-        return c != 0
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
 
 
 adapter_hooks = _use_c_impl([], 'adapter_hooks')
 
 
+@_use_c_impl
+class AdapterHook:
+    """
+    A hook for `adapter_hooks` that is only consulted for some
+    interfaces.
+
+    *hook* is called as ``hook(interface, object)``. If *provided* is
+    not empty, it is the interfaces that the adapters returned by *hook*
+    provide, and *hook* is only called when adapting to one of them or
+    to an interface they extend; for other interfaces the hook returns
+    None without calling it.
+
+    ``calls``, ``hits`` and ``skips`` count the times *hook* was called,
+    the times it returned an adapter and the times it was skipped.
+
+    .. versionadded:: 8.5
+    """
+
+    __slots__ = (
+        'hook',
+        'provided',
+        'calls',
+        'hits',
+        'skips',
+    )
+
+    def __init__(self, hook, provided=()):
+        self.hook = hook
+        self.provided = tuple(provided)
+        self.calls = self.hits = self.skips = 0
+
+    def __call__(self, iface, obj):
+        if self.provided:
+            for p in self.provided:
+                if p.isOrExtends(iface):
+                    break
+            else:
+                self.skips += 1
+                return None
+        self.calls += 1
+        adapter = self.hook(iface, obj)
+        if adapter is not None:
+            self.hits += 1
+        return adapter
+
+
+# Incremented whenever an *existing* specification changes (see
+# ``Specification.changed``), which records the new value as its
+# ``_generation``. The adapter lookup caches compare against it to
+# notice that a specification they are keyed by may have changed.
+_spec_epoch = 0
+
+
+@_use_c_impl
+def _bump_spec_epoch():
+    global _spec_epoch
+    _spec_epoch += 1
+    return _spec_epoch
+
+
+@_use_c_impl
+def _current_spec_epoch():
+    return _spec_epoch
+
+
 class Specification(SpecificationBase):
     """Specifications
 
@@ -376,8 +518,11 @@ class Specification(SpecificationBase):
         self._bases = ()
         self._implied = {}
         self._v_attrs = None
+        self._v_all_attrs = None
+        self._v_interfaces = None
         self.__iro__ = ()
         self.__sro__ = ()
+        self._generation = 0
 
         self.__bases__ = tuple(bases)
 
@@ -489,19 +634,26 @@ class Specification(SpecificationBase):
         such as our bases, should themselves be stable.
         """
         self._v_attrs = None
+        self._v_all_attrs = None
+        self._v_interfaces = None
+        if self.__sro__:
+            # Not our initial computation.
+            self._generation = _bump_spec_epoch()
 
         implied = self._implied
         implied.clear()
 
         ancestors = self._calculate_sro()
-        self.__sro__ = tuple(ancestors)
-        self.__iro__ = tuple([ancestor for ancestor in ancestors
-                              if isinstance(ancestor, InterfaceClass)
-                              ])
+        self.__sro__ = sro = tuple(ancestors)
+        iro = tuple([ancestor for ancestor in ancestors
+                     if isinstance(ancestor, InterfaceClass)
+                     ])
+        # For interfaces, and many declarations, these are the same;
+        # share the tuple.
+        self.__iro__ = sro if len(iro) == len(sro) else iro
 
-        for ancestor in ancestors:
-            # We directly imply our ancestors:
-            implied[ancestor] = ()
+        # We directly imply our ancestors:
+        implied.update(dict.fromkeys(ancestors, ()))
 
         # Now, advise our dependents of change
         # (being careful not to create the WeakKeyDictionary if not needed):
@@ -514,16 +666,18 @@ class Specification(SpecificationBase):
         # during that process and we have a cycle of some sort
         # make sure we didn't cache incomplete results.
         self._v_attrs = None
+        self._v_all_attrs = None
 
-    def interfaces(self):
-        """Return an iterator for the interfaces in the specification.
+    def _calculate_interfaces(self):
+        """Compute and cache the ``interfacesTuple`` of this object.
         """
         seen = {}
         for base in self.__bases__:
             for interface in base.interfaces():
                 if interface not in seen:
                     seen[interface] = 1
-                    yield interface
+        self._v_interfaces = result = tuple(seen)
+        return result
 
     def extends(self, interface, strict=True):
         """Does the specification extend the given interface?
@@ -540,21 +694,20 @@ class Specification(SpecificationBase):
     def weakref(self, callback=None):
         return weakref.ref(self, callback)
 
-    def get(self, name, default=None):
-        """Query for an attribute description
+    def _calculate_attrs(self):
+        """Compute and cache the map of all attribute names to
+        descriptions used by ``get``.
+
+        Each name is described by the first interface in ``__iro__``
+        that defines it, and the names are in that order, too.
         """
-        attrs = self._v_attrs
-        if attrs is None:
-            attrs = self._v_attrs = {}
-        attr = attrs.get(name)
-        if attr is None:
-            for iface in self.__iro__:
-                attr = iface.direct(name)
-                if attr is not None:
+        attrs = {}
+        for iface in self.__iro__:
+            for name, attr in iface.namesAndDescriptions():
+                if name not in attrs:
                     attrs[name] = attr
-                    break
-
-        return default if attr is None else attr
+        self._v_all_attrs = attrs
+        return attrs
 
 
 class _InterfaceMetaClass(type):
@@ -689,6 +842,28 @@ def interfacemethod(func):
     return _decorator_non_return
 
 
+# Entries in the namespace of a ``class`` statement that aren't
+# attributes of the interface.
+_IGNORED_CLASS_ATTRS = frozenset((
+    # __locals__: Python 3 sometimes adds this.
+    '__locals__',
+    # __qualname__: PEP 3155 (Python 3.3+)
+    '__qualname__',
+    # __annotations__: PEP 3107 (Python 3.0+)
+    '__annotations__',
+    # __static_attributes__: Python 3.13a6+
+    # https://github.com/python/cpython/pull/115913
+    '__static_attributes__',
+    # __firstlineno__: Python 3.13b1+
+    # https://github.com/python/cpython/pull/118475
+    '__firstlineno__',
+    # __classdictcell__: Python 3.14
+    '__classdictcell__',
+    # __annotate_func__: Python 3.14b1+
+    '__annotate_func__',
+))
+
+
 class InterfaceClass(_InterfaceClassBase):
     """
     Prototype (scarecrow) Interfaces Implementation.
@@ -755,6 +930,7 @@ class InterfaceClass(_InterfaceClassBase):
         if attrs is None:
             attrs = {}
 
+        name = _intern(name)
         if __module__ is None:
             __module__ = attrs.get('__module__')
             if isinstance(__module__, str):
@@ -812,31 +988,18 @@ class InterfaceClass(_InterfaceClassBase):
         return {
             aname: update_value(aname, aval)
             for aname, aval in attrs.items()
-            if aname not in (
-                # __locals__: Python 3 sometimes adds this.
-                '__locals__',
-                # __qualname__: PEP 3155 (Python 3.3+)
-                '__qualname__',
-                # __annotations__: PEP 3107 (Python 3.0+)
-                '__annotations__',
-                # __static_attributes__: Python 3.13a6+
-                # https://github.com/python/cpython/pull/115913
-                '__static_attributes__',
-                # __firstlineno__: Python 3.13b1+
-                # https://github.com/python/cpython/pull/118475
-                '__firstlineno__',
-                # __classdictcell__: Python 3.14
-                '__classdictcell__',
-                # __annotate_func__: Python 3.14b1+
-                '__annotate_func__',
-            ) and
+            if aname not in _IGNORED_CLASS_ATTRS and
             aval is not _decorator_non_return  # noqa W503
         }
 
     def interfaces(self):
         """Return an iterator for the interfaces in the specification.
         """
-        yield self
+        return iter((self,))
+
+    @property
+    def interfacesTuple(self):
+        return (self,)
 
     def getBases(self):
         return self.__bases__
@@ -845,17 +1008,47 @@ class InterfaceClass(_InterfaceClassBase):
         """Same interface or extends?"""
         return self == other or other.extends(self)
 
+    def _all_attrs(self):
+        attrs = self._v_all_attrs
+        if attrs is None:
+            attrs = self._calculate_attrs()
+        return attrs
+
+    def _calculate_attrs(self):
+        # Like Specification._calculate_attrs, but the names are in
+        # the order namesAndDescriptions(all=True) has always used:
+        # those of the bases, the last base first, then our own.
+        attrs = {}
+        for base in self.__bases__[::-1]:
+            attrs.update(base.namesAndDescriptions(all=True))
+        # The interfaces earlier in __iro__ win, as they do for get.
+        for iface in self.__iro__[::-1]:
+            attrs.update(iface.namesAndDescriptions())
+        self._v_all_attrs = attrs
+        return attrs
+
     def names(self, all=False):  # pylint:disable=redefined-builtin
         """Return the attribute names defined by the interface."""
         if not all:
             return self.__attrs.keys()
 
+        # Our own names, then those of each base in turn. This depends
+        # on the bases, so it's cached along with the map of all
+        # attributes, which changed() discards.
+        attrs = self._all_attrs()
+        cached = self.__dict__.get('_v_all_names')
+        if cached is not None and cached[0] is attrs:
+            return cached[1]
+
         r = self.__attrs.copy()
 
         for base in self.__bases__:
             r.update(dict.fromkeys(base.names(all)))
 
-        return r.keys()
+        names = r.keys()
+        # pylint:disable=attribute-defined-outside-init
+        self._v_all_names = attrs, names
+        return names
 
     def __iter__(self):
         return iter(self.names(all=True))
@@ -867,13 +1060,7 @@ class InterfaceClass(_InterfaceClassBase):
         if not all:
             return self.__attrs.items()
 
-        r = {}
-        for base in self.__bases__[::-1]:
-            r.update(dict(base.namesAndDescriptions(all)))
-
-        r.update(self.__attrs)
-
-        return r.items()
+        return self._all_attrs().items()
 
     def getDescriptionFor(self, name):
         """Return the attribute description for the given name."""
@@ -977,10 +1164,13 @@ class InterfaceClass(_InterfaceClassBase):
 
     def __or__(self, other):
         """Allow type hinting syntax: Interface | None."""
+        # typing is expensive to import and rarely needed at runtime.
+        from typing import Union
         return Union[self, other]
 
     def __ror__(self, other):
         """Allow type hinting syntax: None | Interface."""
+        from typing import Union
         return Union[other, self]
 
 
@@ -1036,6 +1226,68 @@ class Attribute(Element):
         )
 
 
+class _SignatureInfo(tuple):
+    """
+    The computed signature information of a `Method`:
+    ``(positional, required, optional, varargs, kwargs)``.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def fromSource(cls, argcount, flags, names, defaults, defaults_count):
+        # Number of positional arguments
+        na = argcount
+        # Number of required arguments
+        nr = na - defaults_count
+        if nr < 0:
+            defaults = defaults[-nr:]
+            nr = 0
+
+        # Determine the optional arguments.
+        opt = dict(zip(names[nr:], defaults))
+
+        argno = na
+
+        # Determine the function's variable argument's name (i.e. *args)
+        varargs = None
+        if flags & CO_VARARGS:
+            varargs = names[argno]
+            argno = argno + 1
+
+        # Determine the function's keyword argument's name (i.e. **kw)
+        kwargs = None
+        if flags & CO_VARKEYWORDS:
+            kwargs = names[argno]
+
+        positional = names[:na]
+        required = positional if nr == na else names[:nr]
+        return cls((positional, required, opt, varargs, kwargs))
+
+
+class _LazySignatureInfo:
+    """
+    One item of a `Method`'s signature information, computed the first
+    time any of it is used.
+
+    This is a non-data descriptor, so assigning the attribute of an
+    instance overrides it.
+    """
+
+    def __init__(self, index, default):
+        self.index = index
+        self.default = default
+
+    def __get__(self, inst, cls):
+        if inst is None:
+            return self.default
+        info = inst._signature
+        if info is None:
+            return self.default
+        if type(info) is not _SignatureInfo:
+            info = inst._signature = _SignatureInfo.fromSource(*info)
+        return info[self.index]
+
+
 class Method(Attribute):
     """Method interfaces
 
@@ -1048,8 +1300,17 @@ class Method(Attribute):
     #
     # implements(IMethod)
 
-    positional = required = ()
-    _optional = varargs = kwargs = None
+    positional = _LazySignatureInfo(0, ())
+    required = _LazySignatureInfo(1, ())
+    _optional = _LazySignatureInfo(2, None)
+    varargs = _LazySignatureInfo(3, None)
+    kwargs = _LazySignatureInfo(4, None)
+
+    # Set by `fromFunction` to what's needed to compute the signature
+    # information: (argument count, code flags, argument names,
+    # defaults, defaults count). That's replaced by the
+    # `_SignatureInfo` when it's first used.
+    _signature = None
 
     def _get_optional(self):
         if self._optional is None:
@@ -1096,11 +1357,6 @@ def fromFunction(func, interface=None, imlevel=0, name=None):
     method = Method(name, func.__doc__)
     defaults = getattr(func, '__defaults__', None) or ()
     code = func.__code__
-    # Number of positional arguments
-    na = code.co_argcount - imlevel
-    names = code.co_varnames[imlevel:]
-    opt = {}
-    # Number of required arguments
     defaults_count = len(defaults)
     if not defaults_count:
         # PyPy3 uses ``__defaults_count__`` for builtin methods
@@ -1108,33 +1364,16 @@ def fromFunction(func, interface=None, imlevel=0, name=None):
         # ``__defaults__``
         defaults_count = getattr(func, '__defaults_count__', 0)
 
-    nr = na - defaults_count
-    if nr < 0:
-        defaults = defaults[-nr:]
-        nr = 0
-
-    # Determine the optional arguments.
-    opt.update(dict(zip(names[nr:], defaults)))
-
-    method.positional = names[:na]
-    method.required = names[:nr]
-    method.optional = opt
-
-    argno = na
-
-    # Determine the function's variable argument's name (i.e. *args)
-    if code.co_flags & CO_VARARGS:
-        method.varargs = names[argno]
-        argno = argno + 1
-    else:
-        method.varargs = None
-
-    # Determine the function's keyword argument's name (i.e. **kw)
-    if code.co_flags & CO_VARKEYWORDS:
-        method.kwargs = names[argno]
-    else:
-        method.kwargs = None
-
+    # The signature information is only computed when it's asked for
+    # (mostly by `zope.interface.verify`); until then, only keep what's
+    # needed for that, not the whole function or code object.
+    method._signature = (
+        code.co_argcount - imlevel,
+        code.co_flags,
+        code.co_varnames[imlevel:],
+        defaults,
+        defaults_count,
+    )
     method.interface = interface
 
     for key, value in func.__dict__.items():
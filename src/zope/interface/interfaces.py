@@ -858,6 +858,15 @@ class IAdapterRegistry(Interface):
         """Adapt a sequence of objects to a named, provided, interface
         """
 
+    def lookup0(provided, name='', default=None):
+        """Lookup a value that requires no interfaces
+
+        This is the same as ``lookup((), provided, name, default)``,
+        which is how utilities are looked up, but faster.
+
+        .. versionadded:: 8.5
+        """
+
     def lookup1(required, provided, name='', default=None):
         """Lookup a value using a single required interface
 
@@ -1247,11 +1256,20 @@ class IComponentRegistry(Interface):
         An `IUnregistered` event is generated with an `IUtilityRegistration`.
         """
 
-    def registeredUtilities():
+    def registeredUtilities(provided=None, name=None, subinterfaces=False):
         """Return an iterable of `IUtilityRegistration` instances.
 
         These registrations describe the current utility registrations
         in the object.
+
+        If *provided* or *name* are given, only the registrations that
+        match them are returned. If *subinterfaces* is true,
+        registrations of interfaces that extend *provided* match too.
+        Matching registrations are found without looking at the others.
+
+        .. versionchanged:: 8.5
+           Add the optional *provided*, *name* and *subinterfaces*
+           arguments.
         """
 
     def registerAdapter(factory, required=None, provided=None, name='',
@@ -1331,11 +1349,23 @@ class IComponentRegistry(Interface):
         An `IUnregistered` event is generated with an `IAdapterRegistration`.
         """
 
-    def registeredAdapters():
+    def registeredAdapters(required=None, provided=None, name=None,
+                           subinterfaces=False):
         """Return an iterable of `IAdapterRegistration` instances.
 
         These registrations describe the current adapter registrations
         in the object.
+
+        If *required* (a sequence of specifications, in which None
+        matches any specification), *provided* or *name* are given,
+        only the registrations that match all of them are returned. If
+        *subinterfaces* is true, registrations providing interfaces
+        that extend *provided* match too. Matching registrations are
+        found without looking at the others.
+
+        .. versionchanged:: 8.5
+           Add the optional *required*, *provided*, *name* and
+           *subinterfaces* arguments.
         """
 
     def registerSubscriptionAdapter(factory, required=None, provides=None,
@@ -1422,11 +1452,21 @@ class IComponentRegistry(Interface):
         `ISubscriptionAdapterRegistration`.
         """
 
-    def registeredSubscriptionAdapters():
+    def registeredSubscriptionAdapters(required=None, provided=None,
+                                       factory=None):
         """Return an iterable of `ISubscriptionAdapterRegistration` instances.
 
         These registrations describe the current subscription adapter
         registrations in the object.
+
+        If any of *required* (a sequence of specifications, in which
+        None matches any specification), *provided* or *factory* are
+        given, only the registrations that match all of them are
+        returned, in registration order.
+
+        .. versionchanged:: 8.5
+           Add the optional *required*, *provided* and *factory*
+           arguments.
         """
 
     def registerHandler(handler, required=None, name='', info=''):
@@ -1500,11 +1540,19 @@ class IComponentRegistry(Interface):
         An `IUnregistered` event is generated with an `IHandlerRegistration`.
         """
 
-    def registeredHandlers():
+    def registeredHandlers(required=None, factory=None):
         """Return an iterable of `IHandlerRegistration` instances.
 
         These registrations describe the current handler registrations
         in the object.
+
+        If *required* (a sequence of specifications, in which None
+        matches any specification) or *factory* are given, only the
+        registrations that match them are returned, in registration
+        order.
+
+        .. versionchanged:: 8.5
+           Add the optional *required* and *factory* arguments.
         """
 
 
@@ -13,6 +13,7 @@
 ##############################################################################
 """Basic components support
 """
+from bisect import bisect_left
 from collections import defaultdict
 
 
@@ -47,32 +48,81 @@ __all__ = [
 ]
 
 
+_REMOVED = object()
+
+
 class _UnhashableComponentCounter:
-    # defaultdict(int)-like object for unhashable components
+    # defaultdict(int)-like object for unhashable components.
+    #
+    # Components are found by identity; only when that misses are they
+    # compared for equality, and then by ``list.index`` rather than a
+    # loop in Python.
 
     def __init__(self, otherdict):
-        # [(component, count)]
-        self._data = [item for item in otherdict.items()]
+        # {id(component): [position in _components, count]}
+        # _components keeps the components alive, so the ids stay valid.
+        self._by_id = {}
+        # Removed components are replaced by _REMOVED until there are
+        # enough of those to be worth compacting.
+        self._components = []
+        self._removed = 0
+        for component, count in otherdict.items():
+            self[component] = count
+
+    def _find(self, component):
+        entry = self._by_id.get(id(component))
+        if entry is not None:
+            return entry
+        components = self._components
+        start = 0
+        while True:
+            try:
+                i = components.index(component, start)
+            except ValueError:
+                return None
+            if components[i] is not _REMOVED:
+                return self._by_id[id(components[i])]
+            start = i + 1  # pragma: no cover
 
     def __getitem__(self, key):
-        for component, count in self._data:
-            if component == key:
-                return count
-        return 0
+        entry = self._find(key)
+        return 0 if entry is None else entry[1]
+
+    def increment(self, component):
+        # ``self[component] += 1``, looking the component up only once.
+        # Return the count before incrementing.
+        entry = self._find(component)
+        if entry is None:
+            self._by_id[id(component)] = [len(self._components), 1]
+            self._components.append(component)
+            return 0
+        entry[1] += 1
+        return entry[1] - 1
 
     def __setitem__(self, component, count):
-        for i, data in enumerate(self._data):
-            if data[0] == component:
-                self._data[i] = component, count
-                return
-        self._data.append((component, count))
+        entry = self._find(component)
+        if entry is None:
+            self._by_id[id(component)] = [len(self._components), count]
+            self._components.append(component)
+        else:
+            entry[1] = count
 
     def __delitem__(self, component):
-        for i, data in enumerate(self._data):
-            if data[0] == component:
-                del self._data[i]
-                return
-        raise KeyError(component)  # pragma: no cover
+        entry = self._find(component)
+        if entry is None:
+            raise KeyError(component)  # pragma: no cover
+        components = self._components
+        i = entry[0]
+        del self._by_id[id(components[i])]
+        components[i] = _REMOVED
+        self._removed += 1
+        if self._removed * 2 > len(components):
+            components = self._components = [
+                c for c in components if c is not _REMOVED
+            ]
+            for i, c in enumerate(components):
+                self._by_id[id(c)][0] = i
+            self._removed = 0
 
 
 def _defaultdict_int():
@@ -95,15 +145,19 @@ class _UtilityRegistrations:
             self.__cache_utility(p, component)
 
     def __cache_utility(self, provided, component):
+        # Return whether the component was already cached.
+        prov = self._cache[provided]
+        if isinstance(prov, _UnhashableComponentCounter):
+            return prov.increment(component) > 0
         try:
-            self._cache[provided][component] += 1
+            count = prov[component]
         except TypeError:
             # The component is not hashable, and we have a dict. Switch to a
             # strategy that doesn't use hashing.
-            prov = self._cache[provided] = _UnhashableComponentCounter(
-                self._cache[provided]
-            )
-            prov[component] += 1
+            prov = self._cache[provided] = _UnhashableComponentCounter(prov)
+            return prov.increment(component) > 0
+        prov[component] = count + 1
+        return count > 0
 
     def __uncache_utility(self, provided, component):
         provided = self._cache[provided]
@@ -128,18 +182,18 @@ class _UtilityRegistrations:
             return False
 
     def registerUtility(self, provided, name, component, info, factory):
-        subscribed = self._is_utility_subscribed(provided, component)
-
         self._utility_registrations[
             (provided, name)
         ] = component, info, factory
         self._utilities.register((), provided, name, component)
 
+        # Caching first finds out whether the component is already
+        # subscribed without looking it up twice; that matters for
+        # unhashable components, which are compared with all the others.
+        subscribed = self.__cache_utility(provided, component)
         if not subscribed:
             self._utilities.subscribe((), provided, component)
 
-        self.__cache_utility(provided, component)
-
     def unregisterUtility(self, provided, name, component):
         del self._utility_registrations[(provided, name)]
         self._utilities.unregister((), provided, name)
@@ -150,10 +204,269 @@ class _UtilityRegistrations:
             self._utilities.unsubscribe((), provided, component)
 
 
+_no_registrations = {}
+
+
+class _SubscriptionRegistrations:
+    """
+    Indexes the registration tuples of subscription adapters or of
+    handlers (the lists ``Components._subscription_registrations`` and
+    ``Components._handler_registrations``), which are still what is
+    stored.
+
+    Registrations are found by their required and provided
+    specifications or by their factory without looking at the others,
+    and their positions in the list are found by a binary search on the
+    order in which they were added.
+
+    *generation* is the ``Components._registrations_generation`` the
+    index is built for.
+    """
+
+    def __init__(self, registrations, provided_index, generation):
+        self._registrations = registrations
+        self.generation = generation
+        # Where the provided specification and the factory are in the
+        # registration tuples. Handlers provide None.
+        self._provided_index = provided_index
+        self._factory_index = 2 if provided_index is None else 3
+        # {id(registration): serial number}
+        self._serials = {}
+        self._next = 0
+        # {(required, provided): {serial number: registration}}
+        self._by_key = {}
+        # {factory: {serial number: registration}}
+        self._by_factory = {}
+        # The number of registrations of unhashable factories, which
+        # aren't in _by_factory.
+        self._unhashable = 0
+        for data in registrations:
+            self._index(data)
+
+    def _key(self, data):
+        if self._provided_index is None:
+            return data[0], None
+        return data[0], data[self._provided_index]
+
+    def _index(self, data):
+        serial = self._next
+        self._next = serial + 1
+        self._serials[id(data)] = serial
+        key = self._key(data)
+        by_key = self._by_key.get(key)
+        if by_key is None:
+            by_key = self._by_key[key] = {}
+        by_key[serial] = data
+        factory = data[self._factory_index]
+        try:
+            by_factory = self._by_factory.get(factory)
+        except TypeError:
+            self._unhashable += 1
+        else:
+            if by_factory is None:
+                by_factory = self._by_factory[factory] = {}
+            by_factory[serial] = data
+
+    def is_current(self, registrations, generation):
+        # Our own changes keep the index current; a list that was
+        # replaced or changed by something else has to be indexed again.
+        return (
+            generation == self.generation and
+            registrations is self._registrations and
+            len(registrations) == len(self._serials)
+        )
+
+    def add(self, data):
+        self._registrations.append(data)
+        self._index(data)
+
+    def find(self, required=None, provided=None, factory=None):
+        """
+        Return the registrations, in order, for *required*, *provided*
+        and *factory* (any of which may be None to match anything).
+        """
+        candidates = []
+        if required is not None and (
+            provided is not None or self._provided_index is None
+        ) and all(r is not None for r in required):
+            candidates.append(
+                self._by_key.get((required, provided), _no_registrations))
+        if factory is not None and not self._unhashable:
+            try:
+                candidates.append(
+                    self._by_factory.get(factory, _no_registrations))
+            except TypeError:
+                pass
+        if candidates:
+            candidates = min(candidates, key=len).values()
+        else:
+            candidates = self._registrations
+
+        provided_index = self._provided_index
+        factory_index = self._factory_index
+        return [
+            data for data in candidates
+            if (required is None or _requiredMatches(required, data[0])) and
+            (provided is None or data[provided_index] == provided) and
+            (factory is None or data[factory_index] == factory)
+        ]
+
+    def _serial(self, data):
+        return self._serials[id(data)]
+
+    def remove(self, registrations):
+        """
+        Remove *registrations*, which were returned by `find`.
+        """
+        stored = self._registrations
+        for data in registrations:
+            serial = self._serials[id(data)]
+            i = bisect_left(stored, serial, key=self._serial)
+            if i == len(stored) or stored[i] is not data:  # pragma: no cover
+                # Shouldn't happen, but don't remove the wrong thing.
+                i = [id(d) for d in stored].index(id(data))
+            del stored[i]
+            del self._serials[id(data)]
+
+            key = self._key(data)
+            by_key = self._by_key[key]
+            del by_key[serial]
+            if not by_key:
+                del self._by_key[key]
+
+            factory = data[self._factory_index]
+            try:
+                by_factory = self._by_factory.get(factory)
+            except TypeError:
+                self._unhashable -= 1
+            else:
+                del by_factory[serial]
+                if not by_factory:
+                    del self._by_factory[factory]
+
+
+class _KeyedRegistrations:
+    """
+    Indexes the keys of the adapter or utility registrations (the
+    dicts ``Components._adapter_registrations`` and
+    ``Components._utility_registrations``) by their provided interface,
+    their name and each of their required specifications.
+
+    The index is only built when it is first queried; after that, the
+    methods of `Components` that change the registrations keep it
+    current. *generation* is the ``Components._registrations_generation``
+    the index is built for.
+    """
+
+    def __init__(self, registrations, provided_index, generation):
+        self._registrations = registrations
+        self.generation = generation
+        # Where the provided interface is in the keys: adapters are
+        # (required, provided, name), utilities (provided, name).
+        self._provided_index = provided_index
+        self._count = 0
+        # {provided: {key: None}}
+        self._by_provided = {}
+        # {name: {key: None}}
+        self._by_name = {}
+        # {(position, required specification): {key: None}}
+        self._by_required = {}
+        for key in registrations:
+            self.add(key)
+
+    def _buckets(self, key):
+        i = self._provided_index
+        yield self._by_provided, key[i]
+        yield self._by_name, key[i + 1]
+        if i:
+            for position_and_spec in enumerate(key[0]):
+                yield self._by_required, position_and_spec
+
+    def is_current(self, registrations, generation):
+        return (
+            generation == self.generation and
+            registrations is self._registrations and
+            len(registrations) == self._count
+        )
+
+    def add(self, key):
+        if key in self._by_provided.get(key[self._provided_index], ()):
+            # Replacing an existing registration.
+            return
+        self._count += 1
+        for index, k in self._buckets(key):
+            bucket = index.get(k)
+            if bucket is None:
+                bucket = index[k] = {}
+            bucket[key] = None
+
+    def remove(self, key):
+        if key not in self._by_provided.get(key[self._provided_index], ()):
+            return
+        self._count -= 1
+        for index, k in self._buckets(key):
+            bucket = index[k]
+            del bucket[key]
+            if not bucket:
+                del index[k]
+
+    def find(self, required=None, provided=None, name=None,
+             subinterfaces=False):
+        """
+        Iterate the ``(key, value)`` pairs of the registrations that
+        match all of *required*, *provided* and *name* (each of which
+        may be None to match anything).
+
+        If *subinterfaces* is true, registrations providing interfaces
+        that extend *provided* match too.
+        """
+        if provided is not None and subinterfaces:
+            for p in [p for p in self._by_provided if p.isOrExtends(provided)]:
+                yield from self.find(required, p, name)
+            return
+
+        candidates = []
+        if provided is not None:
+            candidates.append(
+                self._by_provided.get(provided, _no_registrations))
+        if name is not None:
+            candidates.append(self._by_name.get(name, _no_registrations))
+        if required is not None:
+            for position_and_spec in enumerate(required):
+                if position_and_spec[1] is not None:
+                    candidates.append(self._by_required.get(
+                        position_and_spec, _no_registrations))
+        if candidates:
+            # Copy the (small) bucket so that callers can change the
+            # registrations as they go.
+            keys = tuple(min(candidates, key=len))
+        else:
+            keys = self._registrations
+
+        registrations = self._registrations
+        i = self._provided_index
+        for key in keys:
+            if (
+                (provided is None or key[i] == provided) and
+                (name is None or key[i + 1] == name) and
+                (required is None or _requiredMatches(required, key[0]))
+            ):
+                value = registrations.get(key)
+                if value is not None:
+                    yield key, value
+
+
 @implementer(IComponents)
 class Components:
 
     _v_utility_registrations_cache = None
+    _v_utility_registrations_index = None
+    _v_adapter_registrations_index = None
+    _v_subscription_registrations_index = None
+    _v_handler_registrations_index = None
+    # Incremented by each change our methods make to the registrations;
+    # see _registrations_changed.
+    _registrations_generation = 0
 
     def __init__(self, name='', bases=()):
         # __init__ is used for test cleanup as well as initialization.
@@ -164,6 +477,10 @@ class Components:
         self._init_registrations()
         self.__bases__ = tuple(bases)
         self._v_utility_registrations_cache = None
+        self._v_utility_registrations_index = None
+        self._v_adapter_registrations_index = None
+        self._v_subscription_registrations_index = None
+        self._v_handler_registrations_index = None
 
     def __repr__(self):
         return f"<{self.__class__.__name__} {self.__name__}>"
@@ -212,6 +529,70 @@ class Components:
             )
         return cache
 
+    @property
+    def _utility_registrations_index(self):
+        # Like _utility_registrations_cache, this can't be pickled.
+        index = self._v_utility_registrations_index
+        registrations = self._utility_registrations
+        generation = self._registrations_generation
+        if index is None or not index.is_current(registrations, generation):
+            index = self._v_utility_registrations_index = (
+                _KeyedRegistrations(registrations, 0, generation)
+            )
+        return index
+
+    @property
+    def _adapter_registrations_index(self):
+        index = self._v_adapter_registrations_index
+        registrations = self._adapter_registrations
+        generation = self._registrations_generation
+        if index is None or not index.is_current(registrations, generation):
+            index = self._v_adapter_registrations_index = (
+                _KeyedRegistrations(registrations, 1, generation)
+            )
+        return index
+
+    @property
+    def _subscription_registrations_index(self):
+        index = self._v_subscription_registrations_index
+        registrations = self._subscription_registrations
+        generation = self._registrations_generation
+        if index is None or not index.is_current(registrations, generation):
+            index = self._v_subscription_registrations_index = (
+                _SubscriptionRegistrations(registrations, 1, generation)
+            )
+        return index
+
+    @property
+    def _handler_registrations_index(self):
+        index = self._v_handler_registrations_index
+        registrations = self._handler_registrations
+        generation = self._registrations_generation
+        if index is None or not index.is_current(registrations, generation):
+            index = self._v_handler_registrations_index = (
+                _SubscriptionRegistrations(registrations, None, generation)
+            )
+        return index
+
+    def _registrations_changed(self):
+        # Called after our methods have changed the registrations and
+        # the indexes of them. The generation is part of our state, so
+        # when the registrations are persistent, changing them changes
+        # us too; if they are reloaded (after an abort, or a commit in
+        # another connection), so are we, and the indexes in our _v_
+        # attributes are dropped. Otherwise, indexes that don't know
+        # the current generation are rebuilt when next used.
+        old = self._registrations_generation
+        self._registrations_generation = new = old + 1
+        for index in (
+            self._v_utility_registrations_index,
+            self._v_adapter_registrations_index,
+            self._v_subscription_registrations_index,
+            self._v_handler_registrations_index,
+        ):
+            if index is not None and index.generation == old:
+                index.generation = new
+
     def _getBases(self):
         # Subclasses might override
         return self.__dict__.get('__bases__', ())
@@ -251,6 +632,11 @@ class Components:
 
         self._utility_registrations_cache.registerUtility(
             provided, name, component, info, factory)
+        # The index is built on demand; once it is, keep it current.
+        index = self._v_utility_registrations_index
+        if index is not None:
+            index.add((provided, name))
+        self._registrations_changed()
 
         if event:
             notify(Registered(
@@ -282,6 +668,10 @@ class Components:
         # Note that component is now the old thing registered
         self._utility_registrations_cache.unregisterUtility(
             provided, name, component)
+        index = self._v_utility_registrations_index
+        if index is not None:
+            index.remove((provided, name))
+        self._registrations_changed()
 
         notify(Unregistered(
             UtilityRegistration(self, provided, name, component, *old[1:])
@@ -289,16 +679,21 @@ class Components:
 
         return True
 
-    def registeredUtilities(self):
-        for ((provided, name), data
-             ) in iter(self._utility_registrations.items()):
+    def registeredUtilities(self, provided=None, name=None,
+                            subinterfaces=False):
+        if provided is None and name is None:
+            registrations = self._utility_registrations.items()
+        else:
+            registrations = self._utility_registrations_index.find(
+                None, provided, name, subinterfaces)
+        for ((provided, name), data) in registrations:
             yield UtilityRegistration(self, provided, name, *data)
 
     def queryUtility(self, provided, name='', default=None):
-        return self.utilities.lookup((), provided, name, default)
+        return self.utilities.lookup0(provided, name, default)
 
     def getUtility(self, provided, name=''):
-        utility = self.utilities.lookup((), provided, name)
+        utility = self.utilities.lookup0(provided, name)
         if utility is None:
             raise ComponentLookupError(provided, name)
         return utility
@@ -318,6 +713,10 @@ class Components:
             name = _getName(factory)
         self._adapter_registrations[(required, provided, name)
                                     ] = factory, info
+        index = self._v_adapter_registrations_index
+        if index is not None:
+            index.add((required, provided, name))
+        self._registrations_changed()
         self.adapters.register(required, provided, name, factory)
 
         if event:
@@ -345,6 +744,10 @@ class Components:
             return False
 
         del self._adapter_registrations[(required, provided, name)]
+        index = self._v_adapter_registrations_index
+        if index is not None:
+            index.remove((required, provided, name))
+        self._registrations_changed()
         self.adapters.unregister(required, provided, name)
 
         notify(Unregistered(
@@ -353,9 +756,17 @@ class Components:
 
         return True
 
-    def registeredAdapters(self):
+    def registeredAdapters(self, required=None, provided=None, name=None,
+                           subinterfaces=False):
+        if required is None and provided is None and name is None:
+            registrations = self._adapter_registrations.items()
+        else:
+            if required is not None:
+                required = _getRequiredQuery(required)
+            registrations = self._adapter_registrations_index.find(
+                required, provided, name, subinterfaces)
         for ((required, provided, name), (component, info)
-             ) in iter(self._adapter_registrations.items()):
+             ) in registrations:
             yield AdapterRegistration(self, required, provided, name,
                                       component, info)
 
@@ -396,9 +807,10 @@ class Components:
         if provided is None:
             provided = _getAdapterProvided(factory)
         required = _getAdapterRequired(factory, required)
-        self._subscription_registrations.append(
+        self._subscription_registrations_index.add(
             (required, provided, name, factory, info)
         )
+        self._registrations_changed()
         self.adapters.subscribe(required, provided, factory)
 
         if event:
@@ -408,8 +820,17 @@ class Components:
                 )
             ))
 
-    def registeredSubscriptionAdapters(self):
-        for data in self._subscription_registrations:
+    def registeredSubscriptionAdapters(
+        self, required=None, provided=None, factory=None,
+    ):
+        if required is None and provided is None and factory is None:
+            registrations = self._subscription_registrations
+        else:
+            if required is not None:
+                required = _getRequiredQuery(required)
+            registrations = self._subscription_registrations_index.find(
+                required, provided, factory)
+        for data in registrations:
             yield SubscriptionRegistration(self, *data)
 
     def unregisterSubscriptionAdapter(
@@ -427,23 +848,13 @@ class Components:
 
         required = _getAdapterRequired(factory, required)
 
-        if factory is None:
-            new = [(r, p, n, f, i)
-                   for (r, p, n, f, i)
-                   in self._subscription_registrations
-                   if not (r == required and p == provided)
-                   ]
-        else:
-            new = [(r, p, n, f, i)
-                   for (r, p, n, f, i)
-                   in self._subscription_registrations
-                   if not (r == required and p == provided and f == factory)
-                   ]
-
-        if len(new) == len(self._subscription_registrations):
+        index = self._subscription_registrations_index
+        old = index.find(required, provided, factory)
+        if not old:
             return False
 
-        self._subscription_registrations[:] = new
+        index.remove(old)
+        self._registrations_changed()
         self.adapters.unsubscribe(required, provided, factory)
 
         notify(Unregistered(
@@ -464,9 +875,10 @@ class Components:
         if name:
             raise TypeError("Named handlers are not yet supported")
         required = _getAdapterRequired(factory, required)
-        self._handler_registrations.append(
+        self._handler_registrations_index.add(
             (required, name, factory, info)
         )
+        self._registrations_changed()
         self.adapters.subscribe(required, None, factory)
 
         if event:
@@ -474,8 +886,15 @@ class Components:
                 HandlerRegistration(self, required, name, factory, info)
             ))
 
-    def registeredHandlers(self):
-        for data in self._handler_registrations:
+    def registeredHandlers(self, required=None, factory=None):
+        if required is None and factory is None:
+            registrations = self._handler_registrations
+        else:
+            if required is not None:
+                required = _getRequiredQuery(required)
+            registrations = self._handler_registrations_index.find(
+                required, None, factory)
+        for data in registrations:
             yield HandlerRegistration(self, *data)
 
     def unregisterHandler(self, factory=None, required=None, name=''):
@@ -487,23 +906,13 @@ class Components:
 
         required = _getAdapterRequired(factory, required)
 
-        if factory is None:
-            new = [(r, n, f, i)
-                   for (r, n, f, i)
-                   in self._handler_registrations
-                   if r != required
-                   ]
-        else:
-            new = [(r, n, f, i)
-                   for (r, n, f, i)
-                   in self._handler_registrations
-                   if not (r == required and f == factory)
-                   ]
-
-        if len(new) == len(self._handler_registrations):
+        index = self._handler_registrations_index
+        old = index.find(required, None, factory)
+        if not old:
             return False
 
-        self._handler_registrations[:] = new
+        index.remove(old)
+        self._registrations_changed()
         self.adapters.unsubscribe(required, None, factory)
 
         notify(Unregistered(
@@ -641,6 +1050,25 @@ def _getAdapterRequired(factory, required):
     return tuple(result)
 
 
+def _getRequiredQuery(required):
+    # Like _getAdapterRequired, but None matches any specification
+    # instead of standing for Interface.
+    if not ISpecification.providedBy(required):
+        required = tuple(required)
+    specs = _getAdapterRequired(None, required)
+    return tuple([
+        None if r is None else spec
+        for r, spec in zip(required, specs)
+    ])
+
+
+def _requiredMatches(query, required):
+    return len(query) == len(required) and all(
+        q is None or q == r
+        for q, r in zip(query, required)
+    )
+
+
 @implementer(IUtilityRegistration)
 class UtilityRegistration:
 
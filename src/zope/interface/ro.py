@@ -155,7 +155,39 @@ def _legacy_flatten(begin):
 
 
 def _legacy_ro(ob):
-    return _legacy_mergeOrderings([_legacy_flatten(ob)])
+    # This is ``_legacy_mergeOrderings([_legacy_flatten(ob)])``: each
+    # object at the position of its *last* occurrence in a depth-first
+    # walk of ``__bases__``. But that walk visits every path through
+    # the hierarchy, which is exponential for diamond-heavy (deep and
+    # wide) hierarchies. So combine the results for the bases instead,
+    # computing each once: the last occurrences in ``A + B`` are the
+    # objects of ``A`` that are not in ``B``, followed by those of
+    # ``B``.
+    memo = {}
+    stack = [ob]
+    while stack:
+        top = stack[-1]
+        if id(top) in memo:
+            stack.pop()
+            continue
+        missing = [b for b in top.__bases__ if id(b) not in memo]
+        if missing:
+            stack.extend(reversed(missing))
+            continue
+        stack.pop()
+        seen = set()
+        parts = []
+        for base in reversed(top.__bases__):
+            part = [o for o in memo[id(base)] if o not in seen]
+            seen.update(part)
+            parts.append(part)
+        # ``top`` is only in ``seen`` if an equal but distinct object is
+        # among its ancestors; the later position wins.
+        result = [] if top in seen else [top]
+        for part in reversed(parts):
+            result.extend(part)
+        memo[id(top)] = result
+    return memo[id(ob)]
 
 ###
 # Compare base objects using identity, not equality. This matches what
@@ -266,13 +298,18 @@ class C3:
     # Holds the shared state during computation of an MRO.
 
     @staticmethod
-    def resolver(C, strict, base_mros):
+    def _factory(strict):
         strict = strict if strict is not None else C3.STRICT_IRO
         factory = C3
         if strict:
             factory = _StrictC3
         elif C3.TRACK_BAD_IRO:
             factory = _TrackingC3
+        return factory
+
+    @staticmethod
+    def resolver(C, strict, base_mros):
+        factory = C3._factory(strict)
 
         memo = {}
         base_mros = base_mros or {}
@@ -440,8 +477,53 @@ class C3:
         )
         raise self._UseLegacyRO
 
+    def _fast_merge(self):
+        # Plain C3, keeping track of where each sequence in the base tree
+        # starts and of how many sequences each object is still in the
+        # tail of. This is linear where the general loop in ``_merge`` is
+        # quadratic, but it only handles consistent orders without
+        # duplicates. For anything else it returns None, and ``_merge``
+        # starts again from the beginning, with its guessing and error
+        # reporting.
+        # The sequences are reversed so that their heads can be popped.
+        seqs = [seq[::-1] for seq in self.base_tree if seq]
+        in_tails = {}
+        for seq in seqs:
+            ids = [id(x) for x in seq]
+            if len(set(ids)) != len(ids):
+                return None
+            for i in ids[:-1]:
+                in_tails[i] = in_tails.get(i, 0) + 1
+
+        result = []
+        while seqs:
+            for seq in seqs:
+                base = seq[-1]
+                if not in_tails.get(id(base)):
+                    break
+            else:
+                return None
+
+            result.append(base)
+            exhausted = False
+            for seq in seqs:
+                if seq[-1] is base:
+                    seq.pop()
+                    if seq:
+                        in_tails[id(seq[-1])] -= 1
+                    else:
+                        exhausted = True
+            if exhausted:
+                seqs = [seq for seq in seqs if seq]
+        return result
+
     def _merge(self):
         # Returns a merged *list*.
+        result = self._fast_merge()
+        if result is not None:
+            self.__mro = result
+            return result
+
         result = self.__mro = []
         base_tree_remaining = self.base_tree
         base = None
@@ -670,18 +752,28 @@ def ro(
     """
     # The ``base_mros`` argument is for internal optimization and
     # not documented.
-    resolver = C3.resolver(C, strict, base_mros)
-    mro = resolver.mro()
-
+    factory = C3._factory(strict)
     log_changed = (
         log_changed_ro if log_changed_ro is not None
-        else resolver.LOG_CHANGED_IRO
+        else factory.LOG_CHANGED_IRO
     )
     use_legacy = (
         use_legacy_ro if use_legacy_ro is not None
-        else resolver.USE_LEGACY_IRO
+        else factory.USE_LEGACY_IRO
     )
 
+    if base_mros and not log_changed and not use_legacy:
+        bases = C.__bases__
+        if len(bases) == 1:
+            # By far the most common case: with a single base whose
+            # order we already know, there is nothing to merge.
+            base_mro = base_mros.get(bases[0])
+            if base_mro is not None:
+                return [C, *base_mro]
+
+    resolver = C3.resolver(C, strict, base_mros)
+    mro = resolver.mro()
+
     if log_changed or use_legacy:
         legacy_ro = resolver.legacy_ro
         assert isinstance(legacy_ro, list)
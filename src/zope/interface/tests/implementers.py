@@ -0,0 +1,60 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Test module with classes that declare interfaces, for verifyDeclarations
+"""
+from zope.interface import Interface
+from zope.interface import implementer
+
+
+class IGreeter(Interface):
+
+    def greet(name):
+        "Greet someone"
+
+
+class IFarewell(Interface):
+
+    def leave():
+        "Say goodbye"
+
+
+@implementer(IGreeter)
+class Greeter:
+
+    def greet(self, name):
+        raise NotImplementedError()
+
+
+class SubGreeter(Greeter):
+    # Inherits the declaration, which isn't verified again.
+    pass
+
+
+@implementer(IFarewell)
+class BadGreeter(Greeter):
+
+    def leave(self, when):
+        raise NotImplementedError()
+
+
+class Outer:
+
+    @implementer(IGreeter, IFarewell)
+    class Inner:
+
+        def greet(self, name):
+            raise NotImplementedError()
+
+        def leave(self):
+            raise NotImplementedError()
@@ -778,6 +778,68 @@ class BaseAdapterRegistryTests(unittest.TestCase):
         registry.unsubscribe([IB1], None, self._instance_method_notify_target)
         self.assertEqual(len(registry._subscribers), 0)
 
+    def _makeSubscribers(self, count):
+        def make(i):
+            def subscriber():
+                raise AssertionError("Not called")
+            subscriber.__name__ = 'subscriber%d' % i
+            return subscriber
+        return [make(i) for i in range(count)]
+
+    def test_subscribe_unsubscribe_many(self):
+        (
+            IB0, IB1, IB2, IB3, IB4, IF0, IF1, IR0, IR1,
+        ) = _makeInterfaces()  # pylint:disable=unused-variable
+        registry = self._makeOne()
+        subscribers = self._makeSubscribers(100)
+        for subscriber in subscribers:
+            registry.subscribe([IB1], IR0, subscriber)
+        registry.subscribe([IB1], IR0, subscribers[0])
+
+        self.assertEqual(registry._provided, self._getProvidedType()({
+            IR0: 101
+        }))
+        self.assertEqual(
+            [v for _, _, v in registry.allSubscriptions()],
+            subscribers + subscribers[:1])
+        self.assertIs(registry.subscribed([IB1], IR0, subscribers[50]),
+                      subscribers[50])
+
+        # Duplicates are all removed, and the order is kept.
+        registry.unsubscribe([IB1], IR0, subscribers[0])
+        for subscriber in subscribers[10:90]:
+            registry.unsubscribe([IB1], IR0, subscriber)
+        self.assertIsNone(registry.subscribed([IB1], IR0, subscribers[50]))
+        self.assertEqual(
+            [v for _, _, v in registry.allSubscriptions()],
+            subscribers[1:10] + subscribers[90:])
+        self.assertEqual(registry._provided, self._getProvidedType()({
+            IR0: 19
+        }))
+
+        for subscriber in subscribers:
+            registry.unsubscribe([IB1], IR0, subscriber)
+        self.assertEqual(len(registry._subscribers), 0)
+        self.assertEqual(len(registry._provided), 0)
+
+    def test_unsubscribe_many_by_equality(self):
+        (
+            IB0, IB1, IB2, IB3, IB4, IF0, IF1, IR0, IR1,
+        ) = _makeInterfaces()  # pylint:disable=unused-variable
+        registry = self._makeOne()
+        subscribers = self._makeSubscribers(50)
+        for subscriber in subscribers[:25]:
+            registry.subscribe([IB1], None, subscriber)
+        registry.subscribe([IB1], None, self._instance_method_notify_target)
+        for subscriber in subscribers[25:]:
+            registry.subscribe([IB1], None, subscriber)
+
+        registry.unsubscribe([IB1], None, self._instance_method_notify_target)
+        registry.unsubscribe([IB1], None, subscribers[0])
+        self.assertEqual(
+            [v for _, _, v in registry.allSubscriptions()],
+            subscribers[1:])
+
     def test_subscribe_multiple_allRegistrations(self):
         (
             IB0, IB1, IB2, IB3, IB4, IF0, IF1, IR0, IR1,
@@ -947,6 +1009,138 @@ class CustomTypesBaseAdapterRegistryTests(BaseAdapterRegistryTests):
         self.assertIs(leaf1, leaf2)
 
 
+class SubscriberLeafTests(unittest.TestCase):
+
+    def _getTargetClass(self):
+        from zope.interface.adapter import _SubscriberLeaf
+        return _SubscriberLeaf
+
+    def _makeOne(self, items=()):
+        return self._getTargetClass()(items)
+
+    def test_empty(self):
+        leaf = self._makeOne()
+        self.assertEqual(len(leaf), 0)
+        self.assertFalse(leaf)
+        self.assertEqual(list(leaf), [])
+        self.assertNotIn(self, leaf)
+        self.assertEqual(leaf, ())
+        self.assertEqual(repr(leaf), '_SubscriberLeaf(())')
+
+    def test_append_and_remove_by_identity(self):
+        first, second = object(), object()
+        leaf = self._makeOne([first, second, first])
+        self.assertEqual(len(leaf), 3)
+        self.assertEqual(leaf, (first, second, first))
+        self.assertIs(leaf[1], second)
+        self.assertIn(first, leaf)
+
+        leaf.remove(first)
+        self.assertEqual(leaf, (second,))
+        self.assertNotIn(first, leaf)
+        leaf.remove(first)
+        self.assertEqual(leaf, (second,))
+
+        leaf.append(first)
+        self.assertEqual(leaf, (second, first))
+
+    def test_remove_by_equality(self):
+        leaf = self._makeOne(['a', 'b', 'a', 'c'])
+        self.assertIn(''.join(['a']), leaf)
+        leaf.remove(''.join(['a']))
+        self.assertEqual(leaf, ('b', 'c'))
+
+        # Objects that compare by identity can still equal others.
+        class Equal:
+            def __eq__(self, other):
+                return True
+
+            __hash__ = object.__hash__
+
+        thing = object()
+        leaf = self._makeOne([Equal(), thing, object()])
+        self.assertIn(thing, leaf)
+        leaf.remove(thing)
+        self.assertEqual(len(leaf), 1)
+
+    def test_remove_by_equality_keeps_others(self):
+        first, second = object(), object()
+        leaf = self._makeOne([[1], first, [2], [1], second])
+        leaf.remove([1])
+        self.assertEqual(leaf, (first, [2], second))
+        leaf.remove([3])
+        self.assertEqual(leaf, (first, [2], second))
+        leaf.remove([2])
+        self.assertEqual(leaf, (first, second))
+        # Only subscribers that compare by identity are left.
+        self.assertEqual(leaf._others, 0)
+        leaf.remove(first)
+        self.assertEqual(leaf, (second,))
+
+    def test_iteration_uses_snapshot(self):
+        items = [object() for _ in range(3)]
+        leaf = self._makeOne(items)
+        seen = []
+        for item in leaf:
+            seen.append(item)
+            leaf.remove(item)
+            leaf.append(object())
+        self.assertEqual(seen, items)
+        self.assertEqual(len(leaf), 3)
+
+    def test_comparison(self):
+        leaf = self._makeOne((1, 2))
+        self.assertEqual(leaf, self._makeOne((1, 2)))
+        self.assertEqual(leaf, (1, 2))
+        self.assertNotEqual(leaf, (2, 1))
+        self.assertNotEqual(leaf, [1, 2])
+        self.assertFalse(leaf != self._makeOne((1, 2)))
+        self.assertRaises(TypeError, hash, leaf)
+
+    def test_pickle(self):
+        import pickle
+        leaf = self._makeOne(('a', 'b'))
+        copy = pickle.loads(pickle.dumps(leaf))
+        self.assertIsInstance(copy, self._getTargetClass())
+        self.assertEqual(copy, leaf)
+
+    def test_used_for_large_leaves(self):
+        from zope.interface.adapter import _LEAF_TUPLE_MAX
+        from zope.interface.adapter import AdapterRegistry
+        registry = AdapterRegistry()
+        leaf = None
+        for i in range(_LEAF_TUPLE_MAX):
+            leaf = registry._addValueToLeaf(leaf, i)
+        self.assertIsInstance(leaf, tuple)
+        leaf = registry._addValueToLeaf(leaf, _LEAF_TUPLE_MAX)
+        self.assertIsInstance(leaf, self._getTargetClass())
+        self.assertEqual(leaf, tuple(range(_LEAF_TUPLE_MAX + 1)))
+        self.assertIs(registry._addValueToLeaf(leaf, 'a'), leaf)
+        self.assertIs(registry._removeValueFromLeaf(leaf, 0), leaf)
+        self.assertEqual(leaf, tuple(range(1, _LEAF_TUPLE_MAX + 1)) + ('a',))
+
+    def test_unsubscribe_while_iterating(self):
+        from zope.interface import Interface
+        from zope.interface.adapter import AdapterRegistry
+
+        class IFoo(Interface):
+            pass
+
+        registry = AdapterRegistry()
+        subscribers = [object() for _ in range(50)]
+        for subscriber in subscribers:
+            registry.subscribe([IFoo], None, subscriber)
+
+        seen = []
+        for required, provided, subscriber in registry.allSubscriptions():
+            seen.append(subscriber)
+            if subscriber is not subscribers[-1]:
+                registry.unsubscribe(required, provided, subscriber)
+        self.assertEqual(seen, subscribers)
+        self.assertEqual(registry.subscriptions([IFoo], None),
+                         subscribers[-1:])
+
+
 class LookupBaseFallbackTests(unittest.TestCase):
 
     def _getFallbackClass(self):
@@ -1093,6 +1287,64 @@ class LookupBaseFallbackTests(unittest.TestCase):
                          [(('A',), 'B', 'C'), (('A',), 'B', 'C')])
         self.assertEqual(_results, [c])
 
+    def test_lookup0_w_invalid_name(self):
+
+        def _lookup(self, required, provided, name):
+            self.fail("This should never be called")
+
+        lb = self._makeOne(uc_lookup=_lookup)
+        with self.assertRaises(ValueError):
+            lb.lookup0('B', object())
+
+    def test_lookup0_miss_w_default_negative_cache(self):
+        _called_with = []
+        _default = object()
+
+        def _lookup(self, required, provided, name):
+            _called_with.append((required, provided, name))
+
+        lb = self._makeOne(uc_lookup=_lookup)
+        self.assertIsNone(lb.lookup0('B', 'C'))
+        found = lb.lookup0('B', 'C', _default)
+        self.assertIs(found, _default)
+        self.assertEqual(_called_with, [((), 'B', 'C')])
+
+    def test_lookup0_cached(self):
+        _called_with = []
+        a, b, c = object(), object(), object()
+        _results = [a, b, c]
+
+        def _lookup(self, required, provided, name):
+            _called_with.append((required, provided, name))
+            return _results.pop(0)
+
+        lb = self._makeOne(uc_lookup=_lookup)
+        found = lb.lookup0('B', '')
+        self.assertIs(found, a)
+        found = lb.lookup0('B', 'C')
+        self.assertIs(found, b)
+        self.assertIs(lb.lookup0('B', ''), a)
+        self.assertIs(lb.lookup0('B', 'C'), b)
+        self.assertEqual(_called_with, [((), 'B', ''), ((), 'B', 'C')])
+        self.assertEqual(_results, [c])
+
+    def test_lookup0_not_cached_after_changed(self):
+        _called_with = []
+        a, b, c = object(), object(), object()
+        _results = [a, b, c]
+
+        def _lookup(self, required, provided, name):
+            _called_with.append((required, provided, name))
+            return _results.pop(0)
+
+        lb = self._makeOne(uc_lookup=_lookup)
+        found = lb.lookup0('B', 'C')
+        lb.changed(lb)
+        found = lb.lookup0('B', 'C')
+        self.assertIs(found, b)
+        self.assertEqual(_called_with, [((), 'B', 'C'), ((), 'B', 'C')])
+        self.assertEqual(_results, [c])
+
     def test_lookup1_w_invalid_name(self):
 
         def _lookup(self, required, provided, name):
@@ -1272,6 +1524,257 @@ class LookupBaseFallbackTests(unittest.TestCase):
         self.assertIs(adapted, _adapter)
         self.assertEqual(_f_called_with, [req])
 
+    def test_methods_w_keywords(self):
+        from zope.interface import providedBy
+        _called_with = []
+        _default = object()
+
+        def _factory(context):
+            return None
+
+        def _lookup(self, required, provided, name=''):
+            _called_with.append((required, provided, name))
+            return _factory
+
+        req, prv = object(), object()
+        lb = self._makeOne(uc_lookup=_lookup)
+        self.assertIs(
+            lb.lookup(required=(req,), provided=prv, name='C'), _factory)
+        self.assertIs(
+            lb.lookup1(req, provided=prv, default=_default, name='C'),
+            _factory)
+        self.assertIs(
+            lb.queryAdapter(req, prv, default=_default, name='C'), _default)
+        self.assertIs(
+            lb.adapter_hook(object=req, provided=prv, default=_default),
+            _default)
+        self.assertIs(
+            lb.queryMultiAdapter(
+                objects=(req,), provided=prv, name='C', default=_default),
+            _default)
+        self.assertEqual(_called_with, [
+            ((req,), prv, 'C'),
+            ((providedBy(req),), prv, 'C'),
+            ((providedBy(req),), prv, ''),
+        ])
+
+    def test_methods_w_bad_arguments(self):
+
+        def _lookup(self, required, provided, name=''):
+            self.fail("This should never be called")
+
+        lb = self._makeOne(uc_lookup=_lookup)
+        req, prv = object(), object()
+        for method, args in (
+            (lb.lookup, ((req,), prv)),
+            (lb.lookup1, (req, prv)),
+            (lb.queryAdapter, (req, prv)),
+            (lb.adapter_hook, (prv, req)),
+            (lb.queryMultiAdapter, ((req,), prv)),
+            (lb.lookupAll, ((req,), prv)),
+            (lb.subscriptions, ((req,), prv)),
+        ):
+            __traceback_info__ = method
+            # Missing a required argument.
+            self.assertRaises(TypeError, method, args[0])
+            # Too many arguments.
+            self.assertRaises(TypeError, method, *(args + (None,) * 3))
+            # Both positional and by keyword.
+            self.assertRaises(TypeError, method, *args, provided=prv)
+            # Unknown keyword.
+            self.assertRaises(TypeError, method, *args, bogus=None)
+
+    def test_queryMultiAdapter_lookup_miss(self):
+        from zope.interface import providedBy
+        _called_with = []
+
+        def _lookup(self, required, provided, name=''):
+            _called_with.append((required, provided, name))
+
+        foo, bar = object(), object()
+        lb = self._makeOne(uc_lookup=_lookup)
+        _default = object()
+        result = lb.queryMultiAdapter((foo, bar), 'B', default=_default)
+        self.assertIs(result, _default)
+        result = lb.queryMultiAdapter((foo, bar), 'B')
+        self.assertIsNone(result)
+        self.assertEqual(
+            _called_with,
+            [((providedBy(foo), providedBy(bar)), 'B', '')],
+        )
+
+    def test_queryMultiAdapter_w_invalid_name(self):
+
+        def _lookup(self, required, provided, name):
+            self.fail("This should never be called")
+
+        lb = self._makeOne(uc_lookup=_lookup)
+        with self.assertRaises(ValueError):
+            lb.queryMultiAdapter((object(), object()), 'B', object())
+
+    def test_queryMultiAdapter_errors_on_attribute_access(self):
+        # Any error on attribute access previously lead to using the _empty
+        # singleton as "requires" argument (See
+        # https://github.com/zopefoundation/zope.interface/issues/162)
+        # but after https://github.com/zopefoundation/zope.interface/issues/200
+        # they get propagated.
+        from zope.interface.tests import MissingSomeAttrs
+
+        lb = self._makeOne()
+
+        def test(ob):
+            return lb.queryMultiAdapter((ob,), 'B')
+
+        def test2(ob):
+            return lb.queryMultiAdapter((object(), ob), 'B')
+
+        MissingSomeAttrs.test_raises(self, test, expected_missing='__class__')
+        MissingSomeAttrs.test_raises(self, test2, expected_missing='__class__')
+
+    def test_queryMultiAdapter_factory_miss(self):
+        _called_with = []
+
+        def _factory(*context):
+            _called_with.append(context)
+
+        def _lookup(self, required, provided, name=''):
+            return _factory
+
+        foo, bar = object(), object()
+        lb = self._makeOne(uc_lookup=_lookup)
+        _default = object()
+        result = lb.queryMultiAdapter((foo, bar), 'B', default=_default)
+        self.assertIs(result, _default)
+        self.assertEqual(_called_with, [(foo, bar)])
+
+    def test_queryMultiAdapter_factory_hit(self):
+        _expected = object()
+        _called_with = []
+
+        def _factory(*context):
+            _called_with.append(context)
+            return _expected
+
+        def _lookup(self, required, provided, name=''):
+            return _factory
+
+        objects = [object() for _ in range(4)]
+        lb = self._makeOne(uc_lookup=_lookup)
+        for count in range(1, 5):
+            result = lb.queryMultiAdapter(objects[:count], 'B', 'C')
+            self.assertIs(result, _expected)
+            self.assertEqual(_called_with[-1], tuple(objects[:count]))
+
+    def test_queryMultiAdapter_cached(self):
+        from zope.interface import providedBy
+        _called_with = []
+        _adapters = [object(), object()]
+
+        def _factory(*context):
+            return _adapters[len(context) - 2]
+
+        def _lookup(self, required, provided, name=''):
+            _called_with.append((required, provided, name))
+            return _factory
+
+        foo, bar, baz = object(), object(), object()
+        lb = self._makeOne(uc_lookup=_lookup)
+        for _ in range(2):
+            self.assertIs(
+                lb.queryMultiAdapter((foo, bar), 'B'), _adapters[0])
+            self.assertIs(
+                lb.queryMultiAdapter([foo, bar, baz], 'B'), _adapters[1])
+            self.assertIs(
+                lb.queryMultiAdapter(iter((foo, bar)), 'B', 'C'), _adapters[0])
+        required = (providedBy(foo), providedBy(bar))
+        self.assertEqual(_called_with, [
+            (required, 'B', ''),
+            (required + (providedBy(baz),), 'B', ''),
+            (required, 'B', 'C'),
+        ])
+        # The results are in the same cache as for lookup().
+        self.assertIs(lb.lookup(required, 'B'), _factory)
+        self.assertEqual(len(_called_with), 3)
+
+        lb.changed(None)
+        lb.queryMultiAdapter((foo, bar), 'B')
+        self.assertEqual(len(_called_with), 4)
+
+    def test_queryMultiAdapter_cached_w_weak_keys(self):
+        from zope.interface import providedBy
+        _called_with = []
+
+        def _factory(*context):
+            return context
+
+        def _lookup(self, required, provided, name=''):
+            _called_with.append(required)
+            return _factory
+
+        foo, bar = object(), object()
+        lb = self._makeOne(uc_lookup=_lookup)
+        lb._weak_keys = True
+        self.assertEqual(lb.queryMultiAdapter((foo, bar), 'B'), (foo, bar))
+        self.assertEqual(lb.queryMultiAdapter((foo, bar), 'B'), (foo, bar))
+        self.assertEqual(_called_with, [(providedBy(foo), providedBy(bar))])
+
+    def test_queryMultiAdapter_super_unwraps(self):
+
+        def _factory(*args):
+            return args
+
+        def _lookup(self, required, provided, name=''):
+            return _factory
+
+        lb = self._makeOne(uc_lookup=_lookup)
+
+        objects = [
+            super(),
+            42,
+            "abc",
+            super(),
+        ]
+
+        result = lb.queryMultiAdapter(objects, None)
+        self.assertEqual(result, (
+            self,
+            42,
+            "abc",
+            self,
+        ))
+        result = lb.queryMultiAdapter((super(), 42), None)
+        self.assertEqual(result, (self, 42))
+
+    def test_queryMultiAdapter_uses_overridden_lookup(self):
+        from zope.interface import providedBy
+        _called_with = []
+
+        def _uc_lookup(self, required, provided, name):
+            raise AssertionError("This should never be called")
+
+        def _factory(*context):
+            return 'overridden'
+
+        class Derived(type(self._makeOne(uc_lookup=_uc_lookup))):
+            def lookup(self, required, provided, name=''):
+                _called_with.append((required, provided, name))
+                return _factory
+
+        foo, bar = object(), object()
+        lb = Derived()
+        for objects in (foo, bar), (foo,):
+            self.assertEqual(lb.queryMultiAdapter(objects, 'B'), 'overridden')
+        self.assertEqual(_called_with, [
+            ([providedBy(foo), providedBy(bar)], 'B', ''),
+            ([providedBy(foo)], 'B', ''),
+        ])
+
+        # So is one set on the instance.
+        lb = self._makeOne(uc_lookup=_uc_lookup)
+        lb.lookup = lambda required, provided, name: _factory
+        self.assertEqual(lb.queryMultiAdapter((foo, bar), 'B', 'C'),
+                         'overridden')
+
     def test_lookupAll_uncached(self):
         _called_with = []
         _results = [object(), object(), object()]
@@ -1326,6 +1829,88 @@ class LookupBaseFallbackTests(unittest.TestCase):
         self.assertEqual(found, tuple(_results))
         self.assertEqual(_called_with, [(('A',), 'B')])
 
+    def test_weak_keys_do_not_keep_required_alive(self):
+        import gc
+        import weakref
+        _called_with = []
+
+        def _lookup(self, required, provided, name=''):
+            _called_with.append('lookup')
+            return 'lookup'
+
+        def _lookupAll(self, required, provided):
+            _called_with.append('lookupAll')
+            return ()
+
+        def _subscriptions(self, required, provided):
+            _called_with.append('subscriptions')
+            return []
+
+        class Spec:
+            pass
+
+        spec = Spec()
+        ref = weakref.ref(spec)
+        lb = self._makeOne(uc_lookup=_lookup, uc_lookupAll=_lookupAll,
+                           uc_subscriptions=_subscriptions)
+        lb._weak_keys = True
+        for _ in range(2):
+            self.assertEqual(lb.lookup((spec,), 'B'), 'lookup')
+            self.assertEqual(lb.lookup1(spec, 'B', 'C'), 'lookup')
+            self.assertEqual(lb.lookup((spec, spec), 'B'), 'lookup')
+            self.assertEqual(lb.lookupAll((spec,), 'B'), ())
+            self.assertEqual(lb.subscriptions((spec,), 'B'), [])
+        self.assertEqual(_called_with,
+                         ['lookup', 'lookup', 'lookup', 'lookupAll',
+                          'subscriptions'])
+        del spec
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_weak_keys_w_unreferenceable_required(self):
+        _called_with = []
+
+        def _lookup(self, required, provided, name=''):
+            _called_with.append((required, provided, name))
+            return 'found'
+
+        lb = self._makeOne(uc_lookup=_lookup)
+        lb._weak_keys = True
+        self.assertEqual(lb.lookup(('A',), 'B'), 'found')
+        self.assertEqual(lb.lookup1('A', 'B'), 'found')
+        self.assertEqual(lb.lookup(('A', 'A'), 'B'), 'found')
+        self.assertEqual(lb.lookup(('A', 'A'), 'B'), 'found')
+        self.assertEqual(_called_with,
+                         [(('A',), 'B', ''), (('A', 'A'), 'B', '')])
+
+    def test_caches_checked_when_spec_epoch_moves(self):
+        from zope.interface.interface import InterfaceClass
+        _called_with = []
+        _since = []
+
+        def _lookup(self, required, provided, name=''):
+            _called_with.append((required, provided, name))
+            return 'found'
+
+        lb = self._makeOne(uc_lookup=_lookup)
+        lb._specs_changed_since = _since.append
+        IFoo = InterfaceClass('IFoo')
+        # Empty caches are current.
+        IFoo.changed(IFoo)
+        self.assertEqual(lb.lookup(('A',), 'B'), 'found')
+        self.assertEqual(_since, [])
+        epoch = lb._epoch
+        # The specifications in the caches haven't changed.
+        IFoo.changed(IFoo)
+        self.assertEqual(lb.lookup(('A',), 'B'), 'found')
+        self.assertEqual(_since, [epoch])
+        self.assertEqual(_called_with, [(('A',), 'B', '')])
+        # By default, any change might matter.
+        del lb._specs_changed_since
+        IFoo.changed(IFoo)
+        self.assertEqual(lb.lookup(('A',), 'B'), 'found')
+        self.assertEqual(_called_with, [(('A',), 'B', '')] * 2)
+
 
 class LookupBaseTests(LookupBaseFallbackTests,
                       OptimizationTestMixin):
@@ -1408,6 +1993,28 @@ class VerifyingBaseFallbackTests(unittest.TestCase):
                          [(('A',), 'B', 'C'), (('A',), 'B', 'C')])
         self.assertEqual(_results, [c])
 
+    def test_lookup0(self):
+        _called_with = []
+        a, b, c = object(), object(), object()
+        _results = [a, b, c]
+
+        def _lookup(self, required, provided, name):
+            _called_with.append((required, provided, name))
+            return _results.pop(0)
+
+        reg = self._makeRegistry(3)
+        lb = self._makeOne(reg, uc_lookup=_lookup)
+        found = lb.lookup0('B', 'C')
+        found = lb.lookup0('B', 'C')
+        self.assertIs(found, a)
+        self.assertEqual(_called_with, [((), 'B', 'C')])
+        self.assertEqual(_results, [b, c])
+        reg.ro[1]._generation += 1
+        found = lb.lookup0('B', 'C')
+        self.assertIs(found, b)
+        self.assertEqual(_called_with, [((), 'B', 'C'), ((), 'B', 'C')])
+        self.assertEqual(_results, [c])
+
     def test_lookup1(self):
         _called_with = []
         a, b, c = object(), object(), object()
@@ -1487,6 +2094,52 @@ class VerifyingBaseFallbackTests(unittest.TestCase):
         adapted = lb.adapter_hook(prv, req, 'C', _default)
         self.assertIs(adapted, b)
 
+    def test_methods_w_keywords(self):
+        _called_with = []
+        _found = object()
+
+        def _lookup(self, required, provided, name):
+            _called_with.append((required, provided, name))
+            return _found
+
+        req, prv = object(), object()
+        reg = self._makeRegistry(3)
+        lb = self._makeOne(reg, uc_lookup=_lookup)
+        self.assertIs(
+            lb.lookup(required=(req,), provided=prv, name='C'), _found)
+        self.assertIs(lb.lookup1(req, provided=prv, name='C'), _found)
+        with self.assertRaises(TypeError):
+            lb.lookup((req,), prv, required=(req,))
+        self.assertEqual(_called_with, [((req,), prv, 'C')])
+
+    def test_queryMultiAdapter(self):
+        a, b, _c = [object(), object(), object()]  # noqa F841
+
+        def _factory1(*context):
+            return a
+
+        def _factory2(*context):
+            return b
+
+        def _factory3(*context):
+            self.fail("This should never be called")
+
+        _factories = [_factory1, _factory2, _factory3]
+
+        def _lookup(self, required, provided, name):
+            return _factories.pop(0)
+
+        req, prv = (object(), object()), object()
+        reg = self._makeRegistry(3)
+        lb = self._makeOne(reg, uc_lookup=_lookup)
+        adapted = lb.queryMultiAdapter(req, prv, 'C')
+        self.assertIs(adapted, a)
+        adapted = lb.queryMultiAdapter(req, prv, 'C')
+        self.assertIs(adapted, a)
+        reg.ro[1]._generation += 1
+        adapted = lb.queryMultiAdapter(req, prv, 'C')
+        self.assertIs(adapted, b)
+
     def test_lookupAll(self):
         _results_1 = [object(), object(), object()]
         _results_2 = [object(), object(), object()]
@@ -1620,10 +2273,30 @@ class AdapterLookupBaseTests(unittest.TestCase):
         alb = Derived(registry)
         alb._required[gone] = 1
         alb._required[here] = 1
+        alb._dead_specs.count = 1
         alb.changed(alb)
         self.assertEqual(len(alb._required), 0)
+        # Specifications aren't subscribed to, so there's nothing to
+        # unsubscribe from.
         self.assertEqual(gone._unsub, None)
-        self.assertEqual(here._unsub, alb)
+        self.assertEqual(here._unsub, None)
+        self.assertEqual(alb._dead_specs.count, 0)
+
+    def test__specs_changed_since(self):
+        from zope.interface.interface import InterfaceClass
+        from zope.interface.interface import _current_spec_epoch
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+        IBaz = InterfaceClass('IBaz')
+        registry = self._makeRegistry()
+        alb = self._makeOne(registry)
+        alb._uncached_lookup((IFoo,), IBar)
+        epoch = _current_spec_epoch()
+        self.assertFalse(alb._specs_changed_since(epoch))
+        IBaz.changed(IBaz)
+        self.assertFalse(alb._specs_changed_since(epoch))
+        IFoo.changed(IFoo)
+        self.assertTrue(alb._specs_changed_since(epoch))
 
     def test_init_extendors_after_registry_update(self):
         from zope.interface import Interface
@@ -1684,6 +2357,8 @@ class AdapterLookupBaseTests(unittest.TestCase):
         self.assertEqual(result, None)
         self.assertEqual(len(alb._required), 1)
         self.assertIn(IFoo.weakref(), alb._required)
+        # Lookups don't become dependents of the specifications.
+        self.assertNotIn(alb, IFoo.dependents)
 
     def test__uncached_lookup_order_miss(self):
         from zope.interface.interface import InterfaceClass
@@ -2111,6 +2786,40 @@ class AdapterLookupBaseTests(unittest.TestCase):
         result = alb._uncached_subscriptions((IFoo,), IBar)
         self.assertEqual(sorted(result), sorted([_exp1, _exp2]))
 
+    def test__registries_for(self):
+        from zope.interface.interface import InterfaceClass
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar', (IFoo,))
+        registry = self._makeRegistry(IFoo, IBar)
+        empty = self._makeSubregistry()
+        empty._adapters = [{}, {}]
+        empty._subscribers = [{}, {}]
+        subr = self._makeSubregistry()
+        adapters = {IFoo: {IBar: {'': 'adapter'}}}
+        subscribers = {IFoo: {None: {'': ('handler',)}}}
+        subr._adapters = [{}, adapters]
+        subr._subscribers = [{}, subscribers]
+        registry.ro.extend([empty, subr])
+        alb = self._makeOne(registry)
+        empty._v_lookup = self._makeOne(self._makeRegistry())
+        subr._v_lookup = alb
+
+        found = alb._registries_for(IFoo, 1)
+        self.assertEqual(len(found), 1)
+        self.assertIs(found[0][0], adapters)
+        self.assertEqual(found[0][1], [IFoo, IBar])
+        self.assertIs(alb._registries_for(IFoo, 1), found)
+        self.assertEqual(alb._registries_for(IFoo, 0), ())
+        self.assertEqual(alb._registries_for(IFoo, 2), ())
+        self.assertEqual(alb._registries_for(IBar, 1, True),
+                         ((subscribers, [IBar]),))
+        self.assertEqual(alb._registries_for(None, 1, True),
+                         ((subscribers, (None,)),))
+
+        alb._ro_index.clear()
+        registry.ro.remove(subr)
+        self.assertEqual(alb._registries_for(IFoo, 1), ())
+
     def test_subscribers_wo_provided(self):
         from zope.interface.declarations import implementer
         from zope.interface.interface import InterfaceClass
@@ -2212,6 +2921,183 @@ class VerifyingAdapterRegistryTests(unittest.TestCase):
         registry = self._makeOne()
         verifyObject(IAdapterRegistry, registry)
 
+    def test_lookups_through_chain_of_bases(self):
+        from zope.interface import Interface
+        from zope.interface.interface import InterfaceClass
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar', (IFoo,))
+        root = self._makeOne()
+        registries = [root]
+        for _ in range(5):
+            registries.append(self._makeOne([registries[-1]]))
+        middle, leaf = registries[3], registries[-1]
+
+        root.register([Interface], IFoo, '', 'root')
+        root.subscribe([Interface], IFoo, 'root')
+        self.assertEqual(leaf.lookup([IBar], IFoo), 'root')
+        self.assertEqual(leaf.lookupAll([IBar], IFoo), (('', 'root'),))
+        self.assertEqual(leaf.subscriptions([IBar], IFoo), ['root'])
+
+        middle.register([IBar], IFoo, '', 'middle')
+        middle.register([IBar], IFoo, 'name', 'middle')
+        middle.subscribe([IBar], IFoo, 'middle')
+        self.assertEqual(leaf.lookup([IBar], IFoo), 'middle')
+        self.assertEqual(leaf.lookup([IFoo], IFoo), 'root')
+        self.assertEqual(sorted(leaf.lookupAll([IBar], IFoo)),
+                         [('', 'middle'), ('name', 'middle')])
+        self.assertEqual(leaf.subscriptions([IBar], IFoo),
+                         ['root', 'middle'])
+
+        middle.unregister([IBar], IFoo, '')
+        middle.unsubscribe([IBar], IFoo, 'middle')
+        self.assertEqual(leaf.lookup([IBar], IFoo), 'root')
+        self.assertEqual(leaf.subscriptions([IBar], IFoo), ['root'])
+
+        leaf.__bases__ = [middle.__bases__[0]]
+        self.assertIsNone(leaf.lookup([IBar], IFoo, 'name'))
+        self.assertEqual(leaf.lookup([IBar], IFoo), 'root')
+
+    def test_lookup_after_required_spec_changes(self):
+        from zope.interface import Interface
+        from zope.interface import classImplements
+        from zope.interface import implementedBy
+        from zope.interface.interface import InterfaceClass
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+
+        class Foo:
+            pass
+
+        registry = self._makeOne()
+        registry.register([Interface], IBar, '', 'default')
+        registry.register([IFoo], IBar, '', 'foo')
+        spec = implementedBy(Foo)
+        self.assertEqual(registry.lookup([spec], IBar), 'default')
+        self.assertEqual(registry.lookupAll([spec], IBar),
+                         (('', 'default'),))
+
+        classImplements(Foo, IFoo)
+        self.assertEqual(registry.lookup([spec], IBar), 'foo')
+        self.assertEqual(registry.lookupAll([spec], IBar), (('', 'foo'),))
+
+    def test_queryMultiAdapter_after_required_spec_changes(self):
+        from zope.interface import Interface
+        from zope.interface import classImplements
+        from zope.interface.interface import InterfaceClass
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+
+        class Foo:
+            pass
+
+        registry = self._makeOne()
+        registry.register([Interface, Interface], IBar, '',
+                          lambda a, b: 'default')
+        registry.register([IFoo, Interface], IBar, '', lambda a, b: 'foo')
+        objects = (Foo(), Foo())
+        self.assertEqual(registry.queryMultiAdapter(objects, IBar), 'default')
+
+        classImplements(Foo, IFoo)
+        self.assertEqual(registry.queryMultiAdapter(objects, IBar), 'foo')
+
+    def test_lookup_after_unrelated_spec_changes(self):
+        from zope.interface import classImplements
+        from zope.interface import implementedBy
+        from zope.interface import implementer
+        from zope.interface.interface import InterfaceClass
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+
+        @implementer(IFoo)
+        class Foo:
+            pass
+
+        class Unrelated:
+            pass
+
+        registry = self._makeOne()
+        registry.register([IFoo], IBar, '', 'foo')
+        spec = implementedBy(Foo)
+        self.assertEqual(registry.lookup([spec], IBar), 'foo')
+        implementedBy(Unrelated)
+
+        def _uncached_lookup(*args):
+            self.fail("This should never be called")
+        registry._v_lookup._uncached_lookup = _uncached_lookup
+
+        @implementer(IFoo)
+        class AlsoUnrelated:
+            pass
+
+        classImplements(Unrelated, IFoo)
+        self.assertEqual(registry.lookup([spec], IBar), 'foo')
+
+    def test_weak_cache_keys(self):
+        import gc
+        import itertools
+
+        from zope.interface import alsoProvides
+        from zope.interface import providedBy
+        from zope.interface.adapter import _DEAD_SPEC_PURGE_MIN
+        from zope.interface.interface import InterfaceClass
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+
+        class Registry(self._getTargetClass()):
+            _weakCacheKeys = True
+
+        class Context:
+            pass
+
+        # Equal interfaces share declarations, so don't reuse names.
+        names = ('IMarker%d' % i for i in itertools.count())
+
+        def lookups(registry, count):
+            for _ in range(count):
+                context = Context()
+                alsoProvides(context, IFoo, InterfaceClass(next(names)))
+                spec = providedBy(context)
+                self.assertEqual(registry.queryAdapter(context, IBar),
+                                 'adapted')
+                self.assertEqual(registry.lookup([spec, spec], IBar),
+                                 'multi')
+                self.assertIsNone(registry.lookup([spec], IBar, 'name'))
+                self.assertEqual(registry.lookupAll([spec], IBar),
+                                 (('', registry.lookup([spec], IBar)),))
+                self.assertEqual(registry.subscriptions([spec], IBar),
+                                 ['sub'])
+            del context, spec
+            gc.collect()
+
+        for registry in self._makeOne(), Registry():
+            registry.register([IFoo], IBar, '', lambda context: 'adapted')
+            registry.register([IFoo, IFoo], IBar, '', 'multi')
+            registry.subscribe([IFoo], IBar, 'sub')
+            lookups(registry, 10)
+            if not registry._weakCacheKeys:
+                # The caches keep the specifications alive.
+                self.assertEqual(
+                    registry.cache_info(),
+                    {'specifications': 10, 'dead': 0, 'weak_keys': False})
+                continue
+            self.assertEqual(
+                registry.cache_info(),
+                {'specifications': 0, 'dead': 10, 'weak_keys': True})
+
+            # Later misses remove their entries in batches. (Specifications
+            # are in reference cycles, so they die when collected.)
+            for _ in range(_DEAD_SPEC_PURGE_MIN // 8):
+                lookups(registry, 8)
+            info = registry.cache_info()
+            self.assertLess(info['dead'], _DEAD_SPEC_PURGE_MIN)
+            cache = registry._v_lookup._cache[IBar]
+            self.assertLess(len(cache), _DEAD_SPEC_PURGE_MIN * 2)
+
+            registry.changed(registry)
+            self.assertEqual(
+                registry.cache_info(),
+                {'specifications': 0, 'dead': 0, 'weak_keys': True})
+
 
 class AdapterRegistryTests(VerifyingAdapterRegistryTests):
 
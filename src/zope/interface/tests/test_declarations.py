@@ -133,6 +133,10 @@ class EmptyDeclarationTests(unittest.TestCase):
         iface_list = list(decl.interfaces())
         self.assertEqual(iface_list, [])
 
+    def test_interfacesTuple_empty(self):
+        decl = self._getEmpty()
+        self.assertEqual(decl.interfacesTuple, ())
+
     def test___sro___(self):
         from zope.interface.interface import Interface
         decl = self._getEmpty()
@@ -218,6 +222,24 @@ class DeclarationTests(EmptyDeclarationTests):
         decl = self._makeOne(IBar)
         self.assertEqual(list(decl), [IBar])  # IBar.interfaces() omits bases
 
+    def test_interfacesTuple_cached_until_changed(self):
+        from zope.interface.declarations import Implements
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+        IBaz = InterfaceClass('IBaz')
+        impl = Implements(IFoo)
+        decl = self._makeOne(IBar, impl)
+        result = decl.interfacesTuple
+        self.assertEqual(result, (IBar, IFoo))
+        self.assertIs(decl.interfacesTuple, result)
+        self.assertIs(decl._v_interfaces, result)
+        # Changing a base is seen by its dependents
+        impl.__bases__ = (IFoo, IBaz)
+        self.assertIsNone(decl._v_interfaces)
+        self.assertEqual(decl.interfacesTuple, (IBar, IFoo, IBaz))
+        impl.__bases__ = ()
+        self.assertEqual(list(decl.interfaces()), [IBar])
+
     def test___iter___w_nested_sequence_overlap(self):
         IFoo = InterfaceClass('IFoo')
         IBar = InterfaceClass('IBar')
@@ -343,6 +365,102 @@ class DeclarationTests(EmptyDeclarationTests):
         self.assertEqual(after.__bases__, (IDerived, IBase))
         self.assertEqual(list(after), [IDerived, IBase])
 
+    def test___add___and___sub___are_memoized(self):
+        from zope.interface.declarations import _memo
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+        decl = self._makeOne(IFoo)
+        added = decl + IBar
+        self.assertEqual(
+            [entry[1:] for entry in _memo[decl].results.values()],
+            [((IFoo, IBar), added.__sro__[1:])])
+        again = decl + IBar
+        self.assertEqual(list(again), [IFoo, IBar])
+        self.assertEqual(again.__sro__[1:], added.__sro__[1:])
+        self.assertIs(again.__sro__[0], again)
+        subtracted = added - IFoo
+        self.assertEqual(
+            [entry[1] for entry in _memo[added].results.values()],
+            [(IBar,)])
+        self.assertEqual(list(subtracted), [IBar])
+        self.assertEqual(list(added - IFoo), [IBar])
+
+    def test___add___memoized_results_are_new_declarations(self):
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+        IBaz = InterfaceClass('IBaz')
+        decl = self._makeOne(IFoo)
+        first = decl + IBar
+        second = decl + IBar
+        self.assertIsNot(second, first)
+        self.assertEqual(second.__bases__, first.__bases__)
+        first.__bases__ = (IBaz,)
+        self.assertEqual(list(first), [IBaz])
+        second.__bases__ = (IBaz,)
+        self.assertEqual(second.__sro__[:2], (second, IBaz))
+        self.assertEqual(list(decl + IBar), [IFoo, IBar])
+
+    def test___sub___memo_distinguishes_equal_interfaces(self):
+        # Interfaces compare equal by name and module, but
+        # results are remembered for the exact object.
+        IFoo = InterfaceClass('IFoo')
+        IFoo2 = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+        from zope.interface.declarations import _memo
+        decl = self._makeOne(IBar)
+        decl - IFoo
+        decl - IFoo2
+        self.assertEqual(
+            sorted(key[1] for key in _memo[decl].results),
+            sorted([id(IFoo), id(IFoo2)]))
+
+    def test___sub___memo_discarded_when_hierarchy_changes(self):
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+        decl = self._makeOne(IBar)
+        before = decl - IFoo
+        self.assertEqual(list(before), [IBar])
+        IBar.__bases__ = (IFoo,)
+        self.assertEqual(list(decl - IFoo), [])
+
+    def test___add___memo_discarded_when_other_changes(self):
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+        IBaz = InterfaceClass('IBaz')
+        decl = self._makeOne(IFoo)
+        other = self._makeOne(IBar)
+        before = decl + other
+        self.assertEqual(list(before), [IFoo, IBar])
+        other.__bases__ = (IBaz,)
+        self.assertEqual(list(decl + other), [IFoo, IBaz])
+
+    def test___sub___memo_kept_when_unrelated_spec_changes(self):
+        from zope.interface.declarations import _memo
+        from zope.interface.declarations import classImplements
+        from zope.interface.declarations import implementer
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+        decl = self._makeOne(IFoo, IBar)
+        decl - IFoo
+        results = dict(_memo[decl].results)
+        self.assertEqual(len(results), 1)
+
+        @implementer(IFoo)
+        class Unrelated:
+            pass
+
+        classImplements(Unrelated, IBar)
+        self.assertEqual(_memo[decl].results, results)
+
+    def test___sub___result_can_be_changed(self):
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+        decl = self._makeOne(IFoo, IBar)
+        result = decl - IFoo
+        result.__bases__ = (IFoo,)
+        self.assertEqual(list(result), [IFoo])
+        self.assertEqual(list(decl - IFoo), [IBar])
+
 
 class TestImmutableDeclaration(EmptyDeclarationTests):
 
@@ -514,26 +632,34 @@ class TestImplements(NameAndModuleComparisonTestsMixin,
         self.assertNotEqual(proxy, implementedByB)
         self.assertNotEqual(implementedByB, proxy)
 
-    def test_changed_deletes_super_cache(self):
+    def test_changed_clears_super_cache(self):
         impl = self._makeOne()
         self.assertIsNone(impl._super_cache)
-        self.assertNotIn('_super_cache', impl.__dict__)
 
         impl._super_cache = 42
-        self.assertIn('_super_cache', impl.__dict__)
 
         impl.changed(None)
         self.assertIsNone(impl._super_cache)
-        self.assertNotIn('_super_cache', impl.__dict__)
 
     def test_changed_does_not_add_super_cache(self):
         impl = self._makeOne()
         self.assertIsNone(impl._super_cache)
-        self.assertNotIn('_super_cache', impl.__dict__)
 
         impl.changed(None)
         self.assertIsNone(impl._super_cache)
-        self.assertNotIn('_super_cache', impl.__dict__)
+
+    def test_no_instance_dict(self):
+        impl = self._makeOne()
+        self.assertFalse(hasattr(impl, '__dict__'))
+        self.assertEqual(impl.__name__, '?')
+        self.assertIsNone(impl.inherit)
+        self.assertEqual(impl.declared, ())
+        with self.assertRaises(AttributeError):
+            impl.arbitrary = 1
+
+    def test_named_keeps_name(self):
+        impl = self._getTargetClass().named('foo')
+        self.assertEqual(impl.__name__, 'foo')
 
 
 class Test_implementedByFallback(unittest.TestCase):
@@ -886,6 +1012,63 @@ class Test_implementedByFallback(unittest.TestCase):
         self.assertEqual(list(self._callFUT(sm2)),
                          [IBase])
 
+    def test_super_is_cached_per_thisclass(self):
+        from zope.interface import Interface
+        from zope.interface.declarations import implementer
+
+        class IBase(Interface):
+            pass
+
+        class IMiddle(Interface):
+            pass
+
+        @implementer(IBase)
+        class Base:
+            pass
+
+        @implementer(IMiddle)
+        class Middle(Base):
+            pass
+
+        class Derived(Middle):
+            pass
+
+        d = Derived()
+        first = self._callFUT(super(Derived, d))
+        self.assertIs(self._callFUT(super(Derived, d)), first)
+        self.assertIs(self._callFUT(super(Derived, Derived)), first)
+        from_middle = self._callFUT(super(Middle, d))
+        self.assertIsNot(from_middle, first)
+        self.assertEqual(list(from_middle), [IBase])
+        cache = self._callFUT(Derived)._super_cache
+        self.assertEqual(cache, {Derived: first, Middle: from_middle})
+
+    def test_super_cache_dropped_when_changed(self):
+        from zope.interface import Interface
+        from zope.interface.declarations import classImplements
+        from zope.interface.declarations import implementer
+
+        class IBase(Interface):
+            pass
+
+        class IExtra(Interface):
+            pass
+
+        @implementer(IBase)
+        class Base:
+            pass
+
+        class Derived(Base):
+            pass
+
+        first = self._callFUT(super(Derived, Derived))
+        self.assertEqual(list(first), [IBase])
+        classImplements(Derived, IExtra)
+        self.assertIsNone(self._callFUT(Derived)._super_cache)
+        second = self._callFUT(super(Derived, Derived))
+        self.assertIsNot(second, first)
+        self.assertEqual(list(second), [IBase])
+
 
 class Test_implementedBy(Test_implementedByFallback,
                          OptimizationTestMixin):
@@ -958,6 +1141,116 @@ class _ImplementsTestMixin:
         self._check_implementer(Foo)
 
 
+class Test_classImplementsDeferred(unittest.TestCase):
+
+    def _callFUT(self, cls, iface):
+        from zope.interface.declarations import _classImplementsDeferred
+        return _classImplementsDeferred(cls, iface)
+
+    def test_deferred_until_implementedBy(self):
+        from zope.interface.declarations import _deferred_class_implements
+        from zope.interface.declarations import implementedBy
+        IFoo = InterfaceClass('IFoo')
+        IBar = InterfaceClass('IBar')
+
+        class Foo:
+            pass
+
+        self._callFUT(Foo, IFoo)
+        self._callFUT(Foo, IBar)
+        self.assertNotIn('__implemented__', Foo.__dict__)
+        self.assertEqual(_deferred_class_implements[Foo], [IFoo, IBar])
+
+        self.assertEqual(list(implementedBy(Foo)), [IFoo, IBar])
+        self.assertNotIn(Foo, _deferred_class_implements)
+
+    def test_deferred_spec_is_not_changed_after_creation(self):
+        from zope.interface.declarations import Implements
+        from zope.interface.declarations import classImplements
+        from zope.interface.declarations import implementedBy
+        IBase = InterfaceClass('IBase')
+        IFoo = InterfaceClass('IFoo', (IBase,))
+        IBar = InterfaceClass('IBar')
+
+        class Base:
+            pass
+
+        class Foo(Base):
+            pass
+
+        class Eager(Base):
+            pass
+
+        classImplements(Base, IBase)
+        for iface in IBar, IFoo, IBase:
+            self._callFUT(Foo, iface)
+            classImplements(Eager, iface)
+
+        changed = []
+
+        class Counting(Implements):
+            def changed(self, originally_changed):
+                changed.append(self)
+                return Implements.changed(self, originally_changed)
+
+        named = Implements.__dict__['named']
+        Implements.named = classmethod(
+            lambda cls, name, *bases: named.__func__(Counting, name, *bases))
+        try:
+            spec = implementedBy(Foo)
+        finally:
+            Implements.named = named
+        self.assertIsInstance(spec, Counting)
+        self.assertEqual(changed, [spec])
+
+        eager = implementedBy(Eager)
+        self.assertEqual(spec.declared, eager.declared)
+        self.assertEqual(spec.__bases__, eager.__bases__)
+        self.assertEqual(spec.__iro__, eager.__iro__)
+
+    def test_deferred_applied_for_subclass(self):
+        from zope.interface.declarations import providedBy
+        IFoo = InterfaceClass('IFoo')
+
+        class Foo:
+            pass
+
+        class Bar(Foo):
+            pass
+
+        self._callFUT(Foo, IFoo)
+        self.assertTrue(IFoo.providedBy(Bar()))
+        self.assertEqual(list(providedBy(Foo())), [IFoo])
+
+    def test_immediate_if_spec_exists(self):
+        from zope.interface.declarations import _deferred_class_implements
+        from zope.interface.declarations import implementedBy
+        IFoo = InterfaceClass('IFoo')
+
+        class Foo:
+            pass
+
+        spec = implementedBy(Foo)
+        self._callFUT(Foo, IFoo)
+        self.assertNotIn(Foo, _deferred_class_implements)
+        self.assertEqual(list(spec), [IFoo])
+
+    def test_immediate_for_builtin_with_spec(self):
+        from types import CellType
+
+        from zope.interface.declarations import \
+            BuiltinImplementationSpecifications
+        from zope.interface.declarations import _deferred_class_implements
+        from zope.interface.declarations import implementedBy
+        IFoo = InterfaceClass('IFoo')
+        self.assertNotIn(CellType, BuiltinImplementationSpecifications)
+        implementedBy(CellType)
+        self.addCleanup(BuiltinImplementationSpecifications.pop, CellType)
+        self._callFUT(CellType, IFoo)
+        self.assertNotIn(CellType, _deferred_class_implements)
+        self.assertIn(IFoo, implementedBy(CellType))
+
+
 class Test_classImplementsOnly(_ImplementsTestMixin, unittest.TestCase):
     FUT_SETS_PROVIDED_BY = False
 
@@ -1305,6 +1598,19 @@ class ProvidesClassTests(unittest.TestCase):
 
         self.assertRaises(AttributeError, _test)
 
+    def test_no_instance_dict(self):
+        from zope.interface.declarations import ProvidesClass
+        IFoo = InterfaceClass("IFoo")
+
+        class Foo:
+            pass
+
+        spec = ProvidesClass(Foo, IFoo)
+        self.assertFalse(hasattr(spec, '__dict__'))
+        self.assertEqual(spec._v_module_names, ())
+        with self.assertRaises(AttributeError):
+            spec.arbitrary = 1
+
 
 class ProvidesClassStrictTests(ProvidesClassTests):
     # Tests that require the strict C3 resolution order.
@@ -441,6 +441,67 @@ class InterfaceBaseTestsMixin(NameAndModuleComparisonTestsMixin):
             self, self._makeOne(), expected_missing='__conform__'
         )
 
+    def test___call___w_keywords(self):
+        ib = self._makeOne(False)
+        adapted = object()
+        alternate = object()
+        self.assertIs(ib(obj=adapted, alternate=alternate), alternate)
+        self.assertIs(ib(adapted, alternate=alternate), alternate)
+
+    def test___call___w_bad_arguments(self):
+        ib = self._makeOne(False)
+        adapted = object()
+        self.assertRaises(TypeError, ib)
+        self.assertRaises(TypeError, ib, adapted, None, None)
+        self.assertRaises(TypeError, ib, adapted, obj=adapted)
+        self.assertRaises(TypeError, ib, adapted, other=None)
+        self.assertRaises(TypeError, ib, alternate=None)
+
+    def test_name_and_module_interned(self):
+        import sys
+        name = ''.join(['I', 'Interned'])
+        module = ''.join(['interned', '.module'])
+        ib = self._makeOne(name=name, module=module)
+        self.assertIs(ib.__name__, sys.intern(name))
+        self.assertIs(ib.__ibmodule__, sys.intern(module))
+
+    def test_name_and_module_not_str(self):
+        class Name(str):
+            pass
+
+        name = Name('IFoo')
+        ib = self._makeOne(name=name)
+        self.assertIs(ib.__name__, name)
+        self.assertIsNone(ib.__ibmodule__)
+
+    def test_comparison_w_equal_names(self):
+        ib = self._makeOne(name=''.join(['I', 'Foo']), module='mod')
+        other = self._makeOne(name=''.join(['I', 'Foo']), module='mod')
+        self.assertIsNot(ib, other)
+        self.assertTrue(ib == other)
+        self.assertFalse(ib != other)
+        self.assertFalse(ib < other)
+        self.assertTrue(ib <= other)
+        self.assertEqual(hash(ib), hash(other))
+
+    def test_comparison_w_different_names(self):
+        ib = self._makeOne(name='IFoo')
+        other = self._makeOne(name='IFoo2')
+        self.assertFalse(ib == other)
+        self.assertTrue(ib != other)
+        self.assertTrue(ib < other)
+        self.assertFalse(other < ib)
+
+    def test_comparison_w_str_subclass_names(self):
+        class Name(str):
+            pass
+
+        ib = self._makeOne(name=Name('IFoo'))
+        self.assertTrue(ib == self._makeOne(name='IFoo'))
+        self.assertFalse(ib != self._makeOne(name='IFoo'))
+        self.assertFalse(ib == self._makeOne(name='IFoo2'))
+        self.assertTrue(ib != self._makeOne(name=Name('IFoo2')))
+
 
 class InterfaceBaseTests(
     InterfaceBaseTestsMixin,
@@ -491,6 +552,177 @@ class InterfaceBasePyTests(InterfaceBaseTestsMixin, unittest.TestCase):
             self.assertEqual(_missed, [(ib, adapted)])
 
 
+class AdapterHookTestsMixin:
+
+    def _getTargetClass(self):
+        from zope.interface.interface import AdapterHook
+        return AdapterHook
+
+    def _getFallbackClass(self):
+        # pylint:disable=no-name-in-module
+        from zope.interface.interface import AdapterHookPy
+        return AdapterHookPy
+
+    def _makeOne(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def _makeInterfaces(self):
+        from zope.interface import Interface
+
+        class IBase(Interface):
+            pass
+
+        class IDerived(IBase):
+            pass
+
+        class IOther(Interface):
+            pass
+
+        return IBase, IDerived, IOther
+
+    def test_ctor_defaults(self):
+        def _hook(iface, obj):
+            raise AssertionError("Not called")
+
+        hook = self._makeOne(_hook)
+        self.assertIs(hook.hook, _hook)
+        self.assertEqual(hook.provided, ())
+        self.assertEqual(hook.calls, 0)
+        self.assertEqual(hook.hits, 0)
+        self.assertEqual(hook.skips, 0)
+
+    def test_ctor_w_provided(self):
+        IBase, IDerived, _ = self._makeInterfaces()
+        hook = self._makeOne(None, provided=[IBase, IDerived])
+        self.assertEqual(hook.provided, (IBase, IDerived))
+
+    def test___call___wo_provided(self):
+        IBase, _, _ = self._makeInterfaces()
+        _called = []
+
+        def _hook(iface, obj):
+            _called.append((iface, obj))
+            return obj
+
+        hook = self._makeOne(_hook)
+        self.assertIs(hook(IBase, self), self)
+        self.assertIsNone(hook(IBase, None))
+        self.assertEqual(_called, [(IBase, self), (IBase, None)])
+        self.assertEqual(hook.calls, 2)
+        self.assertEqual(hook.hits, 1)
+        self.assertEqual(hook.skips, 0)
+
+    def test___call___w_provided(self):
+        IBase, IDerived, IOther = self._makeInterfaces()
+        _called = []
+
+        def _hook(iface, obj):
+            _called.append(iface)
+            return obj
+
+        hook = self._makeOne(_hook, (IDerived,))
+        self.assertIs(hook(IDerived, self), self)
+        self.assertIs(hook(obj=self, iface=IBase), self)
+        self.assertIsNone(hook(IOther, self))
+        self.assertEqual(_called, [IDerived, IBase])
+        self.assertEqual(hook.calls, 2)
+        self.assertEqual(hook.hits, 2)
+        self.assertEqual(hook.skips, 1)
+
+    def test___call___w_provided_not_specifications(self):
+        IBase, _, IOther = self._makeInterfaces()
+
+        class Provided:
+            def isOrExtends(self, iface):
+                return iface is IBase
+
+        hook = self._makeOne(lambda iface, obj: obj, [Provided()])
+        self.assertIs(hook(IBase, self), self)
+        self.assertIsNone(hook(IOther, self))
+        self.assertEqual(hook.calls, 1)
+        self.assertEqual(hook.skips, 1)
+
+    def test___call___hook_raises(self):
+        IBase, _, _ = self._makeInterfaces()
+
+        def _hook(iface, obj):
+            raise ValueError(iface)
+
+        hook = self._makeOne(_hook)
+        self.assertRaises(ValueError, hook, IBase, self)
+        self.assertEqual(hook.calls, 1)
+        self.assertEqual(hook.hits, 0)
+
+    def test_counters_can_be_reset(self):
+        IBase, _, IOther = self._makeInterfaces()
+        hook = self._makeOne(lambda iface, obj: obj, [IBase])
+        hook(IBase, self)
+        hook(IOther, self)
+        hook.calls = hook.hits = hook.skips = 0
+        self.assertEqual((hook.calls, hook.hits, hook.skips), (0, 0, 0))
+
+    def test___adapt___uses_filtered_hooks(self):
+        from zope.interface.interface import adapter_hooks
+        IBase, IDerived, IOther = self._makeInterfaces()
+        _called = []
+
+        def _hook(iface, obj):
+            _called.append(iface)
+
+        other = self._makeOne(_hook, [IOther])
+        derived = self._makeOne(lambda iface, obj: (iface, obj), [IDerived])
+
+        old_adapter_hooks = adapter_hooks[:]
+        adapter_hooks[:] = [other, derived]
+        try:
+            self.assertEqual(IBase(self), (IBase, self))
+            self.assertEqual(IOther(self, None), None)
+        finally:
+            adapter_hooks[:] = old_adapter_hooks
+
+        self.assertEqual(_called, [IOther])
+        self.assertEqual((other.calls, other.hits, other.skips), (1, 0, 1))
+        self.assertEqual((derived.calls, derived.hits, derived.skips),
+                         (1, 1, 1))
+
+
+class AdapterHookTests(
+    AdapterHookTestsMixin,
+    OptimizationTestMixin,
+    unittest.TestCase,
+):
+    # Tests that work with the C implementation
+    pass
+
+
+class AdapterHookPyTests(AdapterHookTestsMixin, unittest.TestCase):
+    # Tests that only work with the Python implementation
+
+    _getTargetClass = AdapterHookTestsMixin._getFallbackClass
+
+    def test___adapt___uses_filtered_hooks(self):
+        from zope.interface import interface
+        from zope.interface.interface import InterfaceBasePy
+
+        class IB(InterfaceBasePy):
+            def providedBy(self, obj):
+                return False
+
+        ib = IB('IB', __name__)
+        _called = []
+
+        class Provided:
+            def isOrExtends(self, iface):
+                _called.append(iface)
+                return False
+
+        hook = self._makeOne(None, [Provided()])
+        with _Monkey(interface, adapter_hooks=[hook]):
+            self.assertIsNone(ib.__adapt__(self))
+        self.assertEqual(_called, [ib])
+        self.assertEqual(hook.skips, 1)
+
+
 class SpecificationTests(unittest.TestCase):
 
     def _getTargetClass(self):
@@ -572,6 +804,96 @@ class SpecificationTests(unittest.TestCase):
         self.assertIsNone(spec._v_attrs)
         self.assertNotIn(IFoo, spec._implied)
 
+    def test_filterIsOrExtends_after_change(self):
+        from zope.interface.interface import Interface
+
+        class IFoo(Interface):
+            pass
+
+        spec = self._makeOne()
+        self.assertEqual(spec.filterIsOrExtends([IFoo]), ())
+        spec.__bases__ = (IFoo,)
+        self.assertEqual(spec.filterIsOrExtends([IFoo]), (IFoo,))
+
+    def test_changed_records_spec_epoch(self):
+        from zope.interface.interface import Interface
+        from zope.interface.interface import _current_spec_epoch
+
+        class IFoo(Interface):
+            pass
+
+        epoch = _current_spec_epoch()
+        spec = self._makeOne()
+        # Creating a specification doesn't move the epoch.
+        self.assertEqual(spec._generation, 0)
+        self.assertEqual(_current_spec_epoch(), epoch)
+        spec.__bases__ = (IFoo,)
+        self.assertEqual(_current_spec_epoch(), epoch + 1)
+        self.assertEqual(spec._generation, epoch + 1)
+        # Dependents change too.
+        dependent = self._makeOne((spec,))
+        IFoo.changed(IFoo)
+        self.assertEqual(IFoo._generation, epoch + 2)
+        self.assertEqual(spec._generation, epoch + 3)
+        self.assertEqual(dependent._generation, epoch + 4)
+
+    def test_changed_shares_iro_with_sro(self):
+        from zope.interface.interface import Interface
+
+        class IFoo(Interface):
+            pass
+
+        spec = self._makeOne((IFoo,))
+        self.assertEqual(spec.__sro__, (spec, IFoo, Interface))
+        self.assertEqual(spec.__iro__, (IFoo, Interface))
+
+        self.assertIs(IFoo.__iro__, IFoo.__sro__)
+
+    def test_filterIsOrExtends(self):
+        from zope.interface.interface import Interface
+
+        class IFoo(Interface):
+            pass
+
+        class IBar(IFoo):
+            pass
+
+        class IBaz(Interface):
+            pass
+
+        spec = self._makeOne([IBar])
+        other = self._makeOne()
+        self.assertEqual(
+            spec.filterIsOrExtends(
+                [IBaz, IFoo, Interface, spec, other, IBar, None, IFoo]),
+            (IFoo, Interface, spec, IBar, IFoo))
+        self.assertEqual(
+            spec.filterIsOrExtends(iter([IBar])), (IBar,))
+        self.assertEqual(spec.filterIsOrExtends(()), ())
+
+    def test_filterIsOrExtends_matches_isOrExtends(self):
+        from zope.interface.interface import InterfaceClass
+
+        ifaces = [InterfaceClass('I0')]
+        for i in range(1, 40):
+            ifaces.append(InterfaceClass('I%d' % i, (ifaces[i // 2],)))
+        for iface in ifaces:
+            spec = self._makeOne([iface])
+            self.assertEqual(
+                spec.filterIsOrExtends(ifaces),
+                tuple(i for i in ifaces if spec.isOrExtends(i)))
+
+    def test_filterIsOrExtends_uses_equality(self):
+        from zope.interface.interface import InterfaceClass
+
+        IFoo = InterfaceClass('IFoo', __module__=__name__)
+        IFoo2 = InterfaceClass('IFoo', __module__=__name__)
+        IBar = InterfaceClass('IBar', __module__=__name__)
+        spec = self._makeOne([IFoo])
+        self.assertTrue(spec.isOrExtends(IFoo2))
+        self.assertEqual(
+            spec.filterIsOrExtends([IBar, IFoo2]), (IFoo2,))
+
     def test_interfaces_skips_already_seen(self):
         from zope.interface.interface import Interface
 
@@ -618,6 +940,63 @@ class SpecificationTests(unittest.TestCase):
         self.assertIs(spec.get('foo'), IFoo.get('foo'))
         self.assertIs(spec.get('bar'), IBar.get('bar'))
 
+    def test_get_w_default(self):
+        spec = self._makeOne()
+        marker = object()
+        self.assertIs(spec.get('foo', marker), marker)
+        self.assertIs(spec.get('foo', default=marker), marker)
+        self.assertIsNone(spec.get(name='foo'))
+
+    def test_get_caches_all_names(self):
+        from zope.interface.interface import Attribute
+        from zope.interface.interface import Interface
+
+        class IFoo(Interface):
+            foo = Attribute('foo')
+
+        class IBar(IFoo):
+            foo = Attribute('foo')
+            bar = Attribute('bar')
+
+        spec = self._makeOne([IBar])
+        self.assertIsNone(spec.get('baz'))
+        self.assertEqual(spec._v_all_attrs, {
+            'foo': IBar.direct('foo'),
+            'bar': IBar.direct('bar'),
+        })
+        self.assertEqual(spec._v_attrs, {})
+        self.assertIs(spec.get('foo'), IBar.direct('foo'))
+        self.assertEqual(spec._v_attrs, {'foo': IBar.direct('foo')})
+
+    def test_get_w_seeded_v_attrs(self):
+        from zope.interface.interface import Attribute
+        from zope.interface.interface import Interface
+
+        class IFoo(Interface):
+            foo = Attribute('foo')
+
+        spec = self._makeOne([IFoo])
+        marker = object()
+        spec._v_attrs = {'x': marker}
+        self.assertIs(spec.get('x'), marker)
+        self.assertIs(spec.get('foo'), IFoo.direct('foo'))
+        self.assertIsNone(spec.get('bar'))
+
+    def test_get_after_changed(self):
+        from zope.interface.interface import Attribute
+        from zope.interface.interface import Interface
+
+        class IFoo(Interface):
+            foo = Attribute('foo')
+
+        class IBar(Interface):
+            bar = Attribute('bar')
+
+        spec = self._makeOne([IFoo])
+        self.assertIsNone(spec.get('bar'))
+        spec.__bases__ = (IFoo, IBar)
+        self.assertIs(spec.get('bar'), IBar.direct('bar'))
+
     def test_multiple_inheritance_no_interfaces(self):
         # If we extend an object that implements interfaces,
         # plus one that doesn't, we do not interject `Interface`
@@ -760,6 +1139,7 @@ class InterfaceClassTests(unittest.TestCase):
     def test_interfaces(self):
         iface = self._makeOne()
         self.assertEqual(list(iface.interfaces()), [iface])
+        self.assertEqual(iface.interfacesTuple, (iface,))
 
     def test_getBases(self):
         iface = self._makeOne()
@@ -973,6 +1353,70 @@ class InterfaceClassTests(unittest.TestCase):
             ]
         )
 
+    def test_names_and_descriptions_w_all_True_follow__iro__(self):
+        from zope.interface.interface import Attribute
+        root = self._makeOne('IRoot', attrs={'foo': Attribute('Foo', '')})
+        left = self._makeOne('ILeft', bases=(root,))
+        right_foo = Attribute('Foo', '')
+        right = self._makeOne('IRight', bases=(root,),
+                              attrs={'foo': right_foo})
+        derived = self._makeOne('IDerived', bases=(left, right),
+                                attrs={'bar': Attribute('Bar', '')})
+        self.assertEqual(derived.__iro__, (derived, left, right, root,
+                                           derived.__iro__[-1]))
+        # Like ``get``, the first interface in the resolution order
+        # that defines a name wins.
+        self.assertIs(derived.get('foo'), right_foo)
+        self.assertEqual(list(derived.namesAndDescriptions(all=True)),
+                         [('foo', right_foo), ('bar', derived.direct('bar'))])
+        self.assertEqual(list(derived.names(all=True)), ['bar', 'foo'])
+        self.assertEqual(list(derived), ['bar', 'foo'])
+
+    def test_names_and_descriptions_w_all_True_order(self):
+        from zope.interface.interface import Attribute
+
+        def names(iface):
+            # names(all=True) has always listed our own names first,
+            # then those of the bases, depth first.
+            r = dict.fromkeys(iface.names())
+            for base in iface.__bases__:
+                r.update(dict.fromkeys(names(base)))
+            return list(r)
+
+        def names_and_descriptions(iface):
+            # namesAndDescriptions(all=True) has always listed those
+            # of the bases, the last base first, then our own.
+            r = {}
+            for base in iface.__bases__[::-1]:
+                r.update(names_and_descriptions(base))
+            r.update(iface.namesAndDescriptions())
+            return r
+
+        def make(name, bases=(), *attrs):
+            return self._makeOne(
+                name, bases, {a: Attribute(a) for a in attrs})
+
+        root = make('IRoot', (), 'a', 'b')
+        left = make('ILeft', (root,), 'c', 'a')
+        right = make('IRight', (root,), 'd')
+        other = make('IOther', (), 'e', 'd')
+        derived = make('IDerived', (left, right, other), 'f', 'b')
+        for iface in root, left, right, other, derived:
+            self.assertEqual(list(iface.names(all=True)), names(iface))
+            self.assertEqual(
+                [name for name, _ in iface.namesAndDescriptions(all=True)],
+                list(names_and_descriptions(iface)))
+
+    def test_names_w_all_True_after_changing_bases(self):
+        from zope.interface.interface import Attribute
+        one = self._makeOne('IOne', attrs={'foo': Attribute('Foo', '')})
+        two = self._makeOne('ITwo', attrs={'bar': Attribute('Bar', '')})
+        derived = self._makeOne('IDerived', bases=(one,))
+        self.assertEqual(list(derived.names(all=True)), ['foo'])
+        derived.__bases__ = (one, two)
+        self.assertEqual(list(derived.names(all=True)), ['foo', 'bar'])
+        self.assertIn('bar', derived)
+
     def test_getDescriptionFor_miss(self):
         one = self._makeOne()
         self.assertRaises(KeyError, one.getDescriptionFor, 'nonesuch')
@@ -2745,6 +3189,47 @@ class Test_fromFunction(unittest.TestCase):
         self.assertEqual(info['varargs'], 'args')
         self.assertEqual(info['kwargs'], 'kw')
 
+    def test_signature_computed_lazily(self):
+
+        def _func(foo, bar='baz', *args, **kw):
+            "DOCSTRING"
+
+        method = self._callFUT(_func)
+        self.assertNotIn('positional', method.__dict__)
+        self.assertEqual(method.positional, ('foo', 'bar'))
+        # Computing one item computes them all, once.
+        info = method._signature
+        self.assertEqual(method.required, ('foo',))
+        self.assertEqual(method.optional, {'bar': 'baz'})
+        self.assertEqual(method.varargs, 'args')
+        self.assertEqual(method.kwargs, 'kw')
+        self.assertIs(method._signature, info)
+
+    def test_signature_does_not_keep_function(self):
+        import gc
+        import weakref
+
+        def _func(foo):
+            "DOCSTRING"
+
+        method = self._callFUT(_func)
+        ref = weakref.ref(_func)
+        del _func
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(method.positional, ('foo',))
+
+    def test_assignment_before_computing_wins(self):
+
+        def _func(foo, bar='baz'):
+            "DOCSTRING"
+
+        method = self._callFUT(_func)
+        method.positional = ('bar',)
+        self.assertEqual(method.positional, ('bar',))
+        self.assertEqual(method.required, ('foo',))
+        self.assertEqual(method.getSignatureString(), "(bar='baz')")
+
 
 class Test_fromMethod(unittest.TestCase):
 
@@ -128,3 +128,47 @@ class InterfaceClassTests(unittest.TestCase):
         self.assertTrue(
             ro.is_consistent(implementedBy(self._getTargetClass()))
         )
+
+
+class PackageTests(unittest.TestCase):
+
+    def test___all___matches_IInterfaceDeclaration(self):
+        import zope.interface
+        from zope.interface.interfaces import IInterfaceDeclaration
+        self.assertEqual(
+            set(zope.interface.__all__),
+            {'Interface', 'Attribute'} | set(IInterfaceDeclaration))
+
+    def test_package_provides_IInterfaceDeclaration(self):
+        import zope.interface
+        from zope.interface.interfaces import IInterfaceDeclaration
+        self.assertTrue(IInterfaceDeclaration.providedBy(zope.interface))
+
+    def test_import_does_not_load_typing(self):
+        import os
+        import subprocess
+        import sys
+        code = '\n'.join([
+            'import sys',
+            'import zope.interface',
+            'assert "typing" not in sys.modules',
+        ])
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.check_call([sys.executable, '-S', '-c', code], env=env)
+
+    def test_import_wires_core_classes(self):
+        import os
+        import subprocess
+        import sys
+        code = '\n'.join([
+            'import zope.interface',
+            'from zope.interface import providedBy',
+            'provided = list(providedBy(zope.interface.Interface))',
+            'from zope.interface.interfaces import IElement',
+            'from zope.interface.interfaces import IInterface',
+            'from zope.interface.interfaces import ISpecification',
+            'expected = [IInterface, ISpecification, IElement]',
+            'assert provided == expected, provided',
+        ])
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.check_call([sys.executable, '-S', '-c', code], env=env)
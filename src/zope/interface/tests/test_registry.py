@@ -717,6 +717,31 @@ class ComponentsTests(unittest.TestCase):
         self.assertEqual(comp.utilities._subscribers[0][ifoo][''],
                          (_other_reg,))
 
+    def test_register_unregister_many_unhashable_utilities(self):
+        from zope.interface.declarations import InterfaceClass
+
+        class IFoo(InterfaceClass):
+            pass
+
+        ifoo = IFoo('IFoo')
+        utilities = [{'i': i} for i in range(100)]
+        comp = self._makeOne()
+        for i, utility in enumerate(utilities):
+            comp.registerUtility(utility, ifoo, str(i), event=False)
+        # An equal utility under another name is only subscribed once.
+        comp.registerUtility({'i': 0}, ifoo, 'again', event=False)
+        self.assertEqual(
+            list(comp.getAllUtilitiesRegisteredFor(ifoo)), utilities)
+
+        for i, utility in enumerate(utilities[:50]):
+            self.assertTrue(comp.unregisterUtility(utility, ifoo, str(i)))
+        self.assertEqual(
+            list(comp.getAllUtilitiesRegisteredFor(ifoo)),
+            [{'i': 0}] + utilities[50:])
+        self.assertTrue(comp.unregisterUtility({'i': 0}, ifoo, 'again'))
+        self.assertEqual(
+            list(comp.getAllUtilitiesRegisteredFor(ifoo)), utilities[50:])
+
     def test_registeredUtilities_empty(self):
         comp = self._makeOne()
         self.assertEqual(list(comp.registeredUtilities()), [])
@@ -753,6 +778,90 @@ class ComponentsTests(unittest.TestCase):
         self.assertIs(reg[1].info, _info)
         self.assertIsNone(reg[1].factory)
 
+    def _makeQueryInterfaces(self):
+        from zope.interface.declarations import InterfaceClass
+
+        class IFoo(InterfaceClass):
+            pass
+
+        ibase = IFoo('IBase')
+        iderived = IFoo('IDerived', (ibase,))
+        iother = IFoo('IOther')
+        return ibase, iderived, iother
+
+    def test_registeredUtilities_filtered(self):
+        ibase, iderived, iother = self._makeQueryInterfaces()
+        comp = self._makeOne()
+        comp.registerUtility(object(), ibase)
+        comp.registerUtility(object(), ibase, 'a')
+        comp.registerUtility(object(), iderived, 'a')
+        comp.registerUtility(object(), iother)
+
+        def _find(**kw):
+            return [(reg.provided, reg.name)
+                    for reg in comp.registeredUtilities(**kw)]
+
+        self.assertEqual(_find(provided=ibase),
+                         [(ibase, ''), (ibase, 'a')])
+        self.assertEqual(_find(provided=ibase, subinterfaces=True),
+                         [(ibase, ''), (ibase, 'a'), (iderived, 'a')])
+        self.assertEqual(_find(provided=iderived, subinterfaces=True),
+                         [(iderived, 'a')])
+        self.assertEqual(_find(name='a'),
+                         [(ibase, 'a'), (iderived, 'a')])
+        self.assertEqual(_find(provided=iother, name='a'), [])
+        self.assertEqual(_find(name='b'), [])
+        self.assertEqual(len(_find()), 4)
+
+    def test_registeredUtilities_filtered_after_changes(self):
+        ibase, iderived, _ = self._makeQueryInterfaces()
+        comp = self._makeOne()
+        first = object()
+        comp.registerUtility(first, ibase)
+        self.assertEqual(
+            [reg.component for reg in comp.registeredUtilities(ibase)],
+            [first])
+
+        second = object()
+        comp.registerUtility(second, ibase)
+        comp.registerUtility(object(), iderived, 'a')
+        self.assertEqual(
+            [reg.component for reg in comp.registeredUtilities(ibase)],
+            [second])
+
+        # Unregistering while iterating over a query is fine.
+        for reg in comp.registeredUtilities(ibase, subinterfaces=True):
+            self.assertTrue(comp.unregisterUtility(
+                reg.component, reg.provided, reg.name))
+        self.assertEqual(
+            list(comp.registeredUtilities(ibase, subinterfaces=True)), [])
+
+        # Registrations that are replaced without going through our
+        # methods are noticed.
+        comp._utility_registrations = {(ibase, ''): (first, '', None)}
+        self.assertEqual(
+            [reg.component for reg in comp.registeredUtilities(ibase)],
+            [first])
+
+    def test_registeredUtilities_after_registrations_reloaded(self):
+        ibase, _, iother = self._makeQueryInterfaces()
+        comp = self._makeOne()
+        comp.registerUtility(object(), ibase)
+        saved = (dict(comp._utility_registrations),
+                 comp._registrations_generation)
+        self.assertTrue(comp.unregisterUtility(provided=ibase))
+        comp.registerUtility(object(), iother)
+        self.assertEqual(list(comp.registeredUtilities(ibase)), [])
+        # The same dict, with the same number of registrations, gets
+        # its earlier contents back, as a persistent mapping does when
+        # a transaction is aborted. So does the generation.
+        comp._utility_registrations.clear()
+        comp._utility_registrations.update(saved[0])
+        comp._registrations_generation = saved[1]
+        self.assertEqual(
+            [reg.provided for reg in comp.registeredUtilities(ibase)],
+            [ibase])
+
     def test_queryUtility_miss_no_default(self):
         from zope.interface.declarations import InterfaceClass
 
@@ -786,6 +895,29 @@ class ComponentsTests(unittest.TestCase):
         comp.registerUtility(_to_reg, ifoo)
         self.assertIs(comp.queryUtility(ifoo), _to_reg)
 
+    def test_queryUtility_from_bases_after_changes(self):
+        ibase, iderived, _ = self._makeQueryInterfaces()
+        base = self._makeOne('base')
+        other = self._makeOne('other')
+        comp = self._makeOne('comp', (base,))
+        first, second, third = object(), object(), object()
+        base.registerUtility(first, iderived)
+        self.assertIs(comp.queryUtility(iderived), first)
+        self.assertIs(comp.queryUtility(ibase), first)
+        self.assertIsNone(comp.queryUtility(iderived, 'a'))
+
+        base.registerUtility(second, iderived, 'a')
+        self.assertIs(comp.queryUtility(iderived, 'a'), second)
+        comp.registerUtility(third, ibase)
+        self.assertIs(comp.queryUtility(ibase), third)
+        self.assertIs(comp.queryUtility(iderived), first)
+
+        comp.__bases__ = (other,)
+        self.assertIsNone(comp.queryUtility(iderived))
+        self.assertIs(comp.queryUtility(ibase), third)
+        other.registerUtility(second, iderived)
+        self.assertIs(comp.getUtility(iderived), second)
+
     def test_getUtility_miss(self):
         from zope.interface.declarations import InterfaceClass
         from zope.interface.interfaces import ComponentLookupError
@@ -1363,6 +1495,93 @@ class ComponentsTests(unittest.TestCase):
         self.assertIs(reg[1].info, _info)
         self.assertIs(reg[1].factory, _Factory)
 
+    def test_registeredAdapters_filtered(self):
+        from zope.interface.declarations import implementedBy
+        ibase, iderived, iother = self._makeQueryInterfaces()
+
+        class _Factory:
+            pass
+
+        class _Context:
+            pass
+
+        comp = self._makeOne()
+        comp.registerAdapter(_Factory, (ibase,), iother)
+        comp.registerAdapter(_Factory, (iother,), ibase, 'a')
+        comp.registerAdapter(_Factory, (ibase, iother), iderived)
+        comp.registerAdapter(_Factory, (iother, ibase), iderived, 'a')
+        comp.registerAdapter(_Factory, (_Context,), ibase)
+
+        def _find(*args, **kw):
+            return [(reg.required, reg.provided, reg.name)
+                    for reg in comp.registeredAdapters(*args, **kw)]
+
+        self.assertEqual(_find(provided=iderived), [
+            ((ibase, iother), iderived, ''),
+            ((iother, ibase), iderived, 'a'),
+        ])
+        self.assertEqual(_find(provided=ibase, subinterfaces=True), [
+            ((iother,), ibase, 'a'),
+            ((implementedBy(_Context),), ibase, ''),
+            ((ibase, iother), iderived, ''),
+            ((iother, ibase), iderived, 'a'),
+        ])
+        self.assertEqual(_find([ibase]), [
+            ((ibase,), iother, ''),
+        ])
+        self.assertEqual(_find([_Context]), [
+            ((implementedBy(_Context),), ibase, ''),
+        ])
+        self.assertEqual(_find([None, ibase]), [
+            ((iother, ibase), iderived, 'a'),
+        ])
+        self.assertEqual(_find([ibase, None]), [
+            ((ibase, iother), iderived, ''),
+        ])
+        self.assertEqual(len(_find([None])), 3)
+        self.assertEqual(_find(name='a'), [
+            ((iother,), ibase, 'a'),
+            ((iother, ibase), iderived, 'a'),
+        ])
+        self.assertEqual(_find([iother], ibase, 'a'), [
+            ((iother,), ibase, 'a'),
+        ])
+        self.assertEqual(_find([iother], iderived), [])
+        self.assertEqual(len(_find()), 5)
+
+        # Replace one registration, remove one, and add another.
+        comp.registerAdapter(_Context, (iother,), ibase, 'a')
+        self.assertEqual(
+            [reg.factory for reg in comp.registeredAdapters(name='a')],
+            [_Context, _Factory])
+        self.assertTrue(comp.unregisterAdapter(
+            _Factory, (ibase, iother), iderived))
+        comp.registerAdapter(_Factory, (ibase, iother), iderived, 'b')
+        self.assertEqual(_find(provided=iderived), [
+            ((iother, ibase), iderived, 'a'),
+            ((ibase, iother), iderived, 'b'),
+        ])
+
+    def test_registeredAdapters_after_registrations_reloaded(self):
+        ibase, _, iother = self._makeQueryInterfaces()
+
+        class _Factory:
+            pass
+
+        comp = self._makeOne()
+        comp.registerAdapter(_Factory, (ibase,), iother)
+        saved = (dict(comp._adapter_registrations),
+                 comp._registrations_generation)
+        self.assertTrue(comp.unregisterAdapter(_Factory, (ibase,), iother))
+        comp.registerAdapter(_Factory, (iother,), ibase)
+        self.assertEqual(list(comp.registeredAdapters([ibase])), [])
+        comp._adapter_registrations.clear()
+        comp._adapter_registrations.update(saved[0])
+        comp._registrations_generation = saved[1]
+        self.assertEqual(
+            [reg.required for reg in comp.registeredAdapters([ibase])],
+            [(ibase,)])
+
     def test_queryAdapter_miss_no_default(self):
         from zope.interface.declarations import InterfaceClass
 
@@ -2527,6 +2746,232 @@ class ComponentsTests(unittest.TestCase):
         self.assertEqual(event.object.info, '')
         self.assertIs(event.object.factory, _Factory)
 
+    def _makeSubscriptionInterfaces(self):
+        from zope.interface.declarations import InterfaceClass
+
+        class IFoo(InterfaceClass):
+            pass
+
+        return IFoo('IFoo'), IFoo('IBar'), IFoo('IBaz')
+
+    def test_registeredSubscriptionAdapters_filtered(self):
+        ifoo, ibar, ibaz = self._makeSubscriptionInterfaces()
+
+        def _factory1(context):
+            raise NotImplementedError()
+
+        def _factory2(context):
+            raise NotImplementedError()
+
+        comp = self._makeOne()
+        comp.registerSubscriptionAdapter(_factory1, (ibar,), ifoo)
+        comp.registerSubscriptionAdapter(_factory2, (ibar,), ifoo)
+        comp.registerSubscriptionAdapter(_factory1, (ibaz,), ifoo)
+        comp.registerSubscriptionAdapter(_factory1, (ibar,), ibaz)
+        comp.registerSubscriptionAdapter(_factory1, (ibar,), ifoo, info='x')
+
+        def _find(**kw):
+            return [
+                (reg.required, reg.provided, reg.factory, reg.info)
+                for reg in comp.registeredSubscriptionAdapters(**kw)
+            ]
+
+        self.assertEqual(_find(required=[ibar], provided=ifoo), [
+            ((ibar,), ifoo, _factory1, ''),
+            ((ibar,), ifoo, _factory2, ''),
+            ((ibar,), ifoo, _factory1, 'x'),
+        ])
+        self.assertEqual(_find(required=(ibar,)), [
+            ((ibar,), ifoo, _factory1, ''),
+            ((ibar,), ifoo, _factory2, ''),
+            ((ibar,), ibaz, _factory1, ''),
+            ((ibar,), ifoo, _factory1, 'x'),
+        ])
+        self.assertEqual(_find(provided=ibaz), [
+            ((ibar,), ibaz, _factory1, ''),
+        ])
+        self.assertEqual(_find(factory=_factory2), [
+            ((ibar,), ifoo, _factory2, ''),
+        ])
+        self.assertEqual(_find(required=(ibar,), factory=_factory1), [
+            ((ibar,), ifoo, _factory1, ''),
+            ((ibar,), ibaz, _factory1, ''),
+            ((ibar,), ifoo, _factory1, 'x'),
+        ])
+        self.assertEqual(_find(required=(ibaz,), factory=_factory2), [])
+        self.assertEqual(len(_find()), 5)
+
+    def test_unregisterSubscriptionAdapter_keeps_order(self):
+        ifoo, ibar, _ = self._makeSubscriptionInterfaces()
+        factories = []
+        for i in range(20):
+            def _factory(context):
+                raise NotImplementedError()
+            factories.append(_factory)
+
+        comp = self._makeOne()
+        for factory in factories:
+            comp.registerSubscriptionAdapter(
+                factory, (ibar,), ifoo, event=False)
+        for factory in factories[5:15]:
+            self.assertTrue(comp.unregisterSubscriptionAdapter(
+                factory, (ibar,), ifoo))
+        self.assertFalse(comp.unregisterSubscriptionAdapter(
+            factories[5], (ibar,), ifoo))
+
+        expected = factories[:5] + factories[15:]
+        self.assertEqual(
+            [reg.factory for reg in comp.registeredSubscriptionAdapters()],
+            expected)
+        self.assertEqual(
+            [f for _, _, _, f, _ in comp._subscription_registrations],
+            expected)
+        self.assertEqual(comp.adapters.subscriptions((ibar,), ifoo), expected)
+
+    def test_registeredHandlers_filtered(self):
+        ifoo, ibar, _ = self._makeSubscriptionInterfaces()
+
+        def _factory1(context):
+            raise NotImplementedError()
+
+        def _factory2(context):
+            raise NotImplementedError()
+
+        comp = self._makeOne()
+        comp.registerHandler(_factory1, (ifoo,))
+        comp.registerHandler(_factory2, (ifoo,))
+        comp.registerHandler(_factory1, (ibar,))
+
+        def _find(**kw):
+            return [
+                (reg.required, reg.factory)
+                for reg in comp.registeredHandlers(**kw)
+            ]
+
+        self.assertEqual(_find(required=(ifoo,)), [
+            ((ifoo,), _factory1),
+            ((ifoo,), _factory2),
+        ])
+        self.assertEqual(_find(factory=_factory1), [
+            ((ifoo,), _factory1),
+            ((ibar,), _factory1),
+        ])
+        self.assertEqual(_find(required=[ibar], factory=_factory1), [
+            ((ibar,), _factory1),
+        ])
+        self.assertEqual(_find(required=[ibar], factory=_factory2), [])
+
+    def test_registeredHandlers_filtered_w_any_required(self):
+        ifoo, ibar, _ = self._makeSubscriptionInterfaces()
+
+        def _factory(context):
+            raise NotImplementedError()
+
+        comp = self._makeOne()
+        comp.registerHandler(_factory, (ifoo, ibar))
+        comp.registerHandler(_factory, (ibar, ifoo))
+        comp.registerHandler(_factory, (ifoo,))
+        self.assertEqual(
+            [reg.required for reg in
+             comp.registeredHandlers(required=(ifoo, None))],
+            [(ifoo, ibar)])
+        self.assertEqual(
+            [reg.required for reg in
+             comp.registeredHandlers(required=(None, None),
+                                     factory=_factory)],
+            [(ifoo, ibar), (ibar, ifoo)])
+
+    def test_unregisterHandler_unhashable_factory(self):
+        ifoo, _, _ = self._makeSubscriptionInterfaces()
+
+        class _Factory:
+            __hash__ = None
+
+            def __init__(self, name):
+                self.name = name
+
+            def __eq__(self, other):
+                return self.name == getattr(other, 'name', None)
+
+            def __call__(self, context):
+                raise NotImplementedError()
+
+        comp = self._makeOne()
+        comp.registerHandler(_Factory('a'), (ifoo,))
+        comp.registerHandler(_Factory('b'), (ifoo,))
+        self.assertEqual(
+            [reg.factory.name for reg in
+             comp.registeredHandlers(factory=_Factory('b'))],
+            ['b'])
+        self.assertTrue(comp.unregisterHandler(_Factory('a'), (ifoo,)))
+        self.assertFalse(comp.unregisterHandler(_Factory('a'), (ifoo,)))
+        self.assertEqual(
+            [reg.factory.name for reg in comp.registeredHandlers()],
+            ['b'])
+
+    def test_unregisterHandler_after_registrations_replaced(self):
+        ifoo, _, _ = self._makeSubscriptionInterfaces()
+
+        def _factory1(context):
+            raise NotImplementedError()
+
+        def _factory2(context):
+            raise NotImplementedError()
+
+        comp = self._makeOne()
+        comp.registerHandler(_factory1, (ifoo,))
+        # Changes that don't go through our methods are noticed.
+        comp._handler_registrations.append(((ifoo,), '', _factory2, ''))
+        self.assertEqual(
+            [reg.factory for reg in comp.registeredHandlers(required=[ifoo])],
+            [_factory1, _factory2])
+        comp._handler_registrations = [((ifoo,), '', _factory2, '')]
+        self.assertFalse(comp.unregisterHandler(_factory1, (ifoo,)))
+        self.assertTrue(comp.unregisterHandler(_factory2, (ifoo,)))
+        self.assertEqual(comp._handler_registrations, [])
+
+    def test_registeredHandlers_after_registrations_reloaded(self):
+        ifoo, ibar, _ = self._makeSubscriptionInterfaces()
+
+        def _factory1(context):
+            raise NotImplementedError()
+
+        def _factory2(context):
+            raise NotImplementedError()
+
+        comp = self._makeOne()
+        comp.registerHandler(_factory1, (ifoo,))
+        saved = (list(comp._handler_registrations),
+                 comp._registrations_generation)
+        self.assertTrue(comp.unregisterHandler(_factory1, (ifoo,)))
+        comp.registerHandler(_factory2, (ifoo,))
+        self.assertEqual(
+            [reg.factory for reg in comp.registeredHandlers(required=[ifoo])],
+            [_factory2])
+        # The same list, with the same number of registrations, gets
+        # its earlier contents back, as a persistent list does when a
+        # transaction is aborted. So does the generation.
+        comp._handler_registrations[:] = saved[0]
+        comp._registrations_generation = saved[1]
+        self.assertEqual(
+            [reg.factory for reg in comp.registeredHandlers(required=[ifoo])],
+            [_factory1])
+
+    def test_registrations_changed_keeps_other_indexes(self):
+        ifoo, ibar, _ = self._makeSubscriptionInterfaces()
+
+        def _factory(context):
+            raise NotImplementedError()
+
+        comp = self._makeOne()
+        list(comp.registeredHandlers(required=[ifoo]))
+        index = comp._v_handler_registrations_index
+        generation = comp._registrations_generation
+        comp.registerSubscriptionAdapter(_factory, (ifoo,), ibar)
+        self.assertEqual(comp._registrations_generation, generation + 1)
+        list(comp.registeredHandlers(required=[ifoo]))
+        self.assertIs(comp._v_handler_registrations_index, index)
+
     def test_handle_empty(self):
         from zope.interface.declarations import InterfaceClass
         from zope.interface.declarations import implementer
@@ -2717,6 +3162,75 @@ class UnhashableComponentsTests(ComponentsTests):
 
         return Components
 
+
+class UnhashableComponentCounterTests(unittest.TestCase):
+
+    def _makeOne(self, otherdict=None):
+        from zope.interface.registry import _UnhashableComponentCounter
+        return _UnhashableComponentCounter(otherdict or {})
+
+    def test_ctor_copies(self):
+        hashable = object()
+        counter = self._makeOne({hashable: 2})
+        self.assertEqual(counter[hashable], 2)
+
+    def test_missing(self):
+        counter = self._makeOne()
+        self.assertEqual(counter[[]], 0)
+
+    def test_by_identity_and_equality(self):
+        counter = self._makeOne()
+        component = [1]
+        counter[component] += 1
+        counter[component] += 1
+        self.assertEqual(counter[component], 2)
+        # An equal component shares the count.
+        counter[[1]] += 1
+        self.assertEqual(counter[component], 3)
+        self.assertEqual(counter[[2]], 0)
+        del counter[[1]]
+        self.assertEqual(counter[component], 0)
+
+    def test_missing_not_kept_alive(self):
+        import gc
+        import weakref
+
+        class Component(list):
+            pass
+
+        counter = self._makeOne()
+        counter[[0]] = 1
+        component = Component([1])
+        ref = weakref.ref(component)
+        self.assertEqual(counter[component], 0)
+        del component
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_increment(self):
+        counter = self._makeOne()
+        component = [1]
+        self.assertEqual(counter.increment(component), 0)
+        self.assertEqual(counter.increment(component), 1)
+        # An equal component shares the count.
+        self.assertEqual(counter.increment([1]), 2)
+        self.assertEqual(counter.increment([2]), 0)
+        self.assertEqual(counter[component], 3)
+        self.assertEqual(counter[[2]], 1)
+
+    def test_delitem_many(self):
+        counter = self._makeOne()
+        components = [[i] for i in range(10)]
+        for component in components:
+            counter[component] = 1
+        for component in components[:7]:
+            del counter[component]
+        for i, component in enumerate(components):
+            self.assertEqual(counter[component], int(i >= 7))
+            self.assertEqual(counter[[i]], int(i >= 7))
+        counter[components[0]] = 1
+        self.assertEqual(counter[[0]], 1)
+
 # Test _getUtilityProvided, _getAdapterProvided, _getAdapterRequired via their
 # callers (Component.registerUtility, Component.registerAdapter).
 
@@ -3353,6 +3867,23 @@ class TestPersistentComponents(unittest.TestCase):
 
         self._check_equality_after_pickle(comp2)
 
+    def test_pickles_with_handler_registrations(self):
+        import pickle
+        comp = self._makeOne()
+        comp.registerHandler(_handler1, (Interface,))
+        comp.registerHandler(_handler2, (Interface,))
+        # Build the index, which isn't pickled.
+        self.assertEqual(len(list(comp.registeredHandlers(
+            factory=_handler1))), 1)
+
+        comp2 = pickle.loads(pickle.dumps(comp))
+        self.assertTrue(comp2.unregisterHandler(_handler1, (Interface,)))
+        self.assertEqual(
+            [reg.factory for reg in comp2.registeredHandlers()],
+            [_handler2])
+        self.assertEqual(comp2.adapters.subscriptions((Interface,), None),
+                         [_handler2])
+
 
 class TestPersistentDictComponents(TestPersistentComponents):
 
@@ -3375,6 +3906,14 @@ class TestPersistentComponentsDict(TestPersistentDictComponents):
         return PersistentComponentsDict
 
 
+def _handler1(event):
+    raise NotImplementedError()
+
+
+def _handler2(event):
+    raise NotImplementedError()
+
+
 class _Monkey:
     # context-manager for replacing module names in the scope of a test.
     def __init__(self, module, **kw):
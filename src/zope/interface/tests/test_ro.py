@@ -147,6 +147,18 @@ class Test_ro(unittest.TestCase):
         self.assertEqual(self._callFUT(Qux),
                          [Qux, Bar, Baz, Foo, object])
 
+    def test_w_deep_diamonds(self):
+        # Visiting every path through this takes 2**40 steps.
+        base = object
+        expected = [object]
+        for i in range(40):
+            left = type('Left%d' % i, (base,), {})
+            right = type('Right%d' % i, (base,), {})
+            base = type('Diamond%d' % i, (left, right), {})
+            expected = [base, left, right] + expected
+
+        self.assertEqual(self._callFUT(base), expected)
+
     def _make_IOErr(self):
         # This can't be done in the standard C3 ordering.
 
@@ -481,6 +493,54 @@ class TestC3(unittest.TestCase):
         c3._merge = None
         self.assertEqual(c3.mro(), list(type(self).__mro__))
 
+    class Named:
+        def __init__(self, name, *bases):
+            self.__name__ = name
+            self.__bases__ = bases
+
+        def __repr__(self):  # pragma: no cover
+            return self.__name__
+
+    def test_fast_merge_matches_general_merge(self):
+        class Foo:
+            pass
+
+        class Bar(Foo):
+            pass
+
+        class Baz(Foo):
+            pass
+
+        class Qux(Bar, Baz, unittest.TestCase):
+            pass
+
+        c3 = self._makeOne(Qux)
+        fast = c3._fast_merge()
+        self.assertEqual(fast, list(Qux.__mro__))
+
+        c3 = self._makeOne(Qux)
+        c3._fast_merge = lambda: None
+        self.assertEqual(c3.mro(), fast)
+
+    def test_fast_merge_declines_inconsistent_order(self):
+        Foo = self.Named
+        root = Foo('root')
+        base = Foo('base', root)
+        derived = Foo('derived', base)
+        # Like saying class C(base, derived, base)
+        c3 = self._makeOne(Foo('C', base, derived))
+        self.assertIsNone(c3._fast_merge())
+
+    def test_fast_merge_declines_duplicate_bases(self):
+        Foo = self.Named
+        root = Foo('root')
+        base = Foo('base', root)
+        other = Foo('other', root)
+        C = Foo('C', base, other, base)
+        c3 = self._makeOne(C)
+        self.assertIsNone(c3._fast_merge())
+        self.assertEqual(c3.mro(), [C, base, other, root])
+
 
 class Test_ROComparison(unittest.TestCase):
 
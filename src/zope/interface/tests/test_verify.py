@@ -582,6 +582,292 @@ class Test_verifyClass(unittest.TestCase):
         with self.assertRaises(BrokenImplementation):
             self._callFUT(ISeveralMethods, SeveralMethods)
 
+    def test_repeated_verification_notices_changed_methods(self):
+        from zope.interface import Interface
+        from zope.interface import implementer
+        from zope.interface.exceptions import BrokenMethodImplementation
+
+        class ICurrent(Interface):
+
+            def method(a):
+                "A method"
+
+        @implementer(ICurrent)
+        class Current:
+
+            def method(self, a):
+                raise NotImplementedError()
+
+        self._callFUT(ICurrent, Current)
+        self._callFUT(ICurrent, Current)
+
+        # Replacing the method.
+        Current.method = lambda self: None
+        self.assertRaises(BrokenMethodImplementation,
+                          self._callFUT, ICurrent, Current)
+
+        # Changing the code of the same function.
+        def method(self, a):
+            raise NotImplementedError()
+        Current.method = method
+        self._callFUT(ICurrent, Current)
+        method.__code__ = (lambda self: None).__code__
+        self.assertRaises(BrokenMethodImplementation,
+                          self._callFUT, ICurrent, Current)
+
+        # Changing its defaults.
+        def method(self, a, b):
+            raise NotImplementedError()
+        Current.method = method
+        self.assertRaises(BrokenMethodImplementation,
+                          self._callFUT, ICurrent, Current)
+        method.__defaults__ = (1,)
+        self._callFUT(ICurrent, Current)
+
+    def test_repeated_verification_notices_changed_bases(self):
+        from zope.interface import Interface
+        from zope.interface import implementer
+        from zope.interface.exceptions import BrokenImplementation
+
+        class IBase(Interface):
+
+            def method():
+                "A method"
+
+        class ICurrent(Interface):
+            pass
+
+        @implementer(ICurrent)
+        class Current:
+            pass
+
+        self._callFUT(ICurrent, Current)
+        ICurrent.__bases__ = (IBase,)
+        self.assertRaises(BrokenImplementation,
+                          self._callFUT, ICurrent, Current)
+
+    def test_same_named_interfaces(self):
+        from zope.interface import Interface
+        from zope.interface import implementer
+        from zope.interface.exceptions import BrokenImplementation
+
+        def make_iface(with_method):
+            class ICurrent(Interface):
+                if with_method:
+                    def method():
+                        "A method"
+            return ICurrent
+
+        without_method = make_iface(False)
+        with_method = make_iface(True)
+        self.assertEqual(without_method, with_method)
+
+        @implementer(without_method, with_method)
+        class Current:
+            pass
+
+        self._callFUT(without_method, Current)
+        self.assertRaises(BrokenImplementation,
+                          self._callFUT, with_method, Current)
+
+    def test_verification_doesnt_keep_interfaces_alive(self):
+        import gc
+        import weakref
+
+        from zope.interface import Interface
+
+        class Current:
+
+            def method(self, a):
+                raise NotImplementedError()
+
+        def verify_transient():
+            class ITransient(Interface):
+
+                def method(a):
+                    "A method"
+
+            self._callFUT(ITransient, Current, tentative=True)
+            return weakref.ref(ITransient)
+
+        refs = [verify_transient() for _ in range(3)]
+        gc.collect()
+        self.assertEqual([ref() for ref in refs], [None, None, None])
+
+
+class Test_verifyClasses(unittest.TestCase):
+
+    def _callFUT(self, iface, candidates, **kwargs):
+        from zope.interface.verify import verifyClasses
+        return verifyClasses(iface, candidates, **kwargs)
+
+    def _makeOne(self):
+        from zope.interface import Interface
+        from zope.interface import implementer
+
+        class ICurrent(Interface):
+
+            def method(a):
+                "A method"
+
+        @implementer(ICurrent)
+        class Good:
+
+            def method(self, a):
+                raise NotImplementedError()
+
+        @implementer(ICurrent)
+        class AlsoGood:
+
+            def method(self, *args):
+                raise NotImplementedError()
+
+        class Bad:
+            pass
+
+        return ICurrent, Good, AlsoGood, Bad
+
+    def test_empty(self):
+        from zope.interface import Interface
+        self.assertTrue(self._callFUT(Interface, ()))
+
+    def test_all_good(self):
+        iface, good, also_good, _ = self._makeOne()
+        self.assertTrue(self._callFUT(iface, iter([good, also_good])))
+
+    def test_one_bad(self):
+        from zope.interface.exceptions import MultipleInvalid
+        iface, good, also_good, bad = self._makeOne()
+        with self.assertRaises(MultipleInvalid) as exc:
+            self._callFUT(iface, [good, bad, also_good])
+        # The error is the one verifyClass would raise.
+        self.assertIs(exc.exception.target, bad)
+
+    def test_one_bad_tentative(self):
+        from zope.interface.exceptions import BrokenImplementation
+        iface, good, _, bad = self._makeOne()
+        with self.assertRaises(BrokenImplementation) as exc:
+            self._callFUT(iface, [good, bad], tentative=True)
+        self.assertIs(exc.exception.target, bad)
+
+    def test_several_bad(self):
+        from zope.interface.exceptions import DoesNotImplement
+        from zope.interface.exceptions import MultipleInvalid
+        iface, good, _, bad = self._makeOne()
+
+        class AlsoBad:
+            pass
+
+        with self.assertRaises(MultipleInvalid) as exc:
+            self._callFUT(iface, [bad, good, AlsoBad])
+        ex = exc.exception
+        self.assertEqual(ex.target, (bad, good, AlsoBad))
+        self.assertEqual(len(ex.exceptions), 2)
+        self.assertIs(ex.exceptions[0].target, bad)
+        self.assertIs(ex.exceptions[1].target, AlsoBad)
+        self.assertIsInstance(ex.exceptions[0].exceptions[0], DoesNotImplement)
+
+
+class Test_verifyDeclarations(unittest.TestCase):
+
+    MODULE = 'zope.interface.tests.implementers'
+
+    def _callFUT(self, *args, **kwargs):
+        from zope.interface.verify import verifyDeclarations
+        return verifyDeclarations(*args, **kwargs)
+
+    def _summarize(self, report):
+        return [
+            (c['class'].rsplit('.', 1)[-1], len(c['interfaces']),
+             len(c['errors']))
+            for c in report['classes']
+        ]
+
+    def _check(self, report):
+        self.assertEqual(self._summarize(report), [
+            ('BadGreeter', 1, 1),
+            ('Greeter', 1, 0),
+            ('Inner', 2, 0),
+        ])
+        self.assertEqual(report['failures'], 1)
+        self.assertGreaterEqual(report['seconds'], 0)
+        bad = report['classes'][0]
+        self.assertEqual(bad['class'], self.MODULE + '.BadGreeter')
+        self.assertEqual(bad['interfaces'], [self.MODULE + '.IFarewell'])
+        self.assertIn("requires too many arguments", bad['errors'][0])
+        for c in report['classes']:
+            self.assertGreaterEqual(c['seconds'], 0)
+
+    def test_in_process(self):
+        from zope.interface.tests import implementers  # noqa: F401
+        self._check(self._callFUT([self.MODULE], processes=1))
+
+    def test_in_pool(self):
+        from zope.interface.tests import implementers  # noqa: F401
+        self._check(self._callFUT([self.MODULE], processes=2))
+
+    def test_in_pool_w_local_class(self):
+        from zope.interface import implementer
+        from zope.interface.tests import implementers
+
+        @implementer(implementers.IFarewell)
+        class Local:
+            __module__ = self.MODULE
+
+            def leave(self):
+                raise NotImplementedError()
+
+        report = self._callFUT([self.MODULE], processes=2)
+        self.assertIn(('Local', 1, 0), self._summarize(report))
+        self.assertEqual(report['failures'], 1)
+
+        # Let other tests forget it.
+        import gc
+        del Local
+        gc.collect()
+
+    def test_json(self):
+        import json
+
+        from zope.interface.tests import implementers  # noqa: F401
+        report = self._callFUT([self.MODULE], processes=1)
+        self.assertEqual(json.loads(json.dumps(report)), report)
+
+    def test_all_loaded_classes(self):
+        from zope.interface import adapter  # noqa: F401
+        from zope.interface.tests import implementers  # noqa: F401
+        report = self._callFUT(processes=1)
+        names = [c['class'] for c in report['classes']]
+        self.assertIn(self.MODULE + '.Greeter', names)
+        self.assertIn('zope.interface.adapter.AdapterRegistry', names)
+
+    def test_main(self):
+        import json
+        import os
+        import tempfile
+
+        from zope.interface.verify import main
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'report.json')
+            status = main(['-j', '1', '-o', path, 'zope.interface.tests'])
+            with open(path) as f:
+                report = json.load(f)
+        self.assertEqual(status, 1)
+        names = [c['class'] for c in report['classes']]
+        self.assertIn(self.MODULE + '.Greeter', names)
+
+    def test_main_to_stdout(self):
+        import io
+        import json
+        from contextlib import redirect_stdout
+
+        from zope.interface.verify import main
+        out = io.StringIO()
+        with redirect_stdout(out):
+            status = main(['-j', '1', 'zope.interface.tests.dummy'])
+        self.assertEqual(status, 0)
+        self.assertEqual(json.loads(out.getvalue())['classes'], [])
+
 
 class Test_verifyObject(Test_verifyClass):
 
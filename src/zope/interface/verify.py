@@ -15,6 +15,8 @@
 """
 import inspect
 import sys
+import time
+import weakref
 from types import FunctionType
 from types import MethodType
 
@@ -31,12 +33,25 @@ from zope.interface.interface import fromMethod
 __all__ = [
     'verifyObject',
     'verifyClass',
+    'verifyClasses',
+    'verifyDeclarations',
 ]
 
 # This will be monkey-patched when running under Zope 2, so leave this
 # here:
 MethodTypes = (MethodType, )
 
+# The outcome of comparing a method's signature to its description:
+# ``{function: {(imlevel, required signature): (code, defaults,
+# message)}}``. Repeated verifications of the same class find the same
+# functions, so they skip introspecting and comparing signatures. The
+# function's code and defaults are recorded because they can be
+# reassigned. The description is represented by just the parts of its
+# signature `_incompat` uses, so the cache doesn't keep descriptions
+# (or their interfaces) alive, and its size for each function is
+# bounded by the number of distinct signatures.
+_signature_checks = weakref.WeakKeyDictionary()
+
 
 def _verify(iface, candidate, tentative=False, vtype=None):
     """
@@ -134,16 +149,16 @@ def _verify_element(iface, name, desc, candidate, vtype):
             # Only unwrap this if we're verifying implementedBy;
             # otherwise we can unwrap @staticmethod on classes that directly
             # provide an interface.
-            meth = fromFunction(attr, iface, name=name, imlevel=1)
+            func, imlevel = attr, 1
         else:
             # Nope, just a normal function
-            meth = fromFunction(attr, iface, name=name)
+            func, imlevel = attr, 0
 
     elif (
         isinstance(attr, MethodTypes) and
         type(attr.__func__) is FunctionType
     ):
-        meth = fromMethod(attr, iface, name)
+        func, imlevel = attr.__func__, 1
 
     elif isinstance(attr, property) and vtype == 'c':
         # Without an instance we cannot be sure it's not a
@@ -165,13 +180,37 @@ def _verify_element(iface, name, desc, candidate, vtype):
         # we have to give it a pass.
         return
 
-    # Make sure that the required and implemented method signatures are
-    # the same.
-    mess = _incompat(desc.getSignatureInfo(), meth.getSignatureInfo())
+    mess = _check_signature(iface, name, desc, func, imlevel)
     if mess:
         raise BrokenMethodImplementation(desc, mess, attr, iface, candidate)
 
 
+def _check_signature(iface, name, desc, func, imlevel):
+    checks = _signature_checks.get(func)
+    if checks is None:
+        checks = _signature_checks[func] = {}
+    required = desc.getSignatureInfo()
+    key = (
+        imlevel,
+        len(required['positional']),
+        len(required['required']),
+        bool(required['varargs']),
+        bool(required['kwargs']),
+    )
+    code = func.__code__
+    defaults = func.__defaults__
+    check = checks.get(key)
+    if check is not None and check[0] is code and check[1] is defaults:
+        return check[2]
+
+    # Make sure that the required and implemented method signatures are
+    # the same.
+    meth = fromFunction(func, iface, name=name, imlevel=imlevel)
+    mess = _incompat(required, meth.getSignatureInfo())
+    checks[key] = (code, defaults, mess)
+    return mess
+
+
 def verifyClass(iface, candidate, tentative=False):
     """
     Verify that the *candidate* might correctly provide *iface*.
@@ -179,6 +218,33 @@ def verifyClass(iface, candidate, tentative=False):
     return _verify(iface, candidate, tentative, vtype='c')
 
 
+def verifyClasses(iface, candidates, tentative=False):
+    """
+    Verify that each of the *candidates* might correctly provide
+    *iface*, as with `verifyClass`.
+
+    All the candidates are checked. If only one fails, its error is
+    raised; if several do, a `zope.interface.exceptions.MultipleInvalid`
+    with *candidates* as its target collects their errors.
+
+    .. versionadded:: 8.5
+    """
+    candidates = tuple(candidates)
+    excs = []
+    for candidate in candidates:
+        try:
+            _verify(iface, candidate, tentative, vtype='c')
+        except Invalid as e:
+            excs.append(e)
+
+    if excs:
+        if len(excs) == 1:
+            raise excs[0]
+        raise MultipleInvalid(iface, candidates, excs)
+
+    return True
+
+
 def verifyObject(iface, candidate, tentative=False):
     return _verify(iface, candidate, tentative, vtype='o')
 
@@ -207,3 +273,233 @@ def _incompat(required, implemented):
 
     if required['varargs'] and not implemented['varargs']:
         return "implementation doesn't support variable arguments"
+
+
+def _declaring_classes(modules=None):
+    """
+    Return the loaded classes that declare (with `implementer` or
+    `classImplements`) the interfaces they implement, sorted by name.
+
+    If *modules* is given, only classes defined in those modules, or in
+    the packages they name, are included.
+    """
+    from zope.interface.declarations import Implements
+
+    prefixes = None
+    if modules is not None:
+        prefixes = tuple(modules)
+
+    found = []
+    seen = set()
+    todo = [object]
+    while todo:
+        cls = todo.pop()
+        # By identity, in case of metaclasses.
+        if id(cls) in seen:
+            continue
+        seen.add(id(cls))
+        try:
+            todo.extend(type.__subclasses__(cls))
+        except TypeError:  # pragma: no cover
+            pass
+        spec = cls.__dict__.get('__implemented__')
+        if not isinstance(spec, Implements) or spec.inherit is not cls:
+            continue
+        module = _class_module(cls)
+        if prefixes is not None and not any(
+            module == prefix or module.startswith(prefix + '.')
+            for prefix in prefixes
+        ):
+            continue
+        found.append(cls)
+    found.sort(key=_qualified_name)
+    return found
+
+
+def _class_module(cls):
+    # Not ``cls.__module__``, which can be a slot of its instances (as
+    # with InterfaceClass); then the class's own module is lost, but
+    # that of its methods will do.
+    module = type.__dict__['__module__'].__get__(cls, type)
+    if isinstance(module, str):
+        return module
+    for value in vars(cls).values():
+        if isinstance(value, FunctionType):
+            return value.__module__
+    return ''
+
+
+def _qualified_name(ob):
+    if isinstance(ob, type):
+        return f'{_class_module(ob)}.{ob.__qualname__}'
+    return f'{ob.__module__}.{ob.__name__}'
+
+
+def _resolve(module, qualname):
+    import importlib
+    ob = importlib.import_module(module)
+    for name in qualname.split('.'):
+        ob = getattr(ob, name)
+    return ob
+
+
+def _importable(cls):
+    try:
+        return _resolve(_class_module(cls), cls.__qualname__) is cls
+    except Exception:  # pylint:disable=broad-except
+        return False
+
+
+def _verify_declarations(cls, tentative=False):
+    from zope.interface.declarations import implementedBy
+
+    start = time.perf_counter()
+    ifaces = []
+    errors = []
+    for spec in implementedBy(cls).declared:
+        for iface in spec.interfaces():
+            ifaces.append(_qualified_name(iface))
+            try:
+                verifyClass(iface, cls, tentative)
+            except Invalid as e:
+                errors.append(str(e))
+    return {
+        'class': _qualified_name(cls),
+        'interfaces': ifaces,
+        'errors': errors,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _verify_declarations_by_name(task):
+    module, qualname, tentative = task
+    return _verify_declarations(_resolve(module, qualname), tentative)
+
+
+def verifyDeclarations(modules=None, processes=None, tentative=False):
+    """
+    Verify every interface that a loaded class declares it implements.
+
+    This finds the classes with an `implementer` (or `classImplements`)
+    declaration among all the classes that have been defined, limited
+    to the *modules* (names of modules or packages) if given, and checks
+    each interface in the declaration with `verifyClass`. Inherited
+    declarations are checked on the classes that made them.
+
+    The classes are divided among *processes* worker processes (by
+    default, one per CPU). Workers find a class by its module and
+    qualified name, importing the module if necessary, so classes that
+    can't be found that way, such as those defined in functions, are
+    verified in this process. Pass ``processes=1`` to do everything in
+    this process.
+
+    Returns a report that can be serialized as JSON: a dictionary whose
+    ``classes`` entry is a list of dictionaries, one per class, with
+    the ``class`` and ``interfaces`` names, a list of ``errors`` (empty
+    if the class passed) and the ``seconds`` taken to verify it. The
+    other entries are the number of classes with ``failures`` and the
+    total elapsed ``seconds``.
+
+    .. versionadded:: 8.5
+    """
+    start = time.perf_counter()
+    classes = _declaring_classes(modules)
+    if processes is None:
+        import os
+        processes = os.cpu_count() or 1
+
+    results = {}
+    local = classes
+    if processes > 1 and len(classes) > 1:
+        remote = [cls for cls in classes if _importable(cls)]
+        local = [cls for cls in classes if cls not in remote]
+    else:
+        remote = ()
+
+    if remote:
+        from concurrent.futures import ProcessPoolExecutor
+
+        tasks = [
+            (_class_module(cls), cls.__qualname__, tentative)
+            for cls in remote
+        ]
+        chunksize = max(1, len(tasks) // (processes * 4))
+        with ProcessPoolExecutor(min(processes, len(tasks))) as pool:
+            for cls, result in zip(
+                remote,
+                pool.map(_verify_declarations_by_name, tasks,
+                         chunksize=chunksize)
+            ):
+                results[cls] = result
+
+    for cls in local:
+        results[cls] = _verify_declarations(cls, tentative)
+
+    report = [results[cls] for cls in classes]
+    return {
+        'classes': report,
+        'failures': sum(1 for result in report if result['errors']),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _import_modules(names):
+    import importlib
+    import pkgutil
+
+    for name in names:
+        module = importlib.import_module(name)
+        path = getattr(module, '__path__', None)
+        if path is None:
+            continue
+        for info in pkgutil.walk_packages(path, name + '.'):
+            importlib.import_module(info.name)
+
+
+def main(argv=None):
+    """
+    Import the modules named on the command line, including all the
+    modules of packages, and run `verifyDeclarations` on them,
+    writing its report as JSON. Exits with a non-zero status if
+    any class fails.
+    """
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(
+        prog='python -m zope.interface.verify',
+        description=(
+            'Verify that the classes in the given modules and packages '
+            'implement the interfaces they declare.'
+        ),
+    )
+    parser.add_argument(
+        'modules', nargs='+', metavar='MODULE',
+        help='A module or package to import and check.')
+    parser.add_argument(
+        '-j', '--processes', type=int, default=None,
+        help='The number of worker processes (default: one per CPU).')
+    parser.add_argument(
+        '-o', '--output', default='-',
+        help='Where to write the JSON report (default: standard output).')
+    parser.add_argument(
+        '--tentative', action='store_true',
+        help="Don't require that the classes claim the interfaces.")
+    args = parser.parse_args(argv)
+
+    _import_modules(args.modules)
+    report = verifyDeclarations(args.modules, args.processes, args.tentative)
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 1 if report['failures'] else 0
+
+
+if __name__ == '__main__':
+    # Use the functions of the importable module, not ``__main__``, so
+    # worker processes can find them.
+    from zope.interface.verify import main as _main
+    sys.exit(_main())